@@ -0,0 +1,714 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Data Model
+#
+# Normalized tables built once per data refresh and shared by every page
+# =============================================================================
+
+import pandas as pd
+import pyarrow.compute as pc
+
+# Caldya roster and roles
+CALDYA_PLAYERS = {
+    "Nille": "Top",
+    "SPOOKY": "Jungle",
+    "Nafkelah": "Mid",
+    "Soldier": "ADC",
+    "Steeelback": "Support"
+}
+
+ROLES = ["Top", "Jungle", "Mid", "ADC", "Support"]
+
+# Role colors for better visual distinction
+ROLE_COLORS = {
+    "Top": "#e11d48",      # Red
+    "Jungle": "#10b981",   # Green
+    "Mid": "#3b82f6",      # Blue
+    "ADC": "#f59e0b",      # Orange
+    "Support": "#8b5cf6"   # Purple
+}
+
+_CALDYA_BY_UPPER = {name.upper(): name for name in CALDYA_PLAYERS}
+
+# Position labels found in game documents mapped onto dashboard roles
+POSITION_ROLES = {
+    "TOP": "Top",
+    "JUNGLE": "Jungle",
+    "JUNGLER": "Jungle",
+    "JGL": "Jungle",
+    "MID": "Mid",
+    "MIDDLE": "Mid",
+    "ADC": "ADC",
+    "BOT": "ADC",
+    "BOTTOM": "ADC",
+    "SUPPORT": "Support",
+    "SUP": "Support",
+    "UTILITY": "Support"
+}
+
+SUMMARY_COLUMNS = ["id", "date", "opponent", "result", "side", "duration", "duration_s", "win"]
+
+GAME_COLUMNS = SUMMARY_COLUMNS + [
+    "dragons", "barons", "enemy_dragons", "enemy_barons",
+    "first_dragon", "first_baron", "first_herald"
+]
+
+PARTICIPANT_COLUMNS = [
+    "game_id", "date", "opponent", "side", "win", "duration_s",
+    "team_id", "ally", "player", "caldya_player", "role", "position", "champion",
+    "in_items", "in_stats", "kda", "kills", "deaths", "assists",
+    "gold_15min", "cs_15min", "gold_diff_15min", "cs_diff_15min"
+]
+
+
+def caldya_player_name(player):
+    """Return the roster spelling of a Caldya player name, or None"""
+    return _CALDYA_BY_UPPER.get(str(player).upper())
+
+
+def canonical_role(player, position):
+    """Roster role for Caldya players, normalized position label for everyone else"""
+    roster_name = caldya_player_name(player)
+    if roster_name:
+        return CALDYA_PLAYERS[roster_name]
+    if not position:
+        return ""
+    return POSITION_ROLES.get(str(position).upper(), str(position))
+
+
+def parse_kda(kda):
+    """Split a "K/D/A" string into integers, (0, 0, 0) when unparsable"""
+    try:
+        kills, deaths, assists = (int(float(part)) for part in str(kda).split("/"))
+        return kills, deaths, assists
+    except (TypeError, ValueError):
+        return 0, 0, 0
+
+
+def duration_seconds(duration):
+    """Convert a "mm:ss" (or "h:mm:ss") game duration into seconds"""
+    seconds = 0
+    try:
+        for part in str(duration).split(":"):
+            seconds = seconds * 60 + int(part)
+    except ValueError:
+        return 0
+    return seconds
+
+
+def game_champion_fields(game):
+    """Allied and enemy champion arrays stored on game documents for indexed filtering"""
+    caldya_team_id = game.get("Caldya_id")
+    allied, enemy = set(), set()
+    for player, item_data in (game.get("final_items") or {}).items():
+        champion = item_data.get("champion", "")
+        if not champion:
+            continue
+        if item_data.get("team_id") != caldya_team_id:
+            enemy.add(champion)
+        elif caldya_player_name(player):
+            allied.add(champion)
+    return {"allied_champions": sorted(allied), "enemy_champions": sorted(enemy)}
+
+
+def game_key(game):
+    """Stable identifier for an official game, used to make imports idempotent
+
+    An explicit game_id wins; otherwise the game is identified by its date,
+    opponent, side, duration and the ten champions picked.
+    """
+    if game.get("game_id"):
+        return str(game["game_id"])
+    champions = sorted(str(item.get("champion", "")) for item in (game.get("final_items") or {}).values())
+    return "|".join([
+        str(game.get("date", "")),
+        str((game.get("opponent_team") or {}).get("name", "")),
+        str(game.get("Caldya_side", "")).lower(),
+        str(game.get("game_duration", "")),
+        ",".join(champions)
+    ])
+
+
+def _side_objectives(game, side):
+    objectives = game.get("objectives") or {}
+    team = objectives.get(f"{side}_team") or {}
+    return team.get("objectives") or {}
+
+
+def _summary_row(game):
+    side = (game.get("Caldya_side") or "").upper()
+    win = bool(game.get("win"))
+    duration = game.get("game_duration", "0:00")
+    return {
+        "id": str(game.get("_id")),
+        "date": game.get("date"),
+        "opponent": (game.get("opponent_team") or {}).get("name", "Unknown"),
+        "result": "WIN" if win else "LOSS",
+        "side": side,
+        "duration": duration,
+        "duration_s": duration_seconds(duration),
+        "win": win
+    }
+
+
+def build_game_summaries(games):
+    """One row per official game with the columns the list and filter views read"""
+    return pd.DataFrame([_summary_row(game) for game in games], columns=SUMMARY_COLUMNS)
+
+
+def build_game_table(games):
+    """Game summaries plus the objective columns Team Stats reads"""
+    rows = []
+    for game in games:
+        side = (game.get("Caldya_side") or "").lower()
+        caldya_objectives = _side_objectives(game, side) if side in ("blue", "red") else {}
+        enemy_objectives = _side_objectives(game, "red" if side == "blue" else "blue") if side in ("blue", "red") else {}
+
+        rows.append({
+            **_summary_row(game),
+            "dragons": caldya_objectives.get("dragon", {}).get("kills", 0),
+            "barons": caldya_objectives.get("baron", {}).get("kills", 0),
+            "enemy_dragons": enemy_objectives.get("dragon", {}).get("kills", 0),
+            "enemy_barons": enemy_objectives.get("baron", {}).get("kills", 0),
+            "first_dragon": bool(caldya_objectives.get("dragon", {}).get("first", False)),
+            "first_baron": bool(caldya_objectives.get("baron", {}).get("first", False)),
+            "first_herald": bool(caldya_objectives.get("riftHerald", {}).get("first", False))
+        })
+
+    return pd.DataFrame(rows, columns=GAME_COLUMNS)
+
+
+# Counters kept per side by side_records() and the CLA_Summary_Team collection
+TEAM_COUNTERS = [
+    "games", "wins", "dragons", "barons",
+    "first_dragon_games", "first_dragon_wins", "first_baron_games", "first_baron_wins",
+    "first_herald_games", "first_herald_wins"
+]
+
+
+def side_records(games_table):
+    """Per-side records and objective counters, one dict per side"""
+    records = []
+    for side, side_games in games_table.groupby("side", sort=False):
+        won = side_games["win"]
+        record = {
+            "_id": side,
+            "games": len(side_games),
+            "wins": int(won.sum()),
+            "dragons": int(side_games["dragons"].sum()),
+            "barons": int(side_games["barons"].sum())
+        }
+        for objective in ("first_dragon", "first_baron", "first_herald"):
+            record[f"{objective}_games"] = int(side_games[objective].sum())
+            record[f"{objective}_wins"] = int((side_games[objective] & won).sum())
+        records.append(record)
+    return records
+
+
+def team_summary(records):
+    """Overall counters plus the per-side records, from side_records() or the summary collection"""
+    summary = {counter: sum(int(record.get(counter, 0)) for record in records) for counter in TEAM_COUNTERS}
+    summary["sides"] = {record["_id"]: record for record in records}
+    return summary
+
+
+def _record(games, wins):
+    return {
+        "games": games,
+        "wins": wins,
+        "losses": games - wins,
+        "win_rate": (wins / games * 100) if games > 0 else 0
+    }
+
+
+def officials_summary(team):
+    """Overall and per-side records plus objective averages from team_summary()"""
+    summary = _record(team["games"], team["wins"])
+    for side in ("BLUE", "RED"):
+        side_record = team["sides"].get(side, {})
+        summary[side.lower()] = _record(side_record.get("games", 0), side_record.get("wins", 0))
+    summary["dragons_per_game"] = team["dragons"] / team["games"] if team["games"] > 0 else 0
+    summary["barons_per_game"] = team["barons"] / team["games"] if team["games"] > 0 else 0
+    return summary
+
+
+# Objectives shown by Team Stats, in display order
+OBJECTIVES = [("First Dragon", "first_dragon"), ("First Herald", "first_herald"), ("First Baron", "first_baron")]
+
+
+def objective_rates(team):
+    """Win rate and games for each first objective taken, from team_summary()"""
+    rates, games = [], []
+    for _, key in OBJECTIVES:
+        taken = team[f"{key}_games"]
+        rates.append((team[f"{key}_wins"] / taken * 100) if taken > 0 else 0)
+        games.append(taken)
+    return pd.DataFrame({
+        "Objective": [label for label, _ in OBJECTIVES],
+        "Win Rate": rates,
+        "Total Games": games
+    })
+
+
+def game_objective_counts(game):
+    """Caldya and enemy dragon/baron kills for the game detail view"""
+    objectives = game.get("objectives", {})
+    caldya_side = "blue_team" if game.get("Caldya_side") == "blue" else "red_team"
+    enemy_side = "red_team" if game.get("Caldya_side") == "blue" else "blue_team"
+    caldya = objectives.get(caldya_side, {}).get("objectives", {})
+    enemy = objectives.get(enemy_side, {}).get("objectives", {})
+    return {
+        "dragons": (caldya.get("dragon", {}).get("kills", 0), enemy.get("dragon", {}).get("kills", 0)),
+        "barons": (caldya.get("baron", {}).get("kills", 0), enemy.get("baron", {}).get("kills", 0))
+    }
+
+
+def game_scoreboard(game):
+    """(player, final items, KDA) per player, split into Caldya and opponent lists"""
+    caldya, opponents = [], []
+    for player, item_data in game["final_items"].items():
+        kda = game["player_data"].get(player, {}).get("kda", "0/0/0")
+        if item_data.get("team_id") == game.get("Caldya_id"):
+            caldya.append((player, item_data, kda))
+        else:
+            opponents.append((player, item_data, kda))
+    return caldya, opponents
+
+
+def displayed_items(item_data):
+    """Up to six item ids to show and the trinket (0 when none)
+
+    The trinket is sometimes repeated as the last item; it is then shown once.
+    """
+    trinket_id = item_data.get("trinket", 0)
+    player_items = item_data.get("items", [])
+    if player_items and trinket_id > 0 and player_items[-1] == trinket_id:
+        player_items = player_items[:-1]
+    return [item_id for i, item_id in enumerate(player_items) if i < 6 and item_id > 0], trinket_id
+
+
+def scoreboard_view(game):
+    """Caldya and opponent scoreboard rows: player, champion, KDA, items and trinket"""
+    return tuple(
+        [
+            {"player": player, "champion": item_data.get("champion"), "kda": kda,
+             "items": items, "trinket": trinket_id}
+            for player, item_data, kda in side
+            for items, trinket_id in [displayed_items(item_data)]
+        ]
+        for side in game_scoreboard(game)
+    )
+
+
+def game_performance(game):
+    """Caldya and opponent @15 stat tables for the game detail view"""
+    caldya, opponents = [], []
+    for player, stats in game["player_data"].items():
+        row = {
+            "Player": player,
+            "KDA": stats.get("kda", "0/0/0"),
+            "Gold@15": stats.get("gold_15min", 0),
+            "CS@15": stats.get("cs_15min", 0),
+            "Gold Diff@15": stats.get("gold_diff_15min", 0),
+            "CS Diff@15": stats.get("cs_diff_15min", 0)
+        }
+        (caldya if caldya_player_name(player) else opponents).append(row)
+    return pd.DataFrame(caldya), pd.DataFrame(opponents)
+
+
+def build_participant_facts(games):
+    """One row per game x participant, merging final_items, player_data and player_positions"""
+    rows = []
+    for game in games:
+        game_id = str(game.get("_id"))
+        caldya_team_id = game.get("Caldya_id")
+        final_items = game.get("final_items") or {}
+        player_data = game.get("player_data") or {}
+        positions = game.get("player_positions") or {}
+        base = {
+            "game_id": game_id,
+            "date": game.get("date"),
+            "opponent": (game.get("opponent_team") or {}).get("name", "Unknown"),
+            "side": (game.get("Caldya_side") or "").upper(),
+            "win": bool(game.get("win", False)),
+            "duration_s": duration_seconds(game.get("game_duration", "0:00"))
+        }
+
+        participants = list(final_items) + [p for p in player_data if p not in final_items]
+        for player in participants:
+            item_data = final_items.get(player)
+            stats = player_data.get(player) or {}
+            team_id = item_data.get("team_id") if item_data is not None else None
+            kda = stats.get("kda", "0/0/0")
+            kills, deaths, assists = parse_kda(kda)
+            position = positions.get(player, "")
+
+            rows.append({
+                **base,
+                "team_id": team_id,
+                "ally": item_data is not None and team_id == caldya_team_id,
+                "player": player,
+                "caldya_player": caldya_player_name(player),
+                "role": canonical_role(player, position),
+                "position": position,
+                "champion": item_data.get("champion") if item_data is not None else None,
+                "in_items": item_data is not None,
+                "in_stats": player in player_data,
+                "kda": kda,
+                "kills": kills,
+                "deaths": deaths,
+                "assists": assists,
+                "gold_15min": stats.get("gold_15min", 0),
+                "cs_15min": stats.get("cs_15min", 0),
+                "gold_diff_15min": stats.get("gold_diff_15min", 0),
+                "cs_diff_15min": stats.get("cs_diff_15min", 0)
+            })
+
+    return pd.DataFrame(rows, columns=PARTICIPANT_COLUMNS)
+
+
+def player_profiles(players):
+    """One row of averages per CLA_Players document"""
+    rows = []
+    for player in players:
+        averages = player.get("avg_player_data", {})
+        challenges = player.get("avg_challenges", {})
+        rows.append({
+            "name": player.get("name", "Unknown"),
+            "games_played": player.get("games_played", 0),
+            "avg_gold_15min": averages.get("gold_15min", 0),
+            "avg_cs_15min": averages.get("cs_15min", 0),
+            "avg_gold_diff_15min": averages.get("gold_diff_15min", 0),
+            "avg_cs_diff_15min": averages.get("cs_diff_15min", 0),
+            "kda_kills": averages.get("kda_kills", 0),
+            "kda_deaths": averages.get("kda_deaths", 0),
+            "kda_assists": averages.get("kda_assists", 0),
+            "kda_ratio": averages.get("kda_ratio", 0),
+            "avg_kda": averages.get("kda", "0/0/0"),
+            "avg_control_wards": player.get("avg_control_wards", 0),
+            "avg_vision_score": challenges.get("vision_score", 0),
+            "avg_damage_per_minute": challenges.get("damage_per_minute", 0)
+        })
+    return pd.DataFrame(rows)
+
+
+def player_challenges(players, name):
+    """avg_challenges of the named player, {} when unknown"""
+    for player in players:
+        if player.get("name") == name:
+            return player.get("avg_challenges", {})
+    return {}
+
+
+HISTORY_COLUMNS = [
+    "game_id", "date", "opponent", "win", "kda", "gold_15min", "cs_15min",
+    "gold_diff_15min", "cs_diff_15min", "position"
+]
+
+
+def player_history(facts, player):
+    """A player's official games, most recent first"""
+    history = facts[(facts["player"] == player) & facts["in_stats"]]
+    return history[HISTORY_COLUMNS].sort_values("date", ascending=False)
+
+
+def allied_picks(facts):
+    """Champion picks by Caldya roster players on the Caldya team"""
+    picks = facts[facts["in_items"] & facts["ally"] & facts["caldya_player"].notna()]
+    return picks.assign(champion=picks["champion"].fillna("Unknown"))
+
+
+def enemy_picks(facts):
+    """Champion picks by the opposing team"""
+    picks = facts[facts["in_items"] & ~facts["ally"]]
+    return picks.assign(champion=picks["champion"].fillna("Unknown"))
+
+
+def champion_stats(picks, wins):
+    """Per-champion records sorted by games played, then win rate"""
+    if picks.empty:
+        return []
+
+    grouped = (
+        picks.assign(_won=wins.loc[picks.index].astype(int))
+        .groupby("champion", sort=False)["_won"]
+        .agg(games="size", wins="sum")
+    )
+
+    stats = [_champion_record(champion, row["games"], row["wins"]) for champion, row in grouped.iterrows()]
+    stats.sort(key=lambda x: (x["games"], x["win_rate"]), reverse=True)
+    return stats
+
+
+def _champion_record(champion, games, wins):
+    games, wins = int(games), int(wins)
+    return {
+        "champion": champion,
+        "games": games,
+        "wins": wins,
+        "losses": games - wins,
+        "win_rate": wins / games * 100
+    }
+
+
+def champion_pools(facts):
+    """Caldya champion records by role and opponent champion records"""
+    caldya_picks = allied_picks(facts)
+    role_pools = {
+        role: champion_stats(role_picks, role_picks["win"])
+        for role, role_picks in caldya_picks.groupby("role", sort=False)
+    }
+    opponent_picks = enemy_picks(facts)
+    return role_pools, champion_stats(opponent_picks, ~opponent_picks["win"])
+
+
+def champion_pools_from_groups(groups):
+    """Same shape as champion_pools() from store.aggregate_champion_pools() output"""
+    role_pools = {}
+    opponent_pool = []
+    for group in groups:
+        record = _champion_record(group["_id"]["champion"], group["games"], group["wins"])
+        role = group["_id"]["role"]
+        if role is None:
+            opponent_pool.append(record)
+        else:
+            role_pools.setdefault(role, []).append(record)
+
+    # Server-side groups come back unordered; break ties by name
+    def sort_key(record):
+        return -record["games"], -record["win_rate"], record["champion"]
+
+    for pool in role_pools.values():
+        pool.sort(key=sort_key)
+    opponent_pool.sort(key=sort_key)
+    return role_pools, opponent_pool
+
+
+class FilterIndex:
+    """Inverted index from (field, value) to a bitmap of row positions
+
+    Bitmaps are Python ints, so any combination of filters resolves with
+    bitwise ANDs instead of re-scanning the rows.
+    """
+
+    def __init__(self, size, bitmaps):
+        self.size = size
+        self.bitmaps = bitmaps
+        self.all_rows = (1 << size) - 1
+
+    @classmethod
+    def build(cls, rows, fields):
+        """Index rows; fields maps a field name to a function returning the row's values for it"""
+        positions = {}
+        for position, row in enumerate(rows):
+            for field, values_of in fields.items():
+                for value in values_of(row):
+                    positions.setdefault((field, value), set()).add(position)
+
+        bitmaps = {}
+        for key, rows_with_value in positions.items():
+            bits = bytearray((len(rows) + 7) // 8)
+            for position in rows_with_value:
+                bits[position >> 3] |= 1 << (position & 7)
+            bitmaps[key] = int.from_bytes(bits, "little")
+        return cls(len(rows), bitmaps)
+
+    def values(self, field):
+        """Sorted values indexed for a field"""
+        return sorted(value for indexed_field, value in self.bitmaps if indexed_field == field)
+
+    def match(self, **filters):
+        """Bitmap of the rows matching every filter; "All" leaves a field unfiltered"""
+        bits = self.all_rows
+        for field, value in filters.items():
+            if value != "All":
+                bits &= self.bitmaps.get((field, value), 0)
+        return bits
+
+    @staticmethod
+    def positions(bits):
+        """Row positions set in a bitmap, in ascending order"""
+        return [position for position, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+
+
+SCRIM_NAME_PREFIXES = ["VLT ", "CLA "]
+
+
+def clean_scrim_name(riot_name):
+    """Strip the team tag from a scrim RIOT_ID_GAME_NAME"""
+    for prefix in SCRIM_NAME_PREFIXES:
+        if riot_name.startswith(prefix):
+            return riot_name[len(prefix):]
+    return riot_name
+
+
+SCRIM_COLUMNS = ["scrim", "our_team_id", "has_team", "won", "result", "complete", "our_side", "enemy_side"]
+
+SCRIM_PARTICIPANT_COLUMNS = ["scrim", "player", "full_name", "champion", "role", "roster", "ours", "win"]
+
+
+def parse_scrims(scrims):
+    """Parse scrim documents once into a per-scrim table and a participants table"""
+    scrim_rows = []
+    participant_rows = []
+    for scrim_index, scrim in enumerate(scrims):
+        parsed = []
+        found = False
+        our_team_id = None
+        for participant in scrim.get("participants", []):
+            riot_name = participant.get("RIOT_ID_GAME_NAME", "")
+            player = clean_scrim_name(riot_name)
+            roster = player in CALDYA_PLAYERS
+            team_id = participant.get("TEAM")
+            # Our team is the one of the first roster player listed
+            if roster and not found:
+                found = True
+                our_team_id = team_id
+            parsed.append((player, riot_name, participant.get("SKIN"), participant.get("WIN", ""), team_id, roster))
+
+        won = False
+        result = None
+        our_count = 0
+        for player, riot_name, champion, win_status, team_id, roster in parsed:
+            ours = team_id == our_team_id
+            if ours:
+                our_count += 1
+                if win_status == "Win":
+                    result = "WIN"
+                    won = won or roster
+                elif win_status == "Fail":
+                    result = "LOSS"
+            participant_rows.append({
+                "scrim": scrim_index,
+                "player": player,
+                "full_name": riot_name,
+                "champion": champion,
+                "role": CALDYA_PLAYERS.get(player, "Unknown"),
+                "roster": roster,
+                "ours": ours,
+                "win": win_status
+            })
+
+        # Assuming team 100 is blue, 200 is red
+        scrim_rows.append({
+            "scrim": scrim_index,
+            "our_team_id": our_team_id,
+            "has_team": bool(our_team_id),
+            "won": won,
+            "result": result,
+            "complete": our_team_id is not None and our_count == 5 and len(parsed) - our_count == 5,
+            "our_side": "BLUE" if our_team_id == 100 else "RED",
+            "enemy_side": "RED" if our_team_id == 100 else "BLUE"
+        })
+
+    return (
+        pd.DataFrame(scrim_rows, columns=SCRIM_COLUMNS),
+        pd.DataFrame(participant_rows, columns=SCRIM_PARTICIPANT_COLUMNS)
+    )
+
+
+def parse_scrims_from_arrow(table):
+    """parse_scrims() from a store.find_arrow() table of the draft view
+
+    Participants are flattened in Arrow and the per-scrim fields computed
+    column-wise, without building a dict per participant.
+    """
+    participants = table.column("participants").combine_chunks()
+    flat = pc.list_flatten(participants)
+    frame = pd.DataFrame({
+        "scrim": pc.list_parent_indices(participants).to_numpy(zero_copy_only=False),
+        "full_name": flat.field("RIOT_ID_GAME_NAME").to_pandas().fillna(""),
+        "champion": flat.field("SKIN").to_pandas(),
+        "win": flat.field("WIN").to_pandas().fillna(""),
+        "team": flat.field("TEAM").to_pandas()
+    })
+    frame["player"] = frame["full_name"].map({name: clean_scrim_name(name) for name in frame["full_name"].unique()})
+    frame["roster"] = frame["player"].isin(list(CALDYA_PLAYERS))
+    frame["role"] = frame["player"].map(lambda player: CALDYA_PLAYERS.get(player, "Unknown"))
+
+    # Our team is the one of the first roster player listed
+    scrims = pd.RangeIndex(table.num_rows, name="scrim")
+    our_team = frame[frame["roster"]].drop_duplicates("scrim").set_index("scrim")["team"].reindex(scrims)
+    row_team = frame["scrim"].map(our_team)
+    frame["ours"] = (frame["team"] == row_team) | (frame["team"].isna() & row_team.isna())
+
+    ours = frame[frame["ours"]]
+    our_count = ours.groupby("scrim").size().reindex(scrims, fill_value=0)
+    total = frame.groupby("scrim").size().reindex(scrims, fill_value=0)
+    won = ours[(ours["win"] == "Win") & ours["roster"]].groupby("scrim").size().reindex(scrims, fill_value=0) > 0
+    decided = ours[ours["win"].isin(["Win", "Fail"])].drop_duplicates("scrim", keep="last").set_index("scrim")["win"]
+    result = decided.map({"Win": "WIN", "Fail": "LOSS"}).reindex(scrims)
+
+    # Assuming team 100 is blue, 200 is red
+    blue = our_team == 100
+    scrim_table = pd.DataFrame({
+        "scrim": scrims,
+        "our_team_id": our_team if our_team.isna().any() else our_team.astype("int64"),
+        "has_team": our_team.fillna(0) != 0,
+        "won": won,
+        "result": result,
+        "complete": our_team.notna() & (our_count == 5) & (total - our_count == 5),
+        "our_side": blue.map({True: "BLUE", False: "RED"}),
+        "enemy_side": blue.map({True: "RED", False: "BLUE"})
+    }, columns=SCRIM_COLUMNS).reset_index(drop=True)
+    return scrim_table, frame[SCRIM_PARTICIPANT_COLUMNS].reset_index(drop=True)
+
+
+def scrim_champion_pools(scrim_participants):
+    """Champion records per role for roster players on our side"""
+    picks = scrim_participants[scrim_participants["roster"] & scrim_participants["ours"]]
+    picks = picks.assign(champion=picks["champion"].fillna(""))
+    return {
+        role: champion_stats(role_picks, role_picks["win"] == "Win")
+        for role, role_picks in picks.groupby("role", sort=False)
+    }
+
+
+def scrim_record(scrim_table):
+    """Total scrims, wins and games where our team was identified"""
+    played = scrim_table[scrim_table["has_team"]]
+    return len(scrim_table), int(played["won"].sum()), len(played)
+
+
+def scrim_record_from_summary(records):
+    """Same tuple as scrim_record() from the CLA_Summary_Scrims document"""
+    record = records[0] if records else {}
+    return int(record.get("scrims", 0)), int(record.get("wins", 0)), int(record.get("games", 0))
+
+
+def scrim_browser_rows(scrim_table, scrim_participants):
+    """Game Browser rows for scrims where both full teams are known"""
+    complete = scrim_table[scrim_table["complete"]]
+    drafts = scrim_participants[scrim_participants["scrim"].isin(complete["scrim"])]
+    drafts = drafts.assign(champion=drafts["champion"].fillna("Unknown"))
+
+    teams = {}
+    for pick in drafts[["scrim", "ours", "player", "champion", "full_name"]].to_dict("records"):
+        team = "our_team" if pick.pop("ours") else "enemy_team"
+        teams.setdefault(pick.pop("scrim"), {"our_team": [], "enemy_team": []})[team].append(pick)
+
+    return [
+        {
+            "index": game["scrim"],
+            **teams[game["scrim"]],
+            "result": game["result"],
+            "our_side": game["our_side"],
+            "enemy_side": game["enemy_side"]
+        }
+        for game in complete.to_dict("records")
+    ]
+
+
+def build_scrim_filter_index(scrim_games):
+    """Bitmap index over the Game Browser filters"""
+    return FilterIndex.build(scrim_games, {
+        "result": lambda game: [game["result"]],
+        "our_side": lambda game: [game["our_side"]],
+        "our_champion": lambda game: {p["champion"] for p in game["our_team"]},
+        "enemy_champion": lambda game: {p["champion"] for p in game["enemy_team"]}
+    })
+
+
+def filter_scrim_browser(scrim_games, filter_index, **filters):
+    """Game Browser rows matching the filters, most recent first"""
+    positions = filter_index.positions(filter_index.match(**filters))
+    return [scrim_games[position] for position in reversed(positions)]
@@ -6,8 +6,7 @@
 
 import streamlit as st
 import pandas as pd
-import pymongo
-import requests
+from pymongo.errors import PyMongoError
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -16,7 +15,27 @@ import base64
 import json
 from datetime import datetime, timedelta
 import time
-from difflib import SequenceMatcher
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from ddragon import DataDragonMirror
+from tablecache import TableCache
+from tracing import start_trace, finish_trace, span, traced
+from store import (
+    UPDATED_FIELDS, SUMMARY_STATE, create_client, check_connection, CollectionSnapshot, get_projection,
+    find_by_id, find_arrow, on_primary, data_version, aggregate_champion_pools, ensure_game_indexes,
+    officials_query, find_game_summaries, officials_filter_options, read_summary
+)
+from analytics import (
+    CALDYA_PLAYERS, ROLES, ROLE_COLORS, build_game_summaries, build_game_table, build_participant_facts,
+    side_records, team_summary, officials_summary, objective_rates,
+    game_objective_counts, scoreboard_view, game_performance,
+    player_profiles, player_challenges, player_history,
+    champion_pools, champion_pools_from_groups,
+    parse_scrims, parse_scrims_from_arrow, scrim_champion_pools, scrim_record, scrim_record_from_summary,
+    scrim_browser_rows, build_scrim_filter_index, filter_scrim_browser
+)
 
 # Page configuration
 st.set_page_config(
@@ -37,7 +56,10 @@ def check_password():
         return True
     
     def password_entered():
-        if st.session_state["password"] == st.secrets["auth"]["password"]:
+        # An optional admin password also unlocks the performance panel
+        admin_password = st.secrets["auth"].get("admin_password")
+        st.session_state["admin"] = bool(admin_password) and st.session_state["password"] == admin_password
+        if st.session_state["password"] == st.secrets["auth"]["password"] or st.session_state["admin"]:
             st.session_state["authenticated"] = True
             del st.session_state["password"]
         else:
@@ -203,6 +225,10 @@ def check_password():
 if not check_password():
     st.stop()
 
+# Timing spans for this rerun
+trace = start_trace()
+trace.section("styles")
+
 # Professional CSS Framework - COMPLETE WITH ALL ORIGINAL STYLING
 st.markdown("""
 <style>
@@ -573,6 +599,12 @@ st.markdown("""
         border-color: rgba(255, 255, 255, 0.12);
     }
     
+    .scoreboard {
+        display: grid;
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+        gap: 1.5rem;
+    }
+    
     .champion-section {
         display: flex;
         flex-direction: column;
@@ -711,72 +743,258 @@ def styled_metric(label, value, delta=None, delta_color="normal"):
     html += "</div>"
     return st.markdown(html, unsafe_allow_html=True)
 
-# Connect to MongoDB Atlas - EXACTLY AS ORIGINAL
-@st.cache_resource
+# Sidebar panel listing the spans of a rerun
+def render_trace_panel(trace):
+    with st.sidebar.expander("⏱️ Performance", expanded=False):
+        st.markdown(f"**Rerun:** {trace.total * 1000:.0f} ms")
+        by_category = sorted(trace.self_time_by_category().items(), key=lambda item: -item[1])
+        st.caption(" • ".join(f"{category}: {seconds * 1000:.0f} ms" for category, seconds in by_category))
+        st.dataframe(
+            pd.DataFrame([{
+                "Span": "\u2003" * span_data["depth"] + span_data["name"],
+                "Category": span_data["category"],
+                "ms": (span_data["duration"] or 0) * 1000
+            } for span_data in trace.spans]),
+            column_config={"ms": st.column_config.NumberColumn("ms", format="%.1f")},
+            hide_index=True,
+            use_container_width=True
+        )
+
+# Connect to MongoDB Atlas with the pool, compression, timeout and read
+# preference settings of the [database] secrets (see store.CLIENT_OPTIONS)
+@traced()
+@st.cache_resource(show_spinner=False)
 def get_db():
-    connection_string = st.secrets["database"]["mongodb_connection_string"]
-    client = pymongo.MongoClient(connection_string)
+    settings = st.secrets["database"]
+    client = create_client(settings["mongodb_connection_string"], settings)
+    check_connection(client)
     return client.CALDYA
 
-# Get champion data - EXACTLY AS ORIGINAL
-@st.cache_data(ttl=3600)
+# Local Data Dragon mirror, one per process
+@traced()
+@st.cache_resource(show_spinner=False)
+def get_ddragon_mirror():
+    settings = st.secrets.get("ddragon", {})
+    return DataDragonMirror(
+        cache_dir=settings.get("cache_dir", ".ddragon_cache"),
+        offline=settings.get("offline", False)
+    )
+
+# Parquet copies of the normalized tables, one per process
+@st.cache_resource(show_spinner=False)
+def get_table_cache():
+    settings = st.secrets.get("cache", {})
+    return TableCache(cache_dir=settings.get("table_dir", ".table_cache"))
+
+# Get champion data
+@traced()
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_champion_data():
-    versions = requests.get("https://ddragon.leagueoflegends.com/api/versions.json").json()
-    latest = versions[0]
-    champs = requests.get(f"https://ddragon.leagueoflegends.com/cdn/{latest}/data/en_US/champion.json").json()
-    
-    champ_mapping = {}
-    for key, data in champs["data"].items():
-        champ_name = data["name"]
-        champ_mapping[champ_name.lower()] = key
-        champ_mapping[champ_name.lower().replace(" ", "")] = key
-        champ_mapping[champ_name.lower().replace("'", "")] = key
-        champ_mapping[champ_name.lower().replace(" ", "").replace("'", "")] = key
-        
-        if champ_name == "Wukong":
-            champ_mapping["monkeyking"] = key
-        elif champ_name == "Nunu & Willump":
-            champ_mapping["nunu"] = key
-        
-    return champs["data"], latest, champ_mapping
+    return get_ddragon_mirror().load()
+
+# In-memory collection snapshots, synced incrementally on each reload
+@st.cache_resource(show_spinner=False)
+def get_snapshot(collection_name, view=None, sort=None):
+    db = get_db()
+    return CollectionSnapshot(
+        db[collection_name], projection=get_projection(collection_name, view), sort=sort,
+        updated_field=UPDATED_FIELDS.get(collection_name)
+    )
+
+# Data version of a collection, probed at most every few seconds
+@traced()
+@st.cache_data(ttl=st.secrets.get("cache", {}).get("version_probe_seconds", 5), show_spinner=False)
+def get_data_version(collection_name):
+    db = get_db()
+    return data_version(db[collection_name], UPDATED_FIELDS.get(collection_name))
+
+# Cache a loader until the collections it reads change. The wrapped function
+# takes a `version` keyword that only serves as part of the cache key. No
+# spinner: loaders may run on the load executor (see PageData.prefetch).
+# shared=True hands every rerun the same object (st.cache_resource) instead
+# of unpickling a copy, for large results that callers only read.
+def versioned(*collection_names, max_entries=None, shared=False):
+    def decorator(function):
+        cache = st.cache_resource if shared else st.cache_data
+        cached = cache(max_entries=max_entries, show_spinner=False)(function)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            version = tuple(get_data_version(name) for name in collection_names)
+            return cached(*args, version=version, **kwargs)
 
-# Helper function to find champion key - EXACTLY AS ORIGINAL
-def find_champion_key(champion_name, champion_data, champ_mapping):
-    if not champion_name:
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+# Full-history scrim loads decoded straight into Arrow columns (needs
+# pymongoarrow), falling back to the dict snapshots. Games stay on dicts:
+# their per-player fields are keyed by player name and have no fixed schema.
+def use_arrow_decoding():
+    return st.secrets["database"].get("arrow_decoding", False)
+
+def find_arrow_table(collection_name, view):
+    if not use_arrow_decoding():
         return None
-    
-    champ_key = next((k for k, v in champion_data.items() if v["name"] == champion_name), None)
-    if champ_key:
-        return champ_key
-    
-    normalized_name = champion_name.lower().replace(" ", "").replace("'", "")
-    if normalized_name in champ_mapping:
-        return champ_mapping[normalized_name]
-    
-    for key, data in champion_data.items():
-        if champion_name.lower() in data["name"].lower() or data["name"].lower() in champion_name.lower():
-            return key
-    
-    if champion_name in champion_data:
-        return champion_name
-    
-    return None
+    db = get_db()
+    try:
+        return find_arrow(db[collection_name], view)
+    except PyMongoError:
+        return None
+
+# Load data functions. Finds cached under a data version read from the primary,
+# where the version was probed; only aggregations use the secondaries
+@traced()
+@versioned("CLA_Games", max_entries=2)
+def load_games(version=None):
+    return get_snapshot("CLA_Games", "tables", sort=("date", -1)).refresh()
+
+# Indexes behind the Officials filters, and the derived fields they query on
+# games written by other tools, brought up to date once per CLA_Games version
+@traced()
+@versioned("CLA_Games", max_entries=1, shared=True)
+def ensure_indexes(version=None):
+    db = get_db()
+    try:
+        ensure_game_indexes(db.CLA_Games)
+    except PyMongoError:
+        # Read-only credentials: filters still work, just without the indexes
+        pass
+
+@traced()
+@versioned("CLA_Games", max_entries=2)
+def load_officials_filter_options(version=None):
+    db = get_db()
+    return officials_filter_options(on_primary(db.CLA_Games))
 
-# Load data functions - EXACTLY AS ORIGINAL
-@st.cache_data(ttl=300)
-def load_games():
+@traced()
+@versioned("CLA_Games", max_entries=32)
+def search_officials(date_range, result, side, opponent, allied_champion, enemy_champion, version=None):
     db = get_db()
-    return list(db.CLA_Games.find().sort("date", -1))
+    query = officials_query(date_range, result, side, opponent, allied_champion, enemy_champion)
+    return build_game_summaries(find_game_summaries(on_primary(db.CLA_Games), query))
 
-@st.cache_data(ttl=300)
-def load_players():
+# Full game document for the detail view, most recently opened games kept
+@traced()
+@versioned("CLA_Games", max_entries=64)
+def get_game(game_id, version=None):
     db = get_db()
-    return list(db.CLA_Players.find())
+    return find_by_id(on_primary(db.CLA_Games), game_id)
 
-@st.cache_data(ttl=300)
-def load_scrims():
+@traced()
+@versioned("CLA_Players", max_entries=2)
+def load_players(version=None):
     db = get_db()
-    return list(db.CLA_Scrims.find())
+    return list(on_primary(db.CLA_Players).find())
+
+# Scrim views register their fields in store.PROJECTIONS; views without an
+# entry (e.g. full replay stats) get complete participant records
+@traced()
+@versioned("CLA_Scrims", max_entries=4)
+def load_scrims(view="draft", version=None):
+    return get_snapshot("CLA_Scrims", view).refresh()
+
+# Scrims parsed into per-scrim and participant tables, reused from disk across restarts
+@traced()
+@versioned("CLA_Scrims", max_entries=2)
+def load_scrim_tables(version=None):
+    tables = get_table_cache().get("scrims", version)
+    if tables is None:
+        table = find_arrow_table("CLA_Scrims", "draft")
+        tables = parse_scrims_from_arrow(table) if table is not None else parse_scrims(load_scrims())
+        get_table_cache().put_in_background("scrims", version, tables)
+    return tables
+
+# Scrim Game Browser rows and filter index, shared rather than copied so a
+# filter change in the browser fragment does not unpickle the whole history
+@traced()
+@versioned("CLA_Scrims", max_entries=2, shared=True)
+def load_scrim_browser(version=None):
+    scrim_games = scrim_browser_rows(*load_scrim_tables())
+    return scrim_games, build_scrim_filter_index(scrim_games)
+
+# Player Stats averages and per-player game history
+@traced()
+@versioned("CLA_Players", max_entries=2)
+def load_player_profiles(version=None):
+    return player_profiles(load_players())
+
+@traced()
+@versioned("CLA_Games", max_entries=16)
+def load_player_history(player, version=None):
+    _, participant_facts = load_game_tables()
+    return player_history(participant_facts, player)
+
+# Normalized game and participant tables shared by the Officials pages, reused from disk across restarts
+@traced()
+@versioned("CLA_Games", max_entries=2)
+def load_game_tables(version=None):
+    tables = get_table_cache().get("games", version)
+    if tables is None:
+        games = load_games()
+        tables = build_game_table(games), build_participant_facts(games)
+        get_table_cache().put_in_background("games", version, tables)
+    return tables
+
+# Summary collections maintained by `python ingest.py materialize`
+def use_materialized_summaries():
+    return st.secrets["database"].get("materialized_summaries", False)
+
+@traced()
+@versioned(SUMMARY_STATE, max_entries=8)
+def load_summary(summary, version=None):
+    db = get_db()
+    return read_summary(db, summary)
+
+# Team records and objective counters for the sidebar and Team Stats
+@traced()
+@versioned("CLA_Games", SUMMARY_STATE, max_entries=2)
+def load_team_summary(version=None):
+    if use_materialized_summaries():
+        try:
+            records = load_summary("team")
+            if records:
+                return team_summary(records)
+        except PyMongoError:
+            pass
+    games_table, _ = load_game_tables()
+    return team_summary(side_records(games_table))
+
+# Champion Analysis records, optionally aggregated by MongoDB
+@traced()
+@versioned("CLA_Games", SUMMARY_STATE, max_entries=2)
+def load_champion_pools(version=None):
+    if use_materialized_summaries():
+        try:
+            groups = load_summary("champions")
+            if groups:
+                return champion_pools_from_groups(groups)
+        except PyMongoError:
+            pass
+    if st.secrets["database"].get("server_side_aggregation", False):
+        try:
+            db = get_db()
+            return champion_pools_from_groups(aggregate_champion_pools(db.CLA_Games, CALDYA_PLAYERS))
+        except PyMongoError:
+            pass
+    _, participant_facts = load_game_tables()
+    return champion_pools(participant_facts)
+
+# Scrim champion pools and overall record
+@traced()
+@versioned("CLA_Scrims", SUMMARY_STATE, max_entries=2)
+def load_scrim_summary(version=None):
+    if use_materialized_summaries():
+        try:
+            groups = load_summary("scrim_champions")
+            record = load_summary("scrims")
+            if record:
+                role_pools, _ = champion_pools_from_groups(groups)
+                return role_pools, scrim_record_from_summary(record)
+        except PyMongoError:
+            pass
+    scrim_table, scrim_participants = load_scrim_tables()
+    return scrim_champion_pools(scrim_participants), scrim_record(scrim_table)
 
 # Format time difference - EXACTLY AS ORIGINAL
 def format_time_diff(seconds):
@@ -785,7 +1003,7 @@ def format_time_diff(seconds):
     return f"{minutes}:{seconds:02d}"
 
 # Champion card creation functions - EXACTLY AS ORIGINAL
-def create_champion_card(champ_data, role_color, champion_data, champ_mapping, ddragon_version):
+def create_champion_card(champ_data, role_color, champion_resolver, ddragon_version):
     """Create a simple champion card with clear separation using only native Streamlit components"""
     champion_name = champ_data["champion"]
     win_rate = champ_data["win_rate"]
@@ -794,7 +1012,7 @@ def create_champion_card(champ_data, role_color, champion_data, champ_mapping, d
     losses = champ_data["losses"]
     
     # Get champion key for image
-    champ_key = find_champion_key(champion_name, champion_data, champ_mapping)
+    champ_key = champion_resolver.resolve(champion_name)
     
     # Determine win rate status
     if win_rate >= 70:
@@ -833,7 +1051,7 @@ def create_champion_card(champ_data, role_color, champion_data, champ_mapping, d
     # Extra spacing
     st.write("")
 
-def create_champion_row(champ_data, role_color, champion_data, champ_mapping, ddragon_version):
+def create_champion_row(champ_data, role_color, champion_resolver, ddragon_version):
     """Create a compact champion row for detailed view"""
     champion_name = champ_data["champion"]
     win_rate = champ_data["win_rate"]
@@ -841,7 +1059,7 @@ def create_champion_row(champ_data, role_color, champion_data, champ_mapping, dd
     wins = champ_data["wins"]
     losses = champ_data["losses"]
     
-    champ_key = find_champion_key(champion_name, champion_data, champ_mapping)
+    champ_key = champion_resolver.resolve(champion_name)
     wr_color = "#10b981" if win_rate >= 60 else "#f59e0b" if win_rate >= 40 else "#ef4444"
     
     col1, col2, col3, col4 = st.columns([1, 3, 2, 2])
@@ -866,12 +1084,564 @@ def create_champion_row(champ_data, role_color, champion_data, champ_mapping, dd
     with col4:
         st.markdown(f"**{wins}W - {losses}L** ({games}g)")
 
-# Load data
-games = load_games()
-players_db = load_players()
-champion_data, ddragon_version, champ_mapping = get_champion_data()
+# Scrim Game Browser paging
+SCRIM_PAGE_SIZES = [5, 10, 25, 50]
+
+def scrim_page_size():
+    """Default games per page, configurable under [scrim_browser] in secrets"""
+    page_size = st.secrets.get("scrim_browser", {}).get("page_size", 10)
+    return page_size if page_size in SCRIM_PAGE_SIZES else 10
+
+def champion_icon_html(champ_key, ddragon_version):
+    """Champion icon, or a placeholder when the name did not resolve"""
+    if champ_key:
+        return '<img src="https://ddragon.leagueoflegends.com/cdn/' + ddragon_version + '/img/champion/' + champ_key + '.png" width="40" style="border-radius: 6px;">'
+    return '<div style="width: 40px; height: 40px; background: #475569; border-radius: 6px; display: flex; align-items: center; justify-content: center;"><span style="color: white;">?</span></div>'
+
+# HTML for one Game Browser entry, cached per game so paging back is free
+@st.cache_data(max_entries=256)
+def scrim_game_html(game, ddragon_version, _champion_resolver):
+    """Header, team draft and separator markup for a scrim game"""
+    result_color = "#10b981" if game["result"] == "WIN" else "#ef4444"
+    
+    header = f"""
+    <div style="background: linear-gradient(135deg, {result_color}20, {result_color}10); 
+                border-left: 4px solid {result_color}; 
+                border-radius: 12px; 
+                padding: 1rem; 
+                margin: 1rem 0;
+                backdrop-filter: blur(10px);">
+        <h4 style="color: {result_color}; margin: 0; display: flex; align-items: center; gap: 1rem;">
+            <span>{game["result"]}</span>
+            <span style="color: #94a3b8; font-size: 1rem; font-weight: 400;">
+                • Our Side: {game["our_side"]} • Game #{game["index"] + 1}
+            </span>
+        </h4>
+    </div>
+    """
+    
+    # Our team champions
+    our_team = f"""
+    <h5 style="color: #3b82f6; margin-bottom: 1rem; text-align: center;">
+        Caldya ({game["our_side"]} Side)
+    </h5>
+    """
+    for player_data in game["our_team"]:
+        champion = player_data["champion"]
+        player = player_data["player"]
+        role = CALDYA_PLAYERS.get(player, "Unknown")
+        role_color = ROLE_COLORS.get(role, "#94a3b8")
+        our_team += f"""
+    <div style="display: flex; align-items: center; gap: 1rem; 
+                background: rgba(51, 65, 85, 0.3); 
+                border-radius: 8px; 
+                padding: 0.75rem; 
+                margin-bottom: 0.5rem;
+                border-left: 3px solid {role_color};">
+        {champion_icon_html(_champion_resolver.resolve(champion), ddragon_version)}
+        <div>
+            <div style="font-weight: 600; color: #f8fafc;">{champion}</div>
+            <div style="color: {role_color}; font-size: 0.8rem;">{player} ({role})</div>
+        </div>
+    </div>
+    """
+    
+    separator = f"""
+    <div style="text-align: center; margin-top: 3rem;">
+        <div style="font-size: 2rem; color: {result_color};">
+            {"⚔️" if game["result"] == "WIN" else "💀"}
+        </div>
+        <div style="color: #94a3b8; font-size: 0.8rem; margin-top: 0.5rem;">
+            VS
+        </div>
+    </div>
+    """
+    
+    # Enemy team champions
+    enemy_team = f"""
+    <h5 style="color: #ef4444; margin-bottom: 1rem; text-align: center;">
+        Enemy ({game["enemy_side"]} Side)
+    </h5>
+    """
+    for player_data in game["enemy_team"]:
+        champion = player_data["champion"]
+        player = player_data["player"]
+        enemy_team += f"""
+    <div style="display: flex; align-items: center; gap: 1rem; 
+                background: rgba(51, 65, 85, 0.3); 
+                border-radius: 8px; 
+                padding: 0.75rem; 
+                margin-bottom: 0.5rem;
+                border-left: 3px solid #ef4444;">
+        {champion_icon_html(_champion_resolver.resolve(champion), ddragon_version)}
+        <div>
+            <div style="font-weight: 600; color: #f8fafc;">{champion}</div>
+            <div style="color: #ef4444; font-size: 0.8rem;">{player}</div>
+        </div>
+    </div>
+    """
+    
+    return {"header": header, "our_team": our_team, "separator": separator, "enemy_team": enemy_team}
+
+# Scoreboard rows of one team; kept on single lines so markdown never
+# splits the payload on a blank line
+def scoreboard_rows_html(rows, ddragon_version, champion_resolver, name_style, trinket_border):
+    rows_html = []
+    for row in rows:
+        champ_key = champion_resolver.resolve(row["champion"])
+        icon = (f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/champion/{champ_key}.png" width="60" style="border-radius: 8px;" />'
+                if champ_key else "")
+        items = "".join(
+            f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/item/{item_id}.png" width="35" style="margin:2px; border-radius:4px; border:1px solid var(--border);" />'
+            for item_id in row["items"]
+        )
+        if row["trinket"] > 0:
+            items += f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/item/{row["trinket"]}.png" width="35" style="margin:2px 2px 2px 8px; border-radius:4px; border:2px solid {trinket_border};" />'
+        rows_html.append(
+            '<div class="player-items-row">'
+            f'<div class="champion-section">{icon}'
+            f'<div class="player-info-section"><div class="player-name"{name_style}>{row["player"]}</div>'
+            f'<div class="player-score">{row["kda"]}</div></div></div>'
+            f'<div class="items-section">{items}</div>'
+            '</div>'
+        )
+    return "\n".join(rows_html)
+
+# Both teams' scoreboard as one HTML payload, built once per game and data version
+@traced()
+@versioned("CLA_Games", max_entries=64)
+def scoreboard_html(game_id, ddragon_version, _champion_resolver, version=None):
+    caldya_rows, opponent_rows = scoreboard_view(get_game(game_id))
+    return f"""<div class="scoreboard">
+<div>
+<h3>Caldya Final Items</h3>
+{scoreboard_rows_html(caldya_rows, ddragon_version, _champion_resolver, "", "var(--accent-primary)")}
+</div>
+<div>
+<h3>Opponent Final Items</h3>
+{scoreboard_rows_html(opponent_rows, ddragon_version, _champion_resolver, ' style="color: var(--danger);"', "var(--danger)")}
+</div>
+</div>"""
+
+# Officials finder: the filter panel and the selected game's details rerun
+# on their own when a filter changes
+@st.fragment
+def render_officials_finder(data):
+    # Filter values offered by the panel
+    filter_options = load_officials_filter_options()
+
+    # Enhanced filtering section - EXACTLY AS ORIGINAL
+    with st.container():
+        st.subheader("Find an Official")
+
+        # Sort champion lists
+        caldya_champions_list = ["All"] + filter_options["allied_champions"]
+        enemy_champions_list = ["All"] + filter_options["enemy_champions"]
+
+        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
+
+        with col1:
+            # Date filtering
+            min_date = filter_options["min_date"]
+            max_date = filter_options["max_date"]
+            date_range = st.date_input("Date Range", 
+                                       value=[min_date, max_date] if min_date and max_date else None,
+                                       key="date_filter")
+
+            # Result filter
+            result_filter = st.radio("Result", ["All", "WIN", "LOSS"])
+
+        with col2:
+            # Side filter
+            side_filter = st.radio("Side", ["All", "BLUE", "RED"])
+
+            # Opponent filter
+            opponents = ["All"] + filter_options["opponents"]
+            opponent_filter = st.selectbox("Opponent", opponents)
+
+        with col3:
+            # Champion filters
+            st.markdown("**Champion Filters**")
+            allied_champion_filter = st.selectbox("Allied Champion", caldya_champions_list, 
+                                                 help="Filter games where Caldya played this champion")
+            enemy_champion_filter = st.selectbox("Enemy Champion", enemy_champions_list,
+                                                help="Filter games where opponent played this champion")
+
+        with col4:
+            # Apply filters server-side
+            filtered_games = search_officials(
+                tuple(date_range) if date_range else (),
+                result_filter, side_filter, opponent_filter,
+                allied_champion_filter, enemy_champion_filter
+            )
+
+            # Game selection
+            if not filtered_games.empty:
+                game_options = [f"{row['date']} | {row['opponent']} ({row['result']}, {row['side']} side)" 
+                              for _, row in filtered_games.iterrows()]
+
+                selected_index = st.selectbox("Select an Official", 
+                                            range(len(game_options)),
+                                            format_func=lambda i: game_options[i])
+
+                selected_id = filtered_games.iloc[selected_index]["id"]
+
+                # Display selection summary with champion info
+                selected_row = filtered_games.iloc[selected_index]
+                result_color = "#10b981" if selected_row['result'] == "WIN" else "#ef4444"
+
+                # Add champion info to summary if filters are active
+                champion_info = ""
+                if allied_champion_filter != "All":
+                    champion_info += f" • Allied: {allied_champion_filter}"
+                if enemy_champion_filter != "All":
+                    champion_info += f" • Enemy: {enemy_champion_filter}"
+
+                st.markdown(f"""
+                <div style="background: rgba(51, 65, 85, 0.3); padding: 1rem; border-radius: 8px; margin-top: 1rem; border-left: 4px solid {result_color};">
+                    <strong>Selected:</strong> {selected_row['date']} vs {selected_row['opponent']} • 
+                    <span style="color: {result_color}; font-weight: 600;">{selected_row['result']}</span> • 
+                    {selected_row['side']} side • Duration: {selected_row['duration']}{champion_info}
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.warning("No officials match the selected filters.")
+                selected_id = None
+    
+    # Game details section - EXACTLY AS ORIGINAL WITH ENHANCED STYLING
+    if selected_id:
+        with span("Officials: game details", "render"):
+            render_game_details(selected_id, data)
+
+# Header, scoreboard and player performance of one official
+def render_game_details(game_id, data):
+    game = get_game(game_id)
+
+    if game:
+        st.header("Game Details")
+
+        # Game header with enhanced styling
+        result_color = "#10b981" if game.get("win") else "#ef4444"
+        result_text = "VICTORY" if game.get("win") else "DEFEAT"
+
+        st.markdown(f"""
+        <div class="modern-card" style="text-align: center; padding: 2rem;">
+            <h2 style="margin: 0; color: {result_color}; font-size: 2.5rem; text-shadow: 0 0 20px {result_color}50;">
+                {result_text}
+            </h2>
+            <h3 style="margin: 0.5rem 0 0 0; color: #94a3b8;">
+                vs {game.get('opponent_team', {}).get('name', 'Unknown')}
+            </h3>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Game metadata with modern cards
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            styled_metric("Date", game.get('date'))
+            styled_metric("Duration", game.get('game_duration', '0:00'))
+
+        with col2:
+            styled_metric("Side", game.get('Caldya_side', '').upper())
+            # First blood
+            first_blood = game.get('first_blood', {})
+            if first_blood.get('team'):
+                fb_team = "Caldya" if first_blood.get('team') == "NAFKELAH_TEAM" else "Opponent"
+                styled_metric("First Blood", fb_team)
+
+        with col3:
+            # Objectives with enhanced display
+            objective_counts = game_objective_counts(game)
+
+            dragons_caldya, dragons_enemy = objective_counts["dragons"]
+            styled_metric("Dragons", f"{dragons_caldya} - {dragons_enemy}")
+
+            barons_caldya, barons_enemy = objective_counts["barons"]
+            styled_metric("Barons", f"{barons_caldya} - {barons_enemy}")
+
+        # Enhanced Final Items Section - EXACTLY AS ORIGINAL
+        st.header("Scoreboard")
+        if "final_items" in game and "player_data" in game:
+            st.markdown(scoreboard_html(game_id, data.ddragon_version, data.champion_resolver), unsafe_allow_html=True)
+
+        # Enhanced Player Performance - EXACTLY AS ORIGINAL
+        st.header("Player Performance")
+
+        if "player_data" in game and "player_positions" in game:
+            caldya_df, opponent_df = game_performance(game)
+
+            column_config = {
+                "Gold Diff@15": st.column_config.NumberColumn(
+                    "Gold Diff@15",
+                    help="Gold difference at 15 minutes",
+                    format="%d"
+                ),
+                "CS Diff@15": st.column_config.NumberColumn(
+                    "CS Diff@15",
+                    help="CS difference at 15 minutes",
+                    format="%.1f"
+                ),
+            }
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if not caldya_df.empty:
+                    st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
+                    st.subheader("Caldya Players")
+                    st.dataframe(
+                        caldya_df,
+                        column_config=column_config,
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                if not opponent_df.empty:
+                    st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
+                    st.subheader("Opponent Players")
+                    st.dataframe(
+                        opponent_df,
+                        column_config=column_config,
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+# Top champions of one role in the scrim Champion Analysis, with a
+# "show all" toggle that only reruns this column
+@st.fragment
+def render_scrim_role_champions(role, role_data, role_color, data):
+    # Initialize session state for this role's expansion
+    expand_key = f"expand_{role.lower()}_champions"
+    if expand_key not in st.session_state:
+        st.session_state[expand_key] = False
+
+    # Determine how many champions to show
+    show_all = st.session_state[expand_key]
+    champions_to_show = role_data if show_all else role_data[:5]
+
+    # Display champions in compact cards
+    for j, champ_data in enumerate(champions_to_show):
+        champion_name = champ_data["champion"]
+        win_rate = champ_data["win_rate"]
+        games = champ_data["games"]
+        wins = champ_data["wins"]
+
+        # Get champion image
+        champ_key = data.champion_resolver.resolve(champion_name)
+
+        # Champion card with role color theme
+        st.markdown(f"""
+        <div style="background: rgba(51, 65, 85, 0.4); 
+                    border: 1px solid {role_color}50; 
+                    border-radius: 12px; 
+                    padding: 0.75rem; 
+                    margin-bottom: 0.75rem;
+                    text-align: center;
+                    transition: all 0.3s ease;">
+            <div style="margin-bottom: 0.5rem;">
+                {'<img src="https://ddragon.leagueoflegends.com/cdn/' + data.ddragon_version + '/img/champion/' + champ_key + '.png" width="50" style="border-radius: 8px; border: 2px solid ' + role_color + ';">' if champ_key else '<div style="width: 50px; height: 50px; background: ' + role_color + '30; border-radius: 8px; display: flex; align-items: center; justify-content: center; margin: 0 auto; border: 2px solid ' + role_color + ';"><span style="color: ' + role_color + ';">?</span></div>'}
+            </div>
+            <div style="font-weight: 600; color: {role_color}; font-size: 0.85rem; margin-bottom: 0.25rem;">
+                {champion_name}
+            </div>
+            <div style="color: #f8fafc; font-size: 0.75rem; margin-bottom: 0.25rem;">
+                <strong>{win_rate:.0f}%</strong> WR
+            </div>
+            <div style="color: #94a3b8; font-size: 0.7rem;">
+                {wins}W-{games-wins}L ({games}g)
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Show expand/collapse button if there are more than 5 champions
+    if len(role_data) > 5:
+        remaining_count = len(role_data) - 5
+        button_text = "Show Less" if show_all else f"Show {remaining_count} More"
+        button_icon = "▲" if show_all else "▼"
+
+        # Flipped in a callback, so the click's own (fragment) rerun already shows it
+        def toggle_expanded():
+            st.session_state[expand_key] = not st.session_state[expand_key]
+
+        st.button(f"{button_icon} {button_text}", key=f"toggle_{role.lower()}_champions",
+                  on_click=toggle_expanded, use_container_width=True)
+
+# Scrim Game Browser: filters, paging and the page of games rerun on their own
+@st.fragment
+def render_scrim_game_browser(data):
+    # ALL THE GAME BROWSER CODE - EXACTLY AS ORIGINAL
+    st.markdown("""
+    <div style="text-align: center; margin-bottom: 2rem;">
+        <h2 style="background: linear-gradient(135deg, #3b82f6, #60a5fa); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin-bottom: 0.5rem;">
+            Scrim Games Browser
+        </h2>
+        <p style="color: #94a3b8; font-size: 1.1rem;">Browse all scrim games with draft information and filtering</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Browser rows and their filter index, built once per data refresh
+    scrim_games, scrim_filter_index = load_scrim_browser()
+
+    if not scrim_games:
+        st.warning("No valid scrim games found with complete team data.")
+    else:
+        # Filtering section - EXACTLY AS ORIGINAL
+        st.subheader("🔍 Filter Games")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            result_filter = st.radio("Result", ["All", "WIN", "LOSS"], key="scrim_result_filter")
+
+        with col2:
+            side_filter = st.radio("Our Side", ["All", "BLUE", "RED"], key="scrim_side_filter")
+
+        with col3:
+            our_champions_list = ["All"] + scrim_filter_index.values("our_champion")
+            our_champion_filter = st.selectbox("Our Champion", our_champions_list, key="scrim_our_champ")
+
+        with col4:
+            enemy_champions_list = ["All"] + scrim_filter_index.values("enemy_champion")
+            enemy_champion_filter = st.selectbox("Enemy Champion", enemy_champions_list, key="scrim_enemy_champ")
+
+        # Apply filters, most recent scrims first
+        with span("filter_scrim_browser"):
+            filtered_games = filter_scrim_browser(
+                scrim_games, scrim_filter_index,
+                result=result_filter,
+                our_side=side_filter,
+                our_champion=our_champion_filter,
+                enemy_champion=enemy_champion_filter
+            )
+
+        # Display filtered results - EXACTLY AS ORIGINAL
+        st.subheader(f"📋 Games ({len(filtered_games)} games)")
+
+        if not filtered_games:
+            st.warning("No games match the selected filters.")
+        else:
+            # One page at a time
+            page_col1, page_col2 = st.columns([1, 3])
+            with page_col1:
+                page_size = st.selectbox(
+                    "Games per page", SCRIM_PAGE_SIZES,
+                    index=SCRIM_PAGE_SIZES.index(scrim_page_size()), key="scrim_page_size"
+                )
+            page_count = (len(filtered_games) + page_size - 1) // page_size
+            # Keep the page in range when a filter shrinks the result set
+            if st.session_state.get("scrim_page", 1) > page_count:
+                st.session_state.scrim_page = page_count
+            with page_col2:
+                page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key="scrim_page")
+
+            page_games = filtered_games[(page - 1) * page_size:page * page_size]
+
+            # Display games - EXACTLY AS ORIGINAL
+            for game in page_games:
+                html = scrim_game_html(game, data.ddragon_version, data.champion_resolver)
+
+                with st.container():
+                    # Game header
+                    st.markdown(html["header"], unsafe_allow_html=True)
+
+                    # Team drafts - EXACTLY AS ORIGINAL
+                    col1, col_sep, col2 = st.columns([5, 1, 5])
+
+                    with col1:
+                        st.markdown(html["our_team"], unsafe_allow_html=True)
+
+                    with col_sep:
+                        st.markdown(html["separator"], unsafe_allow_html=True)
+
+                    with col2:
+                        st.markdown(html["enemy_team"], unsafe_allow_html=True)
+
+# Data Dragon version and champion key resolver for the icon URLs
+def load_champion_assets():
+    _, ddragon_version = get_champion_data()
+    return ddragon_version, get_ddragon_mirror().resolver(ddragon_version)
+
+# Datasets shared across pages, by name
+DATASETS = {
+    "players": load_players,
+    "team_summary": load_team_summary,
+    "scrim_summary": load_scrim_summary,
+    "scrim_browser": load_scrim_browser,
+    "ddragon_version": lambda: load_champion_assets()[0],
+    "champion_resolver": lambda: load_champion_assets()[1]
+}
+
+# Datasets each page reads (sidebar included); nothing else is loaded on that page
+PAGE_DATASETS = {
+    "Officials": ["team_summary", "ddragon_version", "champion_resolver"],
+    "Team Stats": ["team_summary"],
+    "Player Stats": ["players", "team_summary"],
+    "Champion Analysis": ["team_summary", "ddragon_version", "champion_resolver"],
+    "Scrims": ["scrim_summary", "scrim_browser", "ddragon_version", "champion_resolver"]
+}
+
+# Worker threads for loading a page's datasets concurrently, shared by all sessions
+@st.cache_resource
+def get_load_executor():
+    return ThreadPoolExecutor(max_workers=st.secrets.get("cache", {}).get("load_workers", 4),
+                              thread_name_prefix="caldya-load")
+
+def load_dataset(name):
+    with span(f"load {name}", "data"):
+        return DATASETS[name]()
+
+class PageData:
+    """Datasets declared for one page in PAGE_DATASETS, each loaded on first access
+
+    prefetch() starts every declared dataset on the load executor, so the
+    page waits for the slowest source instead of the sum of them; each
+    load records its own span in the current trace.
+    """
+
+    def __init__(self, page):
+        self._names = PAGE_DATASETS[page]
+        self._values = {}
+        self._futures = {}
+
+    def prefetch(self):
+        for name in self._names:
+            if name not in self._values and name not in self._futures:
+                self._futures[name] = self._submit(name)
+
+    def _submit(self, name):
+        # One context copy per task (a context can only be entered by one
+        # thread at a time); it carries the current trace into the worker
+        return get_load_executor().submit(contextvars.copy_context().run, load_dataset, name)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._names:
+            raise AttributeError(f"{name} is not declared for this page in PAGE_DATASETS")
+        if name not in self._values:
+            future = self._futures.pop(name, None) or self._submit(name)
+            if not future.done():
+                # Loaders run without spinners (workers cannot draw), so the page shows one while it waits
+                with st.spinner("Loading data..."):
+                    future.result()
+            self._values[name] = future.result()
+        return self._values[name]
+
+# Startup health check: an unreachable cluster fails fast with a readable
+# message instead of every loader waiting on server selection
+trace.section("database")
+try:
+    get_db()
+except PyMongoError as error:
+    st.error(f"Cannot reach the database: {error}")
+    st.stop()
 
 # Enhanced sidebar with modern design - EXACTLY AS ORIGINAL
+trace.section("sidebar")
 with st.sidebar:
     # Header with logo and text inline
     st.markdown("""
@@ -901,15 +1671,19 @@ with st.sidebar:
             "Officials Analysis",
             ["Officials", "Team Stats", "Player Stats", "Champion Analysis"]
         )
+    current_page = page if main_page == "Officials" else main_page
+    data = PageData(current_page)
+    data.prefetch()
     
     # Add some stats in sidebar
     st.markdown("---")
     
-    # Quick stats
-    if games:
-        total_games = len(games)
-        wins = sum(1 for game in games if game.get("win"))
-        win_rate = (wins / total_games * 100) if total_games > 0 else 0
+    # Quick stats (Officials pages only, so Scrims never loads the games)
+    quick_stats = officials_summary(data.team_summary) if main_page == "Officials" else {"games": 0}
+    if quick_stats["games"]:
+        total_games = quick_stats["games"]
+        wins = quick_stats["wins"]
+        win_rate = quick_stats["win_rate"]
         
         st.markdown(f"""
         <div class="modern-card" style="padding: 1rem; margin: 1rem 0;">
@@ -922,433 +1696,41 @@ with st.sidebar:
         </div>
         """, unsafe_allow_html=True)
 
+    # Re-probe every collection now instead of waiting for the next version check
+    if st.button("🔄 Refresh data", key="refresh_data", use_container_width=True):
+        get_data_version.clear()
+        st.rerun()
+
 # Page routing based on selection - EXACTLY AS ORIGINAL BUT WITH ENHANCED STYLING
+trace.label = current_page
+trace.section(trace.label)
 if main_page == "Officials":
+    ensure_indexes()
     # Use original page routing from the provided code
     if page == "Officials":
         st.title("Officials Overview")
         
-        if not games:
+        if not data.team_summary["games"]:
             st.warning("No games found in database. Please import game data first.")
         else:
-            # Create games table for listing
-            games_df = pd.DataFrame([
-                {
-                    "id": str(game.get("_id")),
-                    "date": game.get("date"),
-                    "opponent": game.get("opponent_team", {}).get("name", "Unknown"),
-                    "result": "WIN" if game.get("win") else "LOSS",
-                    "side": game.get("Caldya_side", "").upper(),
-                    "duration": game.get("game_duration", "0:00")
-                } for game in games
-            ])
-            
-            # Enhanced filtering section - EXACTLY AS ORIGINAL
-            with st.container():
-                st.subheader("Find an Official")
-                
-                # Extract all champions for filtering
-                all_caldya_champions = set()
-                all_enemy_champions = set()
-                caldya_player_names = ["Nille", "SPOOKY", "Nafkelah", "Soldier", "Steeelback"]
-                
-                for game in games:
-                    caldya_team_id = game.get("Caldya_id")
-                    if "final_items" in game:
-                        for player, item_data in game["final_items"].items():
-                            champion = item_data.get("champion", "")
-                            team_id = item_data.get("team_id")
-                            
-                            if champion:
-                                is_caldya_player = any(player.upper() == caldya_name.upper() for caldya_name in caldya_player_names)
-                                
-                                if is_caldya_player and team_id == caldya_team_id:
-                                    all_caldya_champions.add(champion)
-                                elif team_id != caldya_team_id:
-                                    all_enemy_champions.add(champion)
-                
-                # Sort champion lists
-                caldya_champions_list = ["All"] + sorted(list(all_caldya_champions))
-                enemy_champions_list = ["All"] + sorted(list(all_enemy_champions))
-                
-                col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-                
-                with col1:
-                    # Date filtering
-                    min_date = games_df["date"].min() if not games_df.empty else ""
-                    max_date = games_df["date"].max() if not games_df.empty else ""
-                    date_range = st.date_input("Date Range", 
-                                               value=[min_date, max_date] if min_date and max_date else None,
-                                               key="date_filter")
-                    
-                    # Result filter
-                    result_filter = st.radio("Result", ["All", "WIN", "LOSS"])
-                
-                with col2:
-                    # Side filter
-                    side_filter = st.radio("Side", ["All", "BLUE", "RED"])
-                    
-                    # Opponent filter
-                    opponents = ["All"] + sorted(list(set(games_df["opponent"].tolist())))
-                    opponent_filter = st.selectbox("Opponent", opponents)
-                
-                with col3:
-                    # Champion filters
-                    st.markdown("**Champion Filters**")
-                    allied_champion_filter = st.selectbox("Allied Champion", caldya_champions_list, 
-                                                         help="Filter games where Caldya played this champion")
-                    enemy_champion_filter = st.selectbox("Enemy Champion", enemy_champions_list,
-                                                        help="Filter games where opponent played this champion")
-                
-                with col4:
-                    # Apply filters - EXACTLY AS ORIGINAL
-                    filtered_games = games_df.copy()
-                    
-                    # Date filter
-                    if len(date_range) == 2:
-                        try:
-                            start_date, end_date = date_range
-                            filtered_games = filtered_games[(filtered_games["date"] >= str(start_date)) & 
-                                                           (filtered_games["date"] <= str(end_date))]
-                        except:
-                            pass
-                    
-                    # Basic filters
-                    if result_filter != "All":
-                        filtered_games = filtered_games[filtered_games["result"] == result_filter]
-                    if side_filter != "All":
-                        filtered_games = filtered_games[filtered_games["side"] == side_filter]
-                    if opponent_filter != "All":
-                        filtered_games = filtered_games[filtered_games["opponent"] == opponent_filter]
-                    
-                    # Champion filters - need to check actual game data - EXACTLY AS ORIGINAL
-                    if allied_champion_filter != "All" or enemy_champion_filter != "All":
-                        valid_game_ids = []
-                        
-                        for game in games:
-                            game_id = str(game.get("_id"))
-                            caldya_team_id = game.get("Caldya_id")
-                            
-                            # Check if this game matches current filters (before champion filter)
-                            if game_id not in filtered_games["id"].values:
-                                continue
-                            
-                            caldya_champions_in_game = set()
-                            enemy_champions_in_game = set()
-                            
-                            if "final_items" in game:
-                                for player, item_data in game["final_items"].items():
-                                    champion = item_data.get("champion", "")
-                                    team_id = item_data.get("team_id")
-                                    
-                                    if champion:
-                                        is_caldya_player = any(player.upper() == caldya_name.upper() for caldya_name in caldya_player_names)
-                                        
-                                        if is_caldya_player and team_id == caldya_team_id:
-                                            caldya_champions_in_game.add(champion)
-                                        elif team_id != caldya_team_id:
-                                            enemy_champions_in_game.add(champion)
-                            
-                            # Check champion filters
-                            allied_match = (allied_champion_filter == "All" or 
-                                          allied_champion_filter in caldya_champions_in_game)
-                            enemy_match = (enemy_champion_filter == "All" or 
-                                         enemy_champion_filter in enemy_champions_in_game)
-                            
-                            if allied_match and enemy_match:
-                                valid_game_ids.append(game_id)
-                        
-                        # Filter dataframe to only include games that match champion criteria
-                        filtered_games = filtered_games[filtered_games["id"].isin(valid_game_ids)]
-                    
-                    # Game selection
-                    if not filtered_games.empty:
-                        game_options = [f"{row['date']} | {row['opponent']} ({row['result']}, {row['side']} side)" 
-                                      for _, row in filtered_games.iterrows()]
-                        
-                        selected_index = st.selectbox("Select an Official", 
-                                                    range(len(game_options)),
-                                                    format_func=lambda i: game_options[i])
-                        
-                        selected_id = filtered_games.iloc[selected_index]["id"]
-                        
-                        # Display selection summary with champion info
-                        selected_row = filtered_games.iloc[selected_index]
-                        result_color = "#10b981" if selected_row['result'] == "WIN" else "#ef4444"
-                        
-                        # Add champion info to summary if filters are active
-                        champion_info = ""
-                        if allied_champion_filter != "All":
-                            champion_info += f" • Allied: {allied_champion_filter}"
-                        if enemy_champion_filter != "All":
-                            champion_info += f" • Enemy: {enemy_champion_filter}"
-                        
-                        st.markdown(f"""
-                        <div style="background: rgba(51, 65, 85, 0.3); padding: 1rem; border-radius: 8px; margin-top: 1rem; border-left: 4px solid {result_color};">
-                            <strong>Selected:</strong> {selected_row['date']} vs {selected_row['opponent']} • 
-                            <span style="color: {result_color}; font-weight: 600;">{selected_row['result']}</span> • 
-                            {selected_row['side']} side • Duration: {selected_row['duration']}{champion_info}
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.warning("No officials match the selected filters.")
-                        selected_id = None
-            
-            # Game details section - EXACTLY AS ORIGINAL WITH ENHANCED STYLING
-            if selected_id:
-                game = next((g for g in games if str(g.get("_id")) == selected_id), None)
-                
-                if game:
-                    st.header("Game Details")
-                    
-                    # Game header with enhanced styling
-                    result_color = "#10b981" if game.get("win") else "#ef4444"
-                    result_text = "VICTORY" if game.get("win") else "DEFEAT"
-                    
-                    st.markdown(f"""
-                    <div class="modern-card" style="text-align: center; padding: 2rem;">
-                        <h2 style="margin: 0; color: {result_color}; font-size: 2.5rem; text-shadow: 0 0 20px {result_color}50;">
-                            {result_text}
-                        </h2>
-                        <h3 style="margin: 0.5rem 0 0 0; color: #94a3b8;">
-                            vs {game.get('opponent_team', {}).get('name', 'Unknown')}
-                        </h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Game metadata with modern cards
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        styled_metric("Date", game.get('date'))
-                        styled_metric("Duration", game.get('game_duration', '0:00'))
-                    
-                    with col2:
-                        styled_metric("Side", game.get('Caldya_side', '').upper())
-                        # First blood
-                        first_blood = game.get('first_blood', {})
-                        if first_blood.get('team'):
-                            fb_team = "Caldya" if first_blood.get('team') == "NAFKELAH_TEAM" else "Opponent"
-                            styled_metric("First Blood", fb_team)
-                    
-                    with col3:
-                        # Objectives with enhanced display
-                        caldya_objectives = game.get('objectives', {}).get('blue_team' if game.get('Caldya_side') == 'blue' else 'red_team', {}).get('objectives', {})
-                        enemy_objectives = game.get('objectives', {}).get('red_team' if game.get('Caldya_side') == 'blue' else 'blue_team', {}).get('objectives', {})
-                        
-                        dragons_caldya = caldya_objectives.get('dragon', {}).get('kills', 0)
-                        dragons_enemy = enemy_objectives.get('dragon', {}).get('kills', 0)
-                        styled_metric("Dragons", f"{dragons_caldya} - {dragons_enemy}")
-                        
-                        barons_caldya = caldya_objectives.get('baron', {}).get('kills', 0)
-                        barons_enemy = enemy_objectives.get('baron', {}).get('kills', 0)
-                        styled_metric("Barons", f"{barons_caldya} - {barons_enemy}")
-                    
-                    # Enhanced Final Items Section - EXACTLY AS ORIGINAL
-                    st.header("Scoreboard")
-                    if "final_items" in game and "player_data" in game:
-                        caldya_team_id = game.get("Caldya_id")
-                        caldya_player_items = []
-                        opponent_player_items = []
-                        
-                        for player, item_data in game["final_items"].items():
-                            # Get player KDA from game data
-                            player_stats = game["player_data"].get(player, {})
-                            kda = player_stats.get("kda", "0/0/0")
-                            
-                            if item_data.get("team_id") == caldya_team_id:
-                                caldya_player_items.append((player, item_data, kda))
-                            else:
-                                opponent_player_items.append((player, item_data, kda))
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.subheader("Caldya Final Items")
-                            
-                            for player, item_data, kda in caldya_player_items:
-                                champ_name = item_data.get("champion")
-                                champ_key = find_champion_key(champ_name, champion_data, champ_mapping)
-                                
-                                st.markdown('<div class="player-items-row">', unsafe_allow_html=True)
-                                
-                                # Layout: Champion section (icon + name/KDA below) | Items section
-                                champion_col, items_col = st.columns([1, 4])
-                                
-                                with champion_col:
-                                    # Champion icon
-                                    if champ_key:
-                                        st.image(
-                                            f"https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/champion/{champ_key}.png", 
-                                            width=60
-                                        )
-                                    
-                                    # Player info under champion
-                                    st.markdown(f"""
-                                    <div class="player-info-section">
-                                        <div class="player-name">{player}</div>
-                                        <div class="player-score">{kda}</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                with items_col:
-                                    # Items right after champion - EXACTLY AS ORIGINAL
-                                    items_html = '<div class="items-section">'
-                                    trinket_id = item_data.get("trinket", 0)
-                                    player_items = item_data.get("items", [])
-                                    
-                                    # Si le dernier item est égal au trinket, ne pas l'afficher dans les items
-                                    if player_items and trinket_id > 0 and len(player_items) > 0 and player_items[-1] == trinket_id:
-                                        player_items = player_items[:-1]  # Enlever le dernier item
-                                    
-                                    for i, item_id in enumerate(player_items):
-                                        if i < 6 and item_id > 0:
-                                            items_html += f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/item/{item_id}.png" width="35" style="margin:2px; border-radius:4px; border:1px solid var(--border);" />'
-                                    
-                                    # Afficher le trinket avec un style spécial
-                                    if trinket_id > 0:
-                                        items_html += f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/item/{trinket_id}.png" width="35" style="margin:2px 2px 2px 8px; border-radius:4px; border:2px solid var(--accent-primary);" />'
-                                    
-                                    items_html += '</div>'
-                                    st.markdown(items_html, unsafe_allow_html=True)
-                                
-                                st.markdown('</div>', unsafe_allow_html=True)
-                        
-                        with col2:
-                            st.subheader("Opponent Final Items")
-                            
-                            for player, item_data, kda in opponent_player_items:
-                                champ_name = item_data.get("champion")
-                                champ_key = find_champion_key(champ_name, champion_data, champ_mapping)
-                                
-                                st.markdown('<div class="player-items-row">', unsafe_allow_html=True)
-                                
-                                # Layout: Champion section (icon + name/KDA below) | Items section
-                                champion_col, items_col = st.columns([1, 4])
-                                
-                                with champion_col:
-                                    # Champion icon
-                                    if champ_key:
-                                        st.image(
-                                            f"https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/champion/{champ_key}.png", 
-                                            width=60
-                                        )
-                                    
-                                    # Player info under champion
-                                    st.markdown(f"""
-                                    <div class="player-info-section">
-                                        <div class="player-name" style="color: var(--danger);">{player}</div>
-                                        <div class="player-score">{kda}</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                
-                                with items_col:
-                                    # Items right after champion - EXACTLY AS ORIGINAL
-                                    items_html = '<div class="items-section">'
-                                    trinket_id = item_data.get("trinket", 0)
-                                    player_items = item_data.get("items", [])
-                                    
-                                    # Si le dernier item est égal au trinket, ne pas l'afficher dans les items
-                                    if player_items and trinket_id > 0 and len(player_items) > 0 and player_items[-1] == trinket_id:
-                                        player_items = player_items[:-1]  # Enlever le dernier item
-                                    
-                                    for i, item_id in enumerate(player_items):
-                                        if i < 6 and item_id > 0:
-                                            items_html += f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/item/{item_id}.png" width="35" style="margin:2px; border-radius:4px; border:1px solid var(--border);" />'
-                                    
-                                    # Afficher le trinket avec un style spécial
-                                    if trinket_id > 0:
-                                        items_html += f'<img src="https://ddragon.leagueoflegends.com/cdn/{ddragon_version}/img/item/{trinket_id}.png" width="35" style="margin:2px 2px 2px 8px; border-radius:4px; border:2px solid var(--danger);" />'
-                                    
-                                    items_html += '</div>'
-                                    st.markdown(items_html, unsafe_allow_html=True)
-                                
-                                st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # Enhanced Player Performance - EXACTLY AS ORIGINAL
-                    st.header("Player Performance")
-                    
-                    if "player_data" in game and "player_positions" in game:
-                        caldya_player_names = ["Nille", "SPOOKY", "Nafkelah", "Soldier", "Steeelback"]
-                        caldya_players = []
-                        opponent_players = []
-                        
-                        for player, stats in game["player_data"].items():
-                            player_data = {
-                                "Player": player,
-                                "KDA": stats.get("kda", "0/0/0"),
-                                "Gold@15": stats.get("gold_15min", 0),
-                                "CS@15": stats.get("cs_15min", 0),
-                                "Gold Diff@15": stats.get("gold_diff_15min", 0),
-                                "CS Diff@15": stats.get("cs_diff_15min", 0)
-                            }
-                            
-                            if player in caldya_player_names or player.upper() in [p.upper() for p in caldya_player_names]:
-                                caldya_players.append(player_data)
-                            else:
-                                opponent_players.append(player_data)
-                        
-                        column_config = {
-                            "Gold Diff@15": st.column_config.NumberColumn(
-                                "Gold Diff@15",
-                                help="Gold difference at 15 minutes",
-                                format="%d"
-                            ),
-                            "CS Diff@15": st.column_config.NumberColumn(
-                                "CS Diff@15",
-                                help="CS difference at 15 minutes",
-                                format="%.1f"
-                            ),
-                        }
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            if caldya_players:
-                                st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
-                                st.subheader("Caldya Players")
-                                caldya_df = pd.DataFrame(caldya_players)
-                                st.dataframe(
-                                    caldya_df,
-                                    column_config=column_config,
-                                    hide_index=True,
-                                    use_container_width=True
-                                )
-                                st.markdown('</div>', unsafe_allow_html=True)
-                        
-                        with col2:
-                            if opponent_players:
-                                st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
-                                st.subheader("Opponent Players")
-                                opponent_df = pd.DataFrame(opponent_players)
-                                st.dataframe(
-                                    opponent_df,
-                                    column_config=column_config,
-                                    hide_index=True,
-                                    use_container_width=True
-                                )
-                                st.markdown('</div>', unsafe_allow_html=True)
+            render_officials_finder(data)
 
     elif page == "Team Stats":
         st.title("Team Statistics")
         
-        if not games:
+        team_stats = data.team_summary
+        
+        if not team_stats["games"]:
             st.warning("No games found in database. Please import game data first.")
         else:
             # Calculate stats - EXACTLY AS ORIGINAL
-            total_games = len(games)
-            wins = sum(1 for game in games if game.get("win"))
-            losses = total_games - wins
-            win_rate = (wins / total_games * 100) if total_games > 0 else 0
+            summary = officials_summary(team_stats)
+            total_games = summary["games"]
+            wins, losses, win_rate = summary["wins"], summary["losses"], summary["win_rate"]
             
             # Side stats
-            blue_games = sum(1 for game in games if game.get("Caldya_side") == "blue")
-            blue_wins = sum(1 for game in games if game.get("Caldya_side") == "blue" and game.get("win"))
-            blue_win_rate = (blue_wins / blue_games * 100) if blue_games > 0 else 0
-            
-            red_games = sum(1 for game in games if game.get("Caldya_side") == "red")
-            red_wins = sum(1 for game in games if game.get("Caldya_side") == "red" and game.get("win"))
-            red_win_rate = (red_wins / red_games * 100) if red_games > 0 else 0
+            blue_games, blue_wins, blue_win_rate = summary["blue"]["games"], summary["blue"]["wins"], summary["blue"]["win_rate"]
+            red_games, red_wins, red_win_rate = summary["red"]["games"], summary["red"]["wins"], summary["red"]["win_rate"]
             
             # Modern metrics display
             col1, col2, col3 = st.columns(3)
@@ -1368,53 +1750,8 @@ if main_page == "Officials":
             # Enhanced Objective Control section - EXACTLY AS ORIGINAL
             st.header("Objective Control")
             
-            # Calculate objective stats (excluding first blood from dataframe)
-            dragons_total = 0
-            barons_total = 0
-            first_dragon_games = 0
-            first_dragon_wins = 0
-            first_baron_games = 0
-            first_baron_wins = 0
-            first_herald_games = 0
-            first_herald_wins = 0
-            
-            for game in games:
-                caldya_team_data = None
-                if game.get("Caldya_side") == "blue" and "objectives" in game:
-                    caldya_team_data = game["objectives"].get("blue_team", {})
-                elif game.get("Caldya_side") == "red" and "objectives" in game:
-                    caldya_team_data = game["objectives"].get("red_team", {})
-                
-                if caldya_team_data and "objectives" in caldya_team_data:
-                    dragons_total += caldya_team_data["objectives"].get("dragon", {}).get("kills", 0)
-                    barons_total += caldya_team_data["objectives"].get("baron", {}).get("kills", 0)
-                    
-                    if caldya_team_data["objectives"].get("dragon", {}).get("first", False):
-                        first_dragon_games += 1
-                        if game.get("win"):
-                            first_dragon_wins += 1
-                    
-                    if caldya_team_data["objectives"].get("baron", {}).get("first", False):
-                        first_baron_games += 1
-                        if game.get("win"):
-                            first_baron_wins += 1
-                    
-                    if caldya_team_data["objectives"].get("riftHerald", {}).get("first", False):
-                        first_herald_games += 1
-                        if game.get("win"):
-                            first_herald_wins += 1
-            
-            # Calculate rates
-            first_dragon_rate = (first_dragon_wins / first_dragon_games * 100) if first_dragon_games > 0 else 0
-            first_baron_rate = (first_baron_wins / first_baron_games * 100) if first_baron_games > 0 else 0
-            first_herald_rate = (first_herald_wins / first_herald_games * 100) if first_herald_games > 0 else 0
-            
-            # Create modern visualization with Plotly (excluding first blood) - EXACTLY AS ORIGINAL
-            objective_df = pd.DataFrame({
-                "Objective": ["First Dragon", "First Herald", "First Baron"],
-                "Win Rate": [first_dragon_rate, first_herald_rate, first_baron_rate],
-                "Total Games": [first_dragon_games, first_herald_games, first_baron_games]
-            })
+            # Win rate when securing each first objective (excluding first blood)
+            objective_df = objective_rates(team_stats)
             
             col1, col2 = st.columns([3, 2])
             
@@ -1461,8 +1798,8 @@ if main_page == "Officials":
                 st.markdown('</div>', unsafe_allow_html=True)
             
             with col2:
-                styled_metric("Avg. Dragons per Game", f"{dragons_total / total_games:.1f}" if total_games > 0 else "0")
-                styled_metric("Avg. Barons per Game", f"{barons_total / total_games:.1f}" if total_games > 0 else "0")
+                styled_metric("Avg. Dragons per Game", f"{summary['dragons_per_game']:.1f}" if total_games > 0 else "0")
+                styled_metric("Avg. Barons per Game", f"{summary['barons_per_game']:.1f}" if total_games > 0 else "0")
                 
                 st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
                 st.dataframe(
@@ -1484,30 +1821,11 @@ if main_page == "Officials":
     elif page == "Player Stats":
         st.title("Player Statistics")
         
-        if not players_db:
+        if not data.players:
             st.warning("No player data found in database.")
         else:
             # Convert player data - EXACTLY AS ORIGINAL
-            players_data = []
-            for player in players_db:
-                players_data.append({
-                    "name": player.get("name", "Unknown"),
-                    "games_played": player.get("games_played", 0),
-                    "avg_gold_15min": player.get("avg_player_data", {}).get("gold_15min", 0),
-                    "avg_cs_15min": player.get("avg_player_data", {}).get("cs_15min", 0),
-                    "avg_gold_diff_15min": player.get("avg_player_data", {}).get("gold_diff_15min", 0),
-                    "avg_cs_diff_15min": player.get("avg_player_data", {}).get("cs_diff_15min", 0),
-                    "kda_kills": player.get("avg_player_data", {}).get("kda_kills", 0),
-                    "kda_deaths": player.get("avg_player_data", {}).get("kda_deaths", 0),
-                    "kda_assists": player.get("avg_player_data", {}).get("kda_assists", 0),
-                    "kda_ratio": player.get("avg_player_data", {}).get("kda_ratio", 0),
-                    "avg_kda": player.get("avg_player_data", {}).get("kda", "0/0/0"),
-                    "avg_control_wards": player.get("avg_control_wards", 0),
-                    "avg_vision_score": player.get("avg_challenges", {}).get("vision_score", 0),
-                    "avg_damage_per_minute": player.get("avg_challenges", {}).get("damage_per_minute", 0)
-                })
-            
-            players_df = pd.DataFrame(players_data)
+            players_df = load_player_profiles()
             
             # Enhanced player selector
             players = sorted(list(players_df["name"]))
@@ -1559,56 +1877,34 @@ if main_page == "Officials":
                 # Player Challenges (without visualization) - EXACTLY AS ORIGINAL
                 st.header("Player Challenges")
                 
-                player_challenges = {}
-                for player in players_db:
-                    if player.get("name") == selected_player:
-                        player_challenges = player.get("avg_challenges", {})
-                        break
+                challenges = player_challenges(data.players, selected_player)
                 
-                if player_challenges:
+                if challenges:
                     col1, col2, col3 = st.columns(3)
                     
                     with col1:
-                        styled_metric("Vision Score", f"{player_challenges.get('vision_score', 0):.1f}")
-                        styled_metric("Damage Per Minute", f"{player_challenges.get('damage_per_minute', 0):.1f}")
-                        styled_metric("Buffs Stolen", f"{player_challenges.get('buffs_stolen', 0):.1f}")
+                        styled_metric("Vision Score", f"{challenges.get('vision_score', 0):.1f}")
+                        styled_metric("Damage Per Minute", f"{challenges.get('damage_per_minute', 0):.1f}")
+                        styled_metric("Buffs Stolen", f"{challenges.get('buffs_stolen', 0):.1f}")
                     
                     with col2:
-                        styled_metric("Skillshots Hit", f"{player_challenges.get('skill_shots_hit', 0):.1f}")
-                        styled_metric("Skillshots Dodged", f"{player_challenges.get('skill_shots_dodged', 0):.1f}")
-                        styled_metric("Perfect Game", f"{player_challenges.get('perfect_game', 0):.2f}")
+                        styled_metric("Skillshots Hit", f"{challenges.get('skill_shots_hit', 0):.1f}")
+                        styled_metric("Skillshots Dodged", f"{challenges.get('skill_shots_dodged', 0):.1f}")
+                        styled_metric("Perfect Game", f"{challenges.get('perfect_game', 0):.2f}")
                     
                     with col3:
-                        styled_metric("Turret Plates Taken", f"{player_challenges.get('turret_plates_taken', 0):.1f}")
-                        danced = "Yes" if player_challenges.get('dance_with_rift_herald', False) else "No"
+                        styled_metric("Turret Plates Taken", f"{challenges.get('turret_plates_taken', 0):.1f}")
+                        danced = "Yes" if challenges.get('dance_with_rift_herald', False) else "No"
                         styled_metric("Danced with Herald", danced)
                 else:
                     st.warning(f"No challenge data found for player {selected_player}")
                 
-                # Game history - EXACTLY AS ORIGINAL
-                player_games = []
-                for game in games:
-                    if selected_player in game.get("player_data", {}):
-                        player_stats = game["player_data"][selected_player]
-                        player_games.append({
-                            "game_id": str(game.get("_id")),
-                            "date": game.get("date"),
-                            "opponent": game.get("opponent_team", {}).get("name", "Unknown"),
-                            "win": game.get("win", False),
-                            "kda": player_stats.get("kda", "0/0/0"),
-                            "gold_15min": player_stats.get("gold_15min", 0),
-                            "cs_15min": player_stats.get("cs_15min", 0),
-                            "gold_diff_15min": player_stats.get("gold_diff_15min", 0),
-                            "cs_diff_15min": player_stats.get("cs_diff_15min", 0),
-                            "position": game.get("player_positions", {}).get(selected_player, "")
-                        })
+                # Game history
+                games_df = load_player_history(selected_player)
                 
-                if player_games:
+                if not games_df.empty:
                     st.header("Game History")
                     
-                    games_df = pd.DataFrame(player_games)
-                    games_df = games_df.sort_values("date", ascending=False)
-                    
                     st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
                     st.dataframe(
                         games_df,
@@ -1631,69 +1927,15 @@ if main_page == "Officials":
     elif page == "Champion Analysis":
         st.title("Champion Analysis")
         
-        if not games:
+        if not data.team_summary["games"]:
             st.warning("No games found in database. Please import game data first.")
         else:
             # Define player roles - EXACTLY AS ORIGINAL
-            caldya_players = {
-                "Nille": "Top",
-                "SPOOKY": "Jungle", 
-                "Nafkelah": "Mid",
-                "Soldier": "ADC",
-                "Steeelback": "Support"
-            }
-            
-            # Role colors for better visual distinction
-            role_colors = {
-                "Top": "#e11d48",      # Red
-                "Jungle": "#10b981",   # Green  
-                "Mid": "#3b82f6",      # Blue
-                "ADC": "#f59e0b",      # Orange
-                "Support": "#8b5cf6"   # Purple
-            }
+            caldya_players = CALDYA_PLAYERS
+            role_colors = ROLE_COLORS
             
-            # Collect champion data for Caldya players - EXACTLY AS ORIGINAL
-            caldya_champion_data = {}
-            opponent_champion_data = {}
-            
-            for game in games:
-                game_win = game.get("win", False)
-                caldya_team_id = game.get("Caldya_id")
-                
-                if "final_items" in game:
-                    for player, item_data in game["final_items"].items():
-                        champion = item_data.get("champion", "Unknown")
-                        team_id = item_data.get("team_id")
-                        
-                        # Check if this is a Caldya player
-                        caldya_player = None
-                        for caldya_name, role in caldya_players.items():
-                            if player.upper() == caldya_name.upper() or player == caldya_name:
-                                caldya_player = caldya_name
-                                break
-                        
-                        if caldya_player and team_id == caldya_team_id:
-                            # Caldya player
-                            role = caldya_players[caldya_player]
-                            if role not in caldya_champion_data:
-                                caldya_champion_data[role] = {}
-                            if champion not in caldya_champion_data[role]:
-                                caldya_champion_data[role][champion] = {"wins": 0, "games": 0}
-                            
-                            caldya_champion_data[role][champion]["games"] += 1
-                            if game_win:
-                                caldya_champion_data[role][champion]["wins"] += 1
-                        
-                        elif team_id != caldya_team_id:
-                            # Opponent player
-                            if "Opponent" not in opponent_champion_data:
-                                opponent_champion_data["Opponent"] = {}
-                            if champion not in opponent_champion_data["Opponent"]:
-                                opponent_champion_data["Opponent"][champion] = {"wins": 0, "games": 0}
-                            
-                            opponent_champion_data["Opponent"][champion]["games"] += 1
-                            if not game_win:  # Opponent wins when Caldya loses
-                                opponent_champion_data["Opponent"][champion]["wins"] += 1
+            # Champion records for Caldya players (by role) and opponents
+            caldya_champion_data, opponent_data = load_champion_pools()
             
             # Create tabs for different views - EXACTLY AS ORIGINAL
             tab1, tab2 = st.tabs(["🏆 Caldya Champions", "⚔️ Opponent Analysis"])
@@ -1709,26 +1951,12 @@ if main_page == "Officials":
                 """, unsafe_allow_html=True)
                 
                 # Create role sections - EXACTLY AS ORIGINAL
-                for role in ["Top", "Jungle", "Mid", "ADC", "Support"]:
+                for role in ROLES:
                     player_name = [k for k, v in caldya_players.items() if v == role][0]
                     role_color = role_colors.get(role, "#3b82f6")
                     
-                    if role in caldya_champion_data and caldya_champion_data[role]:
-                        # Prepare data for this role
-                        role_data = []
-                        for champion, stats in caldya_champion_data[role].items():
-                            if stats["games"] > 0:
-                                win_rate = (stats["wins"] / stats["games"]) * 100
-                                role_data.append({
-                                    "champion": champion,
-                                    "games": stats["games"],
-                                    "wins": stats["wins"],
-                                    "losses": stats["games"] - stats["wins"],
-                                    "win_rate": win_rate
-                                })
-                        
-                        # Sort by games played, then by win rate
-                        role_data.sort(key=lambda x: (x["games"], x["win_rate"]), reverse=True)
+                    if caldya_champion_data.get(role):
+                        role_data = caldya_champion_data[role]
                         
                         # Role header with modern styling
                         st.markdown(f"""
@@ -1751,27 +1979,27 @@ if main_page == "Officials":
                             if len(role_data) == 1:
                                 cols = st.columns([1, 2, 1])
                                 with cols[1]:
-                                    create_champion_card(role_data[0], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[0], role_color, data.champion_resolver, data.ddragon_version)
                             elif len(role_data) == 2:
                                 cols = st.columns([2, 1, 2])
                                 with cols[0]:
-                                    create_champion_card(role_data[0], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[0], role_color, data.champion_resolver, data.ddragon_version)
                                 with cols[1]:
                                     st.markdown("", unsafe_allow_html=True)  # Separator space
                                 with cols[2]:
-                                    create_champion_card(role_data[1], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[1], role_color, data.champion_resolver, data.ddragon_version)
                             elif len(role_data) == 3:
                                 cols = st.columns([3, 1, 3, 1, 3])
                                 with cols[0]:
-                                    create_champion_card(role_data[0], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[0], role_color, data.champion_resolver, data.ddragon_version)
                                 with cols[1]:
                                     st.markdown('<div style="border-left: 2px solid #475569; height: 400px; margin: 2rem 0;"></div>', unsafe_allow_html=True)
                                 with cols[2]:
-                                    create_champion_card(role_data[1], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[1], role_color, data.champion_resolver, data.ddragon_version)
                                 with cols[3]:
                                     st.markdown('<div style="border-left: 2px solid #475569; height: 400px; margin: 2rem 0;"></div>', unsafe_allow_html=True)
                                 with cols[4]:
-                                    create_champion_card(role_data[2], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[2], role_color, data.champion_resolver, data.ddragon_version)
                         else:
                             # Many champions - display in grid with metrics + detailed table
                             # Top 3 champions as cards with separators
@@ -1779,7 +2007,7 @@ if main_page == "Officials":
                             for i in range(min(3, len(role_data))):
                                 col_index = i * 2  # 0, 2, 4
                                 with cols[col_index]:
-                                    create_champion_card(role_data[i], role_color, champion_data, champ_mapping, ddragon_version)
+                                    create_champion_card(role_data[i], role_color, data.champion_resolver, data.ddragon_version)
                                 # Add separator after first two champions
                                 if i < 2:
                                     with cols[col_index + 1]:
@@ -1791,7 +2019,7 @@ if main_page == "Officials":
                                     # Create detailed champion grid
                                     remaining_champs = role_data[3:]
                                     for champ_data in remaining_champs:
-                                        create_champion_row(champ_data, role_color, champion_data, champ_mapping, ddragon_version)
+                                        create_champion_row(champ_data, role_color, data.champion_resolver, data.ddragon_version)
                     else:
                         # No data for this role
                         st.markdown(f"""
@@ -1806,6 +2034,7 @@ if main_page == "Officials":
                         </div>
                         """, unsafe_allow_html=True)
             
+            trace.section("Champion Analysis: opponents")
             with tab2:
                 st.markdown("""
                 <div style="text-align: center; margin-bottom: 2rem;">
@@ -1816,174 +2045,91 @@ if main_page == "Officials":
                 </div>
                 """, unsafe_allow_html=True)
                 
-                if "Opponent" in opponent_champion_data:
-                    # Prepare opponent data - EXACTLY AS ORIGINAL
-                    opponent_data = []
-                    for champion, stats in opponent_champion_data["Opponent"].items():
-                        if stats["games"] > 0:
-                            win_rate = (stats["wins"] / stats["games"]) * 100
-                            opponent_data.append({
-                                "champion": champion,
-                                "games": stats["games"],
-                                "wins": stats["wins"],
-                                "losses": stats["games"] - stats["wins"],
-                                "win_rate": win_rate
-                            })
+                if opponent_data:
+                    # Summary stats cards
+                    total_unique_champs = len(opponent_data)
+                    high_winrate_champs = len([d for d in opponent_data if d["win_rate"] > 60])
+                    most_played = opponent_data[0] if opponent_data else None
                     
-                    if opponent_data:
-                        # Sort by games played, then by win rate
-                        opponent_data.sort(key=lambda x: (x["games"], x["win_rate"]), reverse=True)
-                        
-                        # Summary stats cards
-                        total_unique_champs = len(opponent_data)
-                        high_winrate_champs = len([d for d in opponent_data if d["win_rate"] > 60])
-                        most_played = opponent_data[0] if opponent_data else None
-                        
-                        # Top stats
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            styled_metric("Unique Champions Faced", str(total_unique_champs))
-                        with col2:
-                            styled_metric("High Win Rate vs Caldya", f"{high_winrate_champs} champions", "> 60% win rate", "bad")
-                        with col3:
-                            if most_played:
-                                styled_metric("Most Played Against Us", most_played["champion"], f"{most_played['games']} games", "blue")
-                        
-                        # Threat Level Analysis - EXACTLY AS ORIGINAL
-                        st.subheader("🚨 Threat Level Analysis")
-                        
-                        # Categorize threats
-                        high_threat = [d for d in opponent_data if d["win_rate"] >= 70 and d["games"] >= 2]
-                        medium_threat = [d for d in opponent_data if 50 <= d["win_rate"] < 70 and d["games"] >= 2]
-                        low_threat = [d for d in opponent_data if d["win_rate"] < 50 and d["games"] >= 2]
-                        
-                        # High threat champions
-                        if high_threat:
-                            st.markdown("""
-                            <h4 style="color: #ef4444; margin: 1.5rem 0 1rem 0;">
-                                🔥 High Threat Champions (≥70% win rate, min 2 games)
-                            </h4>
-                            """, unsafe_allow_html=True)
-                            
-                            # Display threat champions in rows
-                            for champ_data in high_threat:
-                                create_champion_row(champ_data, "#ef4444", champion_data, champ_mapping, ddragon_version)
+                    # Top stats
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        styled_metric("Unique Champions Faced", str(total_unique_champs))
+                    with col2:
+                        styled_metric("High Win Rate vs Caldya", f"{high_winrate_champs} champions", "> 60% win rate", "bad")
+                    with col3:
+                        if most_played:
+                            styled_metric("Most Played Against Us", most_played["champion"], f"{most_played['games']} games", "blue")
+                    
+                    # Threat Level Analysis - EXACTLY AS ORIGINAL
+                    st.subheader("🚨 Threat Level Analysis")
+                    
+                    # Categorize threats
+                    high_threat = [d for d in opponent_data if d["win_rate"] >= 70 and d["games"] >= 2]
+                    medium_threat = [d for d in opponent_data if 50 <= d["win_rate"] < 70 and d["games"] >= 2]
+                    low_threat = [d for d in opponent_data if d["win_rate"] < 50 and d["games"] >= 2]
+                    
+                    # High threat champions
+                    if high_threat:
+                        st.markdown("""
+                        <h4 style="color: #ef4444; margin: 1.5rem 0 1rem 0;">
+                            🔥 High Threat Champions (≥70% win rate, min 2 games)
+                        </h4>
+                        """, unsafe_allow_html=True)
                         
-                        # Medium threat champions  
-                        if medium_threat:
-                            st.markdown("""
-                            <h4 style="color: #f59e0b; margin: 1.5rem 0 1rem 0;">
-                                ⚠️ Medium Threat Champions (50-69% win rate, min 2 games)
-                            </h4>
-                            """, unsafe_allow_html=True)
-                            
-                            # Display threat champions in rows
-                            for champ_data in medium_threat:
-                                create_champion_row(champ_data, "#f59e0b", champion_data, champ_mapping, ddragon_version)
+                        # Display threat champions in rows
+                        for champ_data in high_threat:
+                            create_champion_row(champ_data, "#ef4444", data.champion_resolver, data.ddragon_version)
+                    
+                    # Medium threat champions  
+                    if medium_threat:
+                        st.markdown("""
+                        <h4 style="color: #f59e0b; margin: 1.5rem 0 1rem 0;">
+                            ⚠️ Medium Threat Champions (50-69% win rate, min 2 games)
+                        </h4>
+                        """, unsafe_allow_html=True)
                         
-                        # Low threat champions
-                        if low_threat:
-                            st.markdown("""
-                            <h4 style="color: #10b981; margin: 1.5rem 0 1rem 0;">
-                                ✅ Favorable Matchups (<50% win rate vs us, min 2 games)
-                            </h4>
-                            """, unsafe_allow_html=True)
-                            
-                            # Display threat champions in rows
-                            for champ_data in low_threat:
-                                create_champion_row(champ_data, "#10b981", champion_data, champ_mapping, ddragon_version)
+                        # Display threat champions in rows
+                        for champ_data in medium_threat:
+                            create_champion_row(champ_data, "#f59e0b", data.champion_resolver, data.ddragon_version)
+                    
+                    # Low threat champions
+                    if low_threat:
+                        st.markdown("""
+                        <h4 style="color: #10b981; margin: 1.5rem 0 1rem 0;">
+                            ✅ Favorable Matchups (<50% win rate vs us, min 2 games)
+                        </h4>
+                        """, unsafe_allow_html=True)
                         
-                        # Detailed table for all opponents
-                        with st.expander("📊 Complete Opponent Champion Statistics", expanded=False):
-                            # Display all opponent data in detailed format
-                            for champ_data in opponent_data:
-                                create_champion_row(champ_data, "#94a3b8", champion_data, champ_mapping, ddragon_version)
+                        # Display threat champions in rows
+                        for champ_data in low_threat:
+                            create_champion_row(champ_data, "#10b981", data.champion_resolver, data.ddragon_version)
+                    
+                    # Detailed table for all opponents
+                    with st.expander("📊 Complete Opponent Champion Statistics", expanded=False):
+                        # Display all opponent data in detailed format
+                        for champ_data in opponent_data:
+                            create_champion_row(champ_data, "#94a3b8", data.champion_resolver, data.ddragon_version)
                 else:
                     st.info("No opponent champion data available")
 
 elif main_page == "Scrims":
     st.title("Scrims Analysis")
     
-    # Load scrims data
-    scrims_data = load_scrims()
+    # Champion records per role for our players, and the overall record
+    team_champion_data, scrim_totals = data.scrim_summary
     
-    if not scrims_data:
+    if not scrim_totals[0]:
         st.warning("No scrims data found in database. Please import scrim data first.")
     else:
         # Define player roles - EXACTLY AS ORIGINAL
-        players = {
-            "Nille": "Top",
-            "SPOOKY": "Jungle", 
-            "Nafkelah": "Mid",
-            "Soldier": "ADC",
-            "Steeelback": "Support"
-        }
-        
-        # Role colors for better visual distinction
-        role_colors = {
-            "Top": "#e11d48",      # Red
-            "Jungle": "#10b981",   # Green  
-            "Mid": "#3b82f6",      # Blue
-            "ADC": "#f59e0b",      # Orange
-            "Support": "#8b5cf6"   # Purple
-        }
+        players = CALDYA_PLAYERS
+        role_colors = ROLE_COLORS
         
         # Create tabs for different views - EXACTLY AS ORIGINAL
         tab1, tab2 = st.tabs(["Champion Analysis", "Game Browser"])
         
         with tab1:
-            # ALL THE SCRIMS CHAMPION ANALYSIS CODE - EXACTLY AS ORIGINAL
-            # Collect champion data for players
-            team_champion_data = {}
-            
-            # Process each scrim
-            for scrim in scrims_data:
-                participants = scrim.get("participants", [])
-                
-                # Find team ID by looking for our players
-                team_id = None
-                for participant in participants:
-                    riot_name = participant.get("RIOT_ID_GAME_NAME", "")
-                    # Extract player name without prefix
-                    clean_player_name = riot_name
-                    for prefix in ["VLT ", "CLA "]:
-                        if riot_name.startswith(prefix):
-                            clean_player_name = riot_name[len(prefix):]
-                            break
-                    
-                    if clean_player_name in players:
-                        team_id = participant.get("TEAM")
-                        break
-                
-                # Process each participant
-                for participant in participants:
-                    riot_name = participant.get("RIOT_ID_GAME_NAME", "")
-                    champion = participant.get("SKIN", "")
-                    win_status = participant.get("WIN", "")
-                    participant_team_id = participant.get("TEAM")
-                    
-                    # Extract player name without prefix
-                    clean_player_name = riot_name
-                    for prefix in ["VLT ", "CLA "]:
-                        if riot_name.startswith(prefix):
-                            clean_player_name = riot_name[len(prefix):]
-                            break
-                    
-                    # Check if this is one of our players
-                    if clean_player_name in players and participant_team_id == team_id:
-                        role = players[clean_player_name]
-                        
-                        # Initialize role data if needed
-                        if role not in team_champion_data:
-                            team_champion_data[role] = {}
-                        if champion not in team_champion_data[role]:
-                            team_champion_data[role][champion] = {"wins": 0, "games": 0}
-                        
-                        # Count the game
-                        team_champion_data[role][champion]["games"] += 1
-                        if win_status == "Win":
-                            team_champion_data[role][champion]["wins"] += 1
-            
             # Display results - EXACTLY AS ORIGINAL
             st.markdown("""
             <div style="text-align: center; margin-bottom: 2rem;">
@@ -1995,7 +2141,7 @@ elif main_page == "Scrims":
             """, unsafe_allow_html=True)
             
             # Create 5 columns layout for roles - EXACTLY AS ORIGINAL
-            roles = ["Top", "Jungle", "Mid", "ADC", "Support"]
+            roles = ROLES
             cols = st.columns(5)
             
             for i, role in enumerate(roles):
@@ -2026,75 +2172,9 @@ elif main_page == "Scrims":
                     """, unsafe_allow_html=True)
                     
                     # Champions for this role - Enhanced with full display option
-                    if role in team_champion_data and team_champion_data[role]:
-                        # Prepare data for this role
-                        role_data = []
-                        for champion, stats in team_champion_data[role].items():
-                            if stats["games"] > 0:
-                                win_rate = (stats["wins"] / stats["games"]) * 100
-                                role_data.append({
-                                    "champion": champion,
-                                    "games": stats["games"],
-                                    "wins": stats["wins"],
-                                    "losses": stats["games"] - stats["wins"],
-                                    "win_rate": win_rate
-                                })
-                        
-                        # Sort by games played, then by win rate
-                        role_data.sort(key=lambda x: (x["games"], x["win_rate"]), reverse=True)
-                        
-                        # Initialize session state for this role's expansion
-                        expand_key = f"expand_{role.lower()}_champions"
-                        if expand_key not in st.session_state:
-                            st.session_state[expand_key] = False
-                        
-                        # Determine how many champions to show
-                        show_all = st.session_state[expand_key]
-                        champions_to_show = role_data if show_all else role_data[:5]
-                        
-                        # Display champions in compact cards
-                        for j, champ_data in enumerate(champions_to_show):
-                            champion_name = champ_data["champion"]
-                            win_rate = champ_data["win_rate"]
-                            games = champ_data["games"]
-                            wins = champ_data["wins"]
-                            
-                            # Get champion image
-                            champ_key = find_champion_key(champion_name, champion_data, champ_mapping)
-                            
-                            # Champion card with role color theme
-                            st.markdown(f"""
-                            <div style="background: rgba(51, 65, 85, 0.4); 
-                                        border: 1px solid {role_color}50; 
-                                        border-radius: 12px; 
-                                        padding: 0.75rem; 
-                                        margin-bottom: 0.75rem;
-                                        text-align: center;
-                                        transition: all 0.3s ease;">
-                                <div style="margin-bottom: 0.5rem;">
-                                    {'<img src="https://ddragon.leagueoflegends.com/cdn/' + ddragon_version + '/img/champion/' + champ_key + '.png" width="50" style="border-radius: 8px; border: 2px solid ' + role_color + ';">' if champ_key else '<div style="width: 50px; height: 50px; background: ' + role_color + '30; border-radius: 8px; display: flex; align-items: center; justify-content: center; margin: 0 auto; border: 2px solid ' + role_color + ';"><span style="color: ' + role_color + ';">?</span></div>'}
-                                </div>
-                                <div style="font-weight: 600; color: {role_color}; font-size: 0.85rem; margin-bottom: 0.25rem;">
-                                    {champion_name}
-                                </div>
-                                <div style="color: #f8fafc; font-size: 0.75rem; margin-bottom: 0.25rem;">
-                                    <strong>{win_rate:.0f}%</strong> WR
-                                </div>
-                                <div style="color: #94a3b8; font-size: 0.7rem;">
-                                    {wins}W-{games-wins}L ({games}g)
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # Show expand/collapse button if there are more than 5 champions
-                        if len(role_data) > 5:
-                            remaining_count = len(role_data) - 5
-                            button_text = "Show Less" if show_all else f"Show {remaining_count} More"
-                            button_icon = "▲" if show_all else "▼"
-                            
-                            if st.button(f"{button_icon} {button_text}", key=f"toggle_{role.lower()}_champions", use_container_width=True):
-                                st.session_state[expand_key] = not st.session_state[expand_key]
-                                st.rerun()
+                    if team_champion_data.get(role):
+                        role_data = team_champion_data[role]
+                        render_scrim_role_champions(role, role_data, role_color, data)
                     else:
                         # No data for this role
                         st.markdown(f"""
@@ -2112,43 +2192,7 @@ elif main_page == "Scrims":
             st.header("📊 Scrims Summary")
             
             # Calculate overall stats
-            total_scrims = len(scrims_data)
-            team_wins = 0
-            team_games = 0
-            
-            for scrim in scrims_data:
-                participants = scrim.get("participants", [])
-                our_team_id = None
-                
-                # Find our team ID
-                for participant in participants:
-                    riot_name = participant.get("RIOT_ID_GAME_NAME", "")
-                    clean_player_name = riot_name
-                    for prefix in ["VLT ", "CLA "]:
-                        if riot_name.startswith(prefix):
-                            clean_player_name = riot_name[len(prefix):]
-                            break
-                    
-                    if clean_player_name in players:
-                        our_team_id = participant.get("TEAM")
-                        break
-                
-                # Count team wins
-                if our_team_id:
-                    team_games += 1
-                    for participant in participants:
-                        riot_name = participant.get("RIOT_ID_GAME_NAME", "")
-                        clean_player_name = riot_name
-                        for prefix in ["VLT ", "CLA "]:
-                            if riot_name.startswith(prefix):
-                                clean_player_name = riot_name[len(prefix):]
-                                break
-                        
-                        if (clean_player_name in players and 
-                            participant.get("TEAM") == our_team_id and 
-                            participant.get("WIN") == "Win"):
-                            team_wins += 1
-                            break
+            total_scrims, team_wins, team_games = scrim_totals
             
             team_win_rate = (team_wins / team_games * 100) if team_games > 0 else 0
             
@@ -2161,234 +2205,27 @@ elif main_page == "Scrims":
             with col3:
                 styled_metric("Team Win Rate", f"{team_win_rate:.1f}%", delta_color="blue")
         
+        trace.section("Scrims: game browser")
         with tab2:
-            # ALL THE GAME BROWSER CODE - EXACTLY AS ORIGINAL
-            st.markdown("""
-            <div style="text-align: center; margin-bottom: 2rem;">
-                <h2 style="background: linear-gradient(135deg, #3b82f6, #60a5fa); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin-bottom: 0.5rem;">
-                    Scrim Games Browser
-                </h2>
-                <p style="color: #94a3b8; font-size: 1.1rem;">Browse all scrim games with draft information and filtering</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Prepare game data for browsing - EXACTLY AS ORIGINAL
-            scrim_games = []
-            all_our_champions = set()
-            all_enemy_champions = set()
-            
-            for scrim_index, scrim in enumerate(scrims_data):
-                participants = scrim.get("participants", [])
-                
-                # Find our team ID
-                our_team_id = None
-                for participant in participants:
-                    riot_name = participant.get("RIOT_ID_GAME_NAME", "")
-                    clean_player_name = riot_name
-                    for prefix in ["VLT ", "CLA "]:
-                        if riot_name.startswith(prefix):
-                            clean_player_name = riot_name[len(prefix):]
-                            break
-                    
-                    if clean_player_name in players:
-                        our_team_id = participant.get("TEAM")
-                        break
-                
-                if our_team_id is None:
-                    continue
-                
-                # Separate teams
-                our_team = []
-                enemy_team = []
-                game_result = None
-                
-                for participant in participants:
-                    riot_name = participant.get("RIOT_ID_GAME_NAME", "")
-                    champion = participant.get("SKIN", "Unknown")
-                    win_status = participant.get("WIN", "")
-                    team_id = participant.get("TEAM")
-                    
-                    clean_player_name = riot_name
-                    for prefix in ["VLT ", "CLA "]:
-                        if riot_name.startswith(prefix):
-                            clean_player_name = riot_name[len(prefix):]
-                            break
-                    
-                    participant_data = {
-                        "player": clean_player_name,
-                        "champion": champion,
-                        "full_name": riot_name
-                    }
-                    
-                    if team_id == our_team_id:
-                        our_team.append(participant_data)
-                        all_our_champions.add(champion)
-                        if win_status == "Win":
-                            game_result = "WIN"
-                        elif win_status == "Fail":
-                            game_result = "LOSS"
-                    else:
-                        enemy_team.append(participant_data)
-                        all_enemy_champions.add(champion)
-                
-                # Determine side (assuming team 100 is blue, 200 is red)
-                our_side = "BLUE" if our_team_id == 100 else "RED"
-                enemy_side = "RED" if our_team_id == 100 else "BLUE"
-                
-                if len(our_team) == 5 and len(enemy_team) == 5:
-                    scrim_games.append({
-                        "index": scrim_index,
-                        "our_team": our_team,
-                        "enemy_team": enemy_team,
-                        "result": game_result,
-                        "our_side": our_side,
-                        "enemy_side": enemy_side
-                    })
-            
-            if not scrim_games:
-                st.warning("No valid scrim games found with complete team data.")
-            else:
-                # Filtering section - EXACTLY AS ORIGINAL
-                st.subheader("🔍 Filter Games")
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    result_filter = st.radio("Result", ["All", "WIN", "LOSS"], key="scrim_result_filter")
-                    
-                with col2:
-                    side_filter = st.radio("Our Side", ["All", "BLUE", "RED"], key="scrim_side_filter")
-                
-                with col3:
-                    our_champions_list = ["All"] + sorted(list(all_our_champions))
-                    our_champion_filter = st.selectbox("Our Champion", our_champions_list, key="scrim_our_champ")
-                
-                with col4:
-                    enemy_champions_list = ["All"] + sorted(list(all_enemy_champions))
-                    enemy_champion_filter = st.selectbox("Enemy Champion", enemy_champions_list, key="scrim_enemy_champ")
-                
-                # Apply filters - EXACTLY AS ORIGINAL
-                filtered_games = scrim_games.copy()
-                
-                if result_filter != "All":
-                    filtered_games = [g for g in filtered_games if g["result"] == result_filter]
-                
-                if side_filter != "All":
-                    filtered_games = [g for g in filtered_games if g["our_side"] == side_filter]
-                
-                if our_champion_filter != "All":
-                    filtered_games = [g for g in filtered_games if any(p["champion"] == our_champion_filter for p in g["our_team"])]
-                
-                if enemy_champion_filter != "All":
-                    filtered_games = [g for g in filtered_games if any(p["champion"] == enemy_champion_filter for p in g["enemy_team"])]
-                
-                # Display filtered results - EXACTLY AS ORIGINAL
-                st.subheader(f"📋 Games ({len(filtered_games)} games)")
-                
-                if not filtered_games:
-                    st.warning("No games match the selected filters.")
-                else:
-                    # Display games - EXACTLY AS ORIGINAL
-                    for game in filtered_games:
-                        result_color = "#10b981" if game["result"] == "WIN" else "#ef4444"
-                        
-                        with st.container():
-                            # Game header
-                            st.markdown(f"""
-                            <div style="background: linear-gradient(135deg, {result_color}20, {result_color}10); 
-                                        border-left: 4px solid {result_color}; 
-                                        border-radius: 12px; 
-                                        padding: 1rem; 
-                                        margin: 1rem 0;
-                                        backdrop-filter: blur(10px);">
-                                <h4 style="color: {result_color}; margin: 0; display: flex; align-items: center; gap: 1rem;">
-                                    <span>{game["result"]}</span>
-                                    <span style="color: #94a3b8; font-size: 1rem; font-weight: 400;">
-                                        • Our Side: {game["our_side"]} • Game #{game["index"] + 1}
-                                    </span>
-                                </h4>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Team drafts - EXACTLY AS ORIGINAL
-                            col1, col_sep, col2 = st.columns([5, 1, 5])
-                            
-                            with col1:
-                                st.markdown(f"""
-                                <h5 style="color: #3b82f6; margin-bottom: 1rem; text-align: center;">
-                                    Caldya ({game["our_side"]} Side)
-                                </h5>
-                                """, unsafe_allow_html=True)
-                                
-                                # Our team champions
-                                for player_data in game["our_team"]:
-                                    champion = player_data["champion"]
-                                    player = player_data["player"]
-                                    champ_key = find_champion_key(champion, champion_data, champ_mapping)
-                                    
-                                    # Get role for player
-                                    role = players.get(player, "Unknown")
-                                    role_color = role_colors.get(role, "#94a3b8")
-                                    
-                                    st.markdown(f"""
-                                    <div style="display: flex; align-items: center; gap: 1rem; 
-                                                background: rgba(51, 65, 85, 0.3); 
-                                                border-radius: 8px; 
-                                                padding: 0.75rem; 
-                                                margin-bottom: 0.5rem;
-                                                border-left: 3px solid {role_color};">
-                                        {'<img src="https://ddragon.leagueoflegends.com/cdn/' + ddragon_version + '/img/champion/' + champ_key + '.png" width="40" style="border-radius: 6px;">' if champ_key else '<div style="width: 40px; height: 40px; background: #475569; border-radius: 6px; display: flex; align-items: center; justify-content: center;"><span style="color: white;">?</span></div>'}
-                                        <div>
-                                            <div style="font-weight: 600; color: #f8fafc;">{champion}</div>
-                                            <div style="color: {role_color}; font-size: 0.8rem;">{player} ({role})</div>
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                            
-                            with col_sep:
-                                st.markdown(f"""
-                                <div style="text-align: center; margin-top: 3rem;">
-                                    <div style="font-size: 2rem; color: {result_color};">
-                                        {"⚔️" if game["result"] == "WIN" else "💀"}
-                                    </div>
-                                    <div style="color: #94a3b8; font-size: 0.8rem; margin-top: 0.5rem;">
-                                        VS
-                                    </div>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            
-                            with col2:
-                                st.markdown(f"""
-                                <h5 style="color: #ef4444; margin-bottom: 1rem; text-align: center;">
-                                    Enemy ({game["enemy_side"]} Side)
-                                </h5>
-                                """, unsafe_allow_html=True)
-                                
-                                # Enemy team champions
-                                for player_data in game["enemy_team"]:
-                                    champion = player_data["champion"]
-                                    player = player_data["player"]
-                                    champ_key = find_champion_key(champion, champion_data, champ_mapping)
-                                    
-                                    st.markdown(f"""
-                                    <div style="display: flex; align-items: center; gap: 1rem; 
-                                                background: rgba(51, 65, 85, 0.3); 
-                                                border-radius: 8px; 
-                                                padding: 0.75rem; 
-                                                margin-bottom: 0.5rem;
-                                                border-left: 3px solid #ef4444;">
-                                        {'<img src="https://ddragon.leagueoflegends.com/cdn/' + ddragon_version + '/img/champion/' + champ_key + '.png" width="40" style="border-radius: 6px;">' if champ_key else '<div style="width: 40px; height: 40px; background: #475569; border-radius: 6px; display: flex; align-items: center; justify-content: center;"><span style="color: white;">?</span></div>'}
-                                        <div>
-                                            <div style="font-weight: 600; color: #f8fafc;">{champion}</div>
-                                            <div style="color: #ef4444; font-size: 0.8rem;">{player}</div>
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+            render_scrim_game_browser(data)
 
 # Logout button at the end of the application - EXACTLY AS ORIGINAL
+trace.section("footer")
 st.markdown("---")
 st.markdown('<div style="text-align: center; padding: 2rem 0;">', unsafe_allow_html=True)
 if st.button("🔓 Logout", key="logout_button"):
     st.session_state.authenticated = False
+    st.session_state.admin = False
     st.rerun()
-st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+st.markdown('</div>', unsafe_allow_html=True)
+
+# Performance panel (admins only) and optional JSON-lines trace log
+finish_trace()
+if st.session_state.get("admin"):
+    render_trace_panel(trace)
+trace_log = st.secrets.get("tracing", {}).get("log_path")
+if trace_log:
+    try:
+        trace.write_jsonl(trace_log)
+    except OSError:
+        pass
\ No newline at end of file
@@ -0,0 +1,216 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Benchmarks
+#
+# Times every page computation on synthetic data in an in-memory MongoDB
+# (mongomock), or a real deployment with --uri, and writes the results to a
+# JSON baseline
+# =============================================================================
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from analytics import (
+    CALDYA_PLAYERS, build_game_summaries, build_game_table, build_participant_facts,
+    side_records, team_summary, officials_summary, objective_rates, player_profiles, player_history,
+    champion_pools, champion_pools_from_groups, parse_scrims, scrim_champion_pools, scrim_record,
+    scrim_browser_rows, build_scrim_filter_index, filter_scrim_browser
+)
+from store import (
+    CollectionSnapshot, create_client, get_projection, officials_query, find_game_summaries,
+    officials_filter_options, aggregate_champion_pools
+)
+from synthetic import generate_games, generate_players, generate_scrims
+
+DEFAULT_SCALES = [1000, 10000, 100000]
+
+# Longest acceptable page computation: the loaders were sized for a
+# five-minute refresh, and a rebuild slower than that cannot keep up with
+# data that changes as often
+CACHE_BUDGET_SECONDS = 300
+
+# Database seeded on a real deployment (dropped and recreated every run)
+DEFAULT_DATABASE = "CALDYA_benchmark"
+
+
+class Dataset:
+    """A seeded database plus the documents the page loaders would hold
+
+    The database is an in-memory mongomock one unless a connection string
+    is given.
+    """
+
+    def __init__(self, scale, seed=0, uri=None, database=DEFAULT_DATABASE):
+        self.scale = scale
+        if uri:
+            client = create_client(uri, {"read_preference": "primary", "socket_timeout_ms": None})
+            client.drop_database(database)
+            self.db = client[database]
+        else:
+            try:
+                import mongomock
+            except ImportError:
+                sys.exit("benchmark.py needs mongomock: pip install mongomock")
+            self.db = mongomock.MongoClient().CALDYA
+        self.db.CLA_Games.insert_many(generate_games(scale, seed))
+        self.db.CLA_Players.insert_many(generate_players(seed))
+        self.db.CLA_Scrims.insert_many(generate_scrims(scale, seed))
+        self.games = self.snapshot("CLA_Games", "tables", sort=("date", -1))
+        self.scrims = self.snapshot("CLA_Scrims", "draft")
+        self.facts = build_participant_facts(self.games)
+        self.scrim_tables = parse_scrims(self.scrims)
+
+    def snapshot(self, collection_name, view, sort=None):
+        collection = self.db[collection_name]
+        return CollectionSnapshot(collection, get_projection(collection_name, view), sort=sort).refresh()
+
+
+def bench_officials_list(data):
+    build_game_summaries(data.snapshot("CLA_Games", "summary", sort=("date", -1)))
+
+
+def bench_officials_search(data):
+    officials_filter_options(data.db.CLA_Games)
+    build_game_summaries(find_game_summaries(data.db.CLA_Games, officials_query(result="WIN", side="Blue")))
+
+
+def bench_load_games(data):
+    data.snapshot("CLA_Games", "tables", sort=("date", -1))
+
+
+def bench_team_stats(data):
+    team = team_summary(side_records(build_game_table(data.games)))
+    officials_summary(team)
+    objective_rates(team)
+
+
+def bench_participant_facts(data):
+    build_participant_facts(data.games)
+
+
+def bench_player_stats(data):
+    player_profiles(data.db.CLA_Players.find())
+    for player in CALDYA_PLAYERS:
+        player_history(data.facts, player)
+
+
+def bench_champion_analysis(data):
+    champion_pools(data.facts)
+
+
+def bench_champion_analysis_server(data):
+    champion_pools_from_groups(aggregate_champion_pools(data.db.CLA_Games, CALDYA_PLAYERS))
+
+
+def bench_load_scrims(data):
+    parse_scrims(data.snapshot("CLA_Scrims", "draft"))
+
+
+def bench_scrim_summary(data):
+    scrim_table, scrim_participants = data.scrim_tables
+    scrim_champion_pools(scrim_participants)
+    scrim_record(scrim_table)
+
+
+def bench_scrim_browser(data):
+    scrim_games = scrim_browser_rows(*data.scrim_tables)
+    filter_index = build_scrim_filter_index(scrim_games)
+    filter_scrim_browser(scrim_games, filter_index, result="WIN", our_side="All",
+                         our_champion="All", enemy_champion="All")
+
+
+BENCHMARKS = {
+    "officials_list": bench_officials_list,
+    "officials_search": bench_officials_search,
+    "load_games": bench_load_games,
+    "team_stats": bench_team_stats,
+    "participant_facts": bench_participant_facts,
+    "player_stats": bench_player_stats,
+    "champion_analysis": bench_champion_analysis,
+    "load_scrims": bench_load_scrims,
+    "scrim_summary": bench_scrim_summary,
+    "scrim_browser": bench_scrim_browser
+}
+
+# Aggregations run by the server; only meaningful against a real deployment,
+# since mongomock evaluates pipelines in pure Python
+SERVER_BENCHMARKS = {
+    "champion_analysis_server": bench_champion_analysis_server
+}
+
+
+def time_call(function, data, repeat):
+    """Median and best wall time of repeat calls, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data)
+        timings.append(time.perf_counter() - start)
+    return {"median": statistics.median(timings), "best": min(timings), "runs": repeat}
+
+
+def run(scales, names, repeat, seed=0, uri=None, database=DEFAULT_DATABASE):
+    benchmarks = {**BENCHMARKS, **SERVER_BENCHMARKS}
+    results = {}
+    for scale in scales:
+        start = time.perf_counter()
+        data = Dataset(scale, seed, uri, database)
+        print(f"scale {scale}: dataset ready in {time.perf_counter() - start:.1f}s")
+        results[str(scale)] = {}
+        for name in names:
+            timing = time_call(benchmarks[name], data, repeat)
+            results[str(scale)][name] = timing
+            flag = "  over cache budget" if timing["median"] > CACHE_BUDGET_SECONDS else ""
+            print(f"  {name:<26} {timing['median'] * 1000:10.1f} ms{flag}")
+    return results
+
+
+def compare(results, baseline):
+    """Print the median ratio of every benchmark present in both runs"""
+    for scale, timings in results.items():
+        for name, timing in timings.items():
+            previous = baseline.get("results", {}).get(scale, {}).get(name)
+            if previous and previous["median"] > 0:
+                ratio = timing["median"] / previous["median"]
+                print(f"{scale:>7} {name:<26} {ratio:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard computations on synthetic data")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Number of games (and scrims) per run")
+    parser.add_argument("--only", nargs="+", choices=sorted({**BENCHMARKS, **SERVER_BENCHMARKS}),
+                        help="Benchmarks to run (default: all, server-side ones only with --uri)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_baseline.json", help="Where to write the results")
+    parser.add_argument("--compare", help="Baseline JSON to compare the results against")
+    parser.add_argument("--uri", help="Seed and query a real MongoDB deployment instead of mongomock")
+    parser.add_argument("--database", default=DEFAULT_DATABASE,
+                        help="Database to seed on --uri (dropped first)")
+    args = parser.parse_args(argv)
+
+    names = args.only or list(BENCHMARKS) + (list(SERVER_BENCHMARKS) if args.uri else [])
+    if not args.uri and any(name in SERVER_BENCHMARKS for name in names):
+        parser.error("server-side benchmarks need a real deployment: pass --uri")
+    results = run(args.scales, names, args.repeat, args.seed, args.uri, args.database)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results
+        }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
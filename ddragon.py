@@ -0,0 +1,174 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Data Dragon Mirror
+#
+# Local, version-keyed copy of the ddragon files the dashboard reads
+# =============================================================================
+
+import json
+import os
+import threading
+from difflib import get_close_matches
+
+import requests
+
+DDRAGON_URL = "https://ddragon.leagueoflegends.com"
+DEFAULT_CACHE_DIR = ".ddragon_cache"
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+def normalize_champion_name(name):
+    """Lowercase alphanumerics only, e.g. Kai'Sa -> kaisa"""
+    return "".join(ch for ch in str(name).lower() if ch.isalnum())
+
+
+def _version_key(version):
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+class DataDragonMirror:
+    """On-disk mirror of versions.json and champion.json (one folder per version)
+
+    load() answers from the newest mirrored version and refreshes in a
+    background thread; only a cold mirror waits on the CDN. With offline=True
+    (or when the CDN is unreachable) the last good version is served.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, session=None, timeout=DEFAULT_TIMEOUT, offline=False):
+        self.cache_dir = cache_dir
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.offline = offline
+        self._refresh_thread = None
+        self._resolvers = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Champion data and version, refreshing the mirror in the background"""
+        version = self.local_version()
+        if version is None:
+            if self.offline:
+                raise FileNotFoundError(f"No Data Dragon mirror in {self.cache_dir}")
+            version = self.refresh()
+        elif not self.offline:
+            self.refresh_in_background()
+        return self._read_json(version, "champion.json")["data"], version
+
+    def resolver(self, version):
+        """ChampionResolver for a mirrored version, built once and kept for the process"""
+        if version not in self._resolvers:
+            self._resolvers[version] = ChampionResolver(self._read_json(version, "champion.json")["data"])
+        return self._resolvers[version]
+
+    def local_version(self):
+        """Newest version with a complete champion.json on disk"""
+        if not os.path.isdir(self.cache_dir):
+            return None
+        versions = [
+            entry for entry in os.listdir(self.cache_dir)
+            if os.path.isfile(os.path.join(self.cache_dir, entry, "champion.json"))
+        ]
+        return max(versions, key=_version_key) if versions else None
+
+    def refresh(self):
+        """Mirror the latest version from the CDN, falling back to the local one"""
+        with self._lock:
+            try:
+                versions = self._get(f"{DDRAGON_URL}/api/versions.json")
+                latest = versions[0]
+                if not os.path.isfile(self._path(latest, "champion.json")):
+                    champions = self._get(f"{DDRAGON_URL}/cdn/{latest}/data/en_US/champion.json")
+                    self._write_json(latest, "champion.json", champions)
+                self._write_json(None, "versions.json", versions)
+                return latest
+            except (requests.RequestException, ValueError, IndexError):
+                version = self.local_version()
+                if version is None:
+                    raise
+                return version
+
+    def refresh_in_background(self):
+        """Start a refresh unless one is already running"""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_quietly, daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_quietly(self):
+        try:
+            self.refresh()
+        except (requests.RequestException, ValueError, IndexError, OSError):
+            pass
+
+    def _get(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _path(self, version, filename):
+        if version is None:
+            return os.path.join(self.cache_dir, filename)
+        return os.path.join(self.cache_dir, version, filename)
+
+    def _read_json(self, version, filename):
+        with open(self._path(version, filename), encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_json(self, version, filename, data):
+        path = self._path(version, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+class ChampionResolver:
+    """Maps champion names, aliases and scrim SKIN strings to Data Dragon keys
+
+    Every name, key and normalized form is precomputed for one version (keys
+    cover ids such as "MonkeyKing" used in scrim SKIN strings). Anything else goes through a fuzzy fallback (substring, then closest
+    normalized name) whose result is memoized, so each distinct string is
+    resolved at most once.
+    """
+
+    FUZZY_CUTOFF = 0.8
+
+    def __init__(self, champions):
+        self.champions = champions
+        self.normalized = {}
+        for key, data in champions.items():
+            for alias in (data["name"], key):
+                self.normalized[normalize_champion_name(alias)] = key
+
+        self.resolved = dict(self.normalized)
+        for key, data in champions.items():
+            self.resolved[key] = key
+        for key, data in champions.items():
+            self.resolved[data["name"]] = key
+
+    def resolve(self, champion_name):
+        """Data Dragon key for a champion name, None when nothing matches"""
+        if not champion_name:
+            return None
+        try:
+            return self.resolved[champion_name]
+        except KeyError:
+            key = self._fallback(champion_name)
+            self.resolved[champion_name] = key
+            return key
+
+    def _fallback(self, champion_name):
+        normalized = normalize_champion_name(champion_name)
+        if normalized in self.normalized:
+            return self.normalized[normalized]
+
+        lowered = champion_name.lower()
+        for key, data in self.champions.items():
+            name = data["name"].lower()
+            if lowered in name or name in lowered:
+                return key
+
+        close = get_close_matches(normalized, self.normalized.keys(), n=1, cutoff=self.FUZZY_CUTOFF)
+        return self.normalized[close[0]] if close else None
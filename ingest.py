@@ -0,0 +1,216 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Maintenance Jobs
+#
+# Command-line jobs run against the database after importing games or scrims
+# =============================================================================
+
+import argparse
+import json
+import os
+import time
+
+from bson import json_util
+
+from analytics import CALDYA_PLAYERS
+from store import create_client, insert_scrims, materialize_summaries, upsert_games
+
+
+# Characters that can continue a JSON number
+NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+
+class InvalidDocument(ValueError):
+    """A document that cannot be imported"""
+
+
+def get_db(uri):
+    """CALDYA database for a connection string
+
+    Jobs write and read back their own writes, so they read from the primary
+    and allow long-running aggregations.
+    """
+    return create_client(uri, {"read_preference": "primary", "socket_timeout_ms": None}).CALDYA
+
+
+def iter_json_values(f, chunk_size=1 << 20):
+    """Decode a top-level JSON array, or concatenated/JSON-lines values, one element at a time
+
+    Only the element being decoded and one read chunk are held in memory, so
+    export files of any size stream in constant memory.
+    """
+    decoder = json.JSONDecoder(object_hook=json_util.object_hook)
+    buffer = ""
+    started = False
+    eof = False
+    while True:
+        buffer = buffer.lstrip(" \t\r\n,")
+        if not started and buffer.startswith("["):
+            buffer = buffer[1:]
+            started = True
+            continue
+        if buffer.startswith("]"):
+            return
+        if buffer:
+            try:
+                value, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value ending exactly at the buffer edge may be cut short,
+                # and so may a number followed by more number characters
+                # ("-6" of "-6.25e3" split after the 6)
+                cut = end == len(buffer) or (
+                    isinstance(value, (int, float)) and buffer[end] in NUMBER_CHARACTERS
+                )
+                if not cut or eof:
+                    started = True
+                    buffer = buffer[end:]
+                    yield value
+                    continue
+        elif eof:
+            return
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+
+def read_documents(path):
+    """Documents from JSON or JSON-lines files, or a directory of them"""
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith((".json", ".jsonl")):
+                yield from read_documents(os.path.join(path, name))
+        return
+
+    with open(path, encoding="utf-8") as f:
+        yield from iter_json_values(f)
+
+
+def valid_documents(path, validate, counts):
+    """Stream the documents that pass validate(), counting reads and rejections"""
+    for position, document in enumerate(read_documents(path), start=1):
+        counts["read"] += 1
+        try:
+            yield validate(document)
+        except InvalidDocument as e:
+            counts["rejected"] += 1
+            print(f"Skipping document {position}: {e}")
+
+
+def validate_game(game):
+    """Raise InvalidDocument unless the fields the dashboard relies on are present"""
+    if not isinstance(game, dict):
+        raise InvalidDocument("not a JSON object")
+    for field in ("date", "Caldya_side", "Caldya_id", "final_items"):
+        if game.get(field) is None:
+            raise InvalidDocument(f"missing {field}")
+    if str(game["Caldya_side"]).lower() not in ("blue", "red"):
+        raise InvalidDocument(f"unknown Caldya_side {game['Caldya_side']!r}")
+    if not isinstance(game["final_items"], dict):
+        raise InvalidDocument("final_items is not an object")
+    return game
+
+
+def validate_scrim(scrim):
+    """Raise InvalidDocument unless the replay participant fields are present"""
+    if not isinstance(scrim, dict):
+        raise InvalidDocument("not a JSON object")
+    participants = scrim.get("participants")
+    if not isinstance(participants, list) or not participants:
+        raise InvalidDocument("no participants")
+    for participant in participants:
+        for field in ("RIOT_ID_GAME_NAME", "SKIN", "WIN", "TEAM"):
+            if not isinstance(participant, dict) or field not in participant:
+                raise InvalidDocument(f"participant without {field}")
+    return scrim
+
+
+def report(kind, counts, elapsed, **written):
+    rate = counts["read"] / elapsed if elapsed > 0 else 0
+    details = ", ".join(f"{count} {label}" for label, count in written.items())
+    print(f"{counts['read']} {kind} read in {elapsed:.2f}s ({rate:.0f}/s): {details}, {counts['rejected']} rejected")
+
+
+def import_games(db, args):
+    counts = {"read": 0, "rejected": 0}
+    start = time.perf_counter()
+    games = valid_documents(args.path, validate_game, counts)
+    inserted, updated, removed = upsert_games(db.CLA_Games, games, batch_size=args.batch_size)
+    report("games", counts, time.perf_counter() - start, new=inserted, updated=updated)
+    if removed:
+        print(f"Removed {removed} stored duplicate game(s)")
+
+    if args.materialize:
+        # Updated and removed games were already folded into the summaries, so start over
+        materialize_summaries(db, CALDYA_PLAYERS, rebuild=updated > 0 or removed > 0)
+
+
+def import_scrims(db, args):
+    counts = {"read": 0, "rejected": 0}
+    start = time.perf_counter()
+    scrims = valid_documents(args.path, validate_scrim, counts)
+    inserted, duplicates, removed = insert_scrims(db.CLA_Scrims, scrims, batch_size=args.batch_size)
+    report("scrims", counts, time.perf_counter() - start, new=inserted, duplicates=duplicates)
+    if removed:
+        print(f"Removed {removed} stored duplicate scrim(s)")
+
+    if args.materialize:
+        # Removed scrims were already folded into the summaries, so start over
+        materialize_summaries(db, CALDYA_PLAYERS, rebuild=removed > 0)
+
+
+def materialize(db, args):
+    updated = materialize_summaries(db, CALDYA_PLAYERS, rebuild=args.rebuild)
+    print(f"Summaries updated from {updated} source collection(s)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="CALDYA data maintenance jobs")
+    parser.add_argument(
+        "--uri", default=os.environ.get("MONGODB_URI"),
+        help="MongoDB connection string (default: $MONGODB_URI)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    materialize_parser = commands.add_parser(
+        "materialize", help="Fold new games and scrims into the summary collections"
+    )
+    materialize_parser.add_argument(
+        "--rebuild", action="store_true",
+        help="Recompute the summaries from scratch (after editing or deleting documents)"
+    )
+    materialize_parser.set_defaults(run=materialize)
+
+    games_parser = commands.add_parser(
+        "import-games", help="Insert or update official games in CLA_Games"
+    )
+    games_parser.add_argument("path", help="JSON-lines file, JSON file or directory of JSON files")
+    games_parser.add_argument("--batch-size", type=int, default=1000, help="Documents per bulk_write")
+    games_parser.add_argument(
+        "--materialize", action="store_true", help="Update the summary collections afterwards"
+    )
+    games_parser.set_defaults(run=import_games)
+
+    scrims_parser = commands.add_parser(
+        "import-scrims", help="Insert scrim replay exports into CLA_Scrims, skipping duplicates"
+    )
+    scrims_parser.add_argument("path", help="JSON-lines file, JSON file or directory of JSON files")
+    scrims_parser.add_argument("--batch-size", type=int, default=500, help="Documents per insert_many")
+    scrims_parser.add_argument(
+        "--materialize", action="store_true", help="Update the summary collections afterwards"
+    )
+    scrims_parser.set_defaults(run=import_scrims)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.uri:
+        parser.error("no connection string: pass --uri or set MONGODB_URI")
+    args.run(get_db(args.uri), args)
+
+
+if __name__ == "__main__":
+    main()
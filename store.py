@@ -0,0 +1,853 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Data Access
+#
+# MongoDB reads shared by the dashboard and the maintenance scripts
+# =============================================================================
+
+import hashlib
+import importlib.util
+import logging
+import threading
+import time
+from datetime import timedelta
+
+import pyarrow as pa
+import pymongo
+from bson import ObjectId, json_util
+from pymongo import ReadPreference, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from analytics import SCRIM_NAME_PREFIXES, game_champion_fields, game_key
+
+logger = logging.getLogger(__name__)
+
+# MongoClient options settable from a settings mapping (the [database]
+# secrets), as setting -> (MongoClient keyword, default)
+CLIENT_OPTIONS = {
+    "max_pool_size": ("maxPoolSize", 20),
+    "min_pool_size": ("minPoolSize", 2),
+    "max_idle_time_ms": ("maxIdleTimeMS", 300000),
+    "compressors": ("compressors", "zstd,snappy,zlib"),
+    "zlib_compression_level": ("zlibCompressionLevel", 6),
+    "server_selection_timeout_ms": ("serverSelectionTimeoutMS", 5000),
+    "connect_timeout_ms": ("connectTimeoutMS", 5000),
+    "socket_timeout_ms": ("socketTimeoutMS", 60000),
+    "read_preference": ("readPreference", "secondaryPreferred"),
+    "app_name": ("appname", "caldya-dashboard")
+}
+
+# Python package each wire compressor needs (zlib is in the standard library)
+COMPRESSOR_PACKAGES = {
+    "zstd": "zstandard",
+    "snappy": "snappy",
+    "zlib": None
+}
+
+# Fields each view reads, per collection and view name
+PROJECTIONS = {
+    "CLA_Games": {
+        # List and filter views
+        "summary": {
+            "date": 1,
+            "opponent_team.name": 1,
+            "win": 1,
+            "Caldya_side": 1,
+            "Caldya_id": 1,
+            "game_duration": 1
+        },
+        # Normalized game and participant tables
+        "tables": {
+            "date": 1,
+            "opponent_team.name": 1,
+            "win": 1,
+            "Caldya_side": 1,
+            "Caldya_id": 1,
+            "game_duration": 1,
+            "final_items": 1,
+            "player_data": 1,
+            "player_positions": 1,
+            "objectives.blue_team.objectives": 1,
+            "objectives.red_team.objectives": 1
+        }
+    },
+    "CLA_Scrims": {
+        # Drafts and results (champion pools, summary, game browser)
+        "draft": {
+            "participants.RIOT_ID_GAME_NAME": 1,
+            "participants.SKIN": 1,
+            "participants.WIN": 1,
+            "participants.TEAM": 1
+        }
+    }
+}
+
+
+# Arrow types of the fields find_arrow() decodes, per collection and view
+# (the same fields as the matching PROJECTIONS entry)
+ARROW_FIELDS = {
+    "CLA_Scrims": {
+        "draft": {
+            "participants": pa.list_(pa.struct([
+                ("RIOT_ID_GAME_NAME", pa.string()),
+                ("SKIN", pa.string()),
+                ("WIN", pa.string()),
+                ("TEAM", pa.int64())
+            ]))
+        }
+    }
+}
+
+
+# Field stamped on every write that modifies existing documents, per collection
+UPDATED_FIELDS = {
+    "CLA_Games": "updated_at",
+    "CLA_Summary_State": "updated_at"
+}
+
+
+# Indexes behind the server-side Officials filters
+GAME_INDEXES = [
+    [("date", -1)],
+    [("opponent_team.name", 1)],
+    [("Caldya_side", 1)],
+    [("win", 1)],
+    [("allied_champions", 1)],
+    [("enemy_champions", 1)],
+    [("updated_at", -1)]
+]
+
+
+# Materialized summary collections kept by materialize_summaries()
+SUMMARY_COLLECTIONS = {
+    "team": "CLA_Summary_Team",
+    "champions": "CLA_Summary_Champions",
+    "scrims": "CLA_Summary_Scrims",
+    "scrim_champions": "CLA_Summary_ScrimChampions"
+}
+
+# Last source _id folded into the summaries, one document per source collection
+SUMMARY_STATE = "CLA_Summary_State"
+
+
+def available_compressors(compressors):
+    """The compressors of a comma-separated list whose package is installed, in order"""
+    names = [name.strip() for name in compressors.split(",") if name.strip()]
+    return ",".join(
+        name for name in names
+        if name in COMPRESSOR_PACKAGES
+        and (COMPRESSOR_PACKAGES[name] is None or importlib.util.find_spec(COMPRESSOR_PACKAGES[name]))
+    )
+
+
+def create_client(uri, settings=None):
+    """MongoClient for a connection string, tuned by CLIENT_OPTIONS settings
+
+    Unset settings take their CLIENT_OPTIONS default; a setting of None
+    leaves the driver default. Compressors whose package is missing are
+    dropped with a warning, so the server negotiates among the ones that
+    can be used.
+    """
+    settings = settings or {}
+    options = {}
+    for setting, (keyword, default) in CLIENT_OPTIONS.items():
+        value = settings.get(setting, default)
+        if value is not None:
+            options[keyword] = value
+    if "compressors" in options:
+        requested = [name.strip() for name in options["compressors"].split(",") if name.strip()]
+        options["compressors"] = available_compressors(options["compressors"])
+        dropped = [name for name in requested if name not in options["compressors"].split(",")]
+        if dropped:
+            logger.warning("Wire compressors dropped: %s", ", ".join(
+                f"{name} (no {COMPRESSOR_PACKAGES[name]} module)" if name in COMPRESSOR_PACKAGES else f"{name} (unknown)"
+                for name in dropped
+            ))
+        if not options["compressors"]:
+            del options["compressors"]
+    return pymongo.MongoClient(uri, **options)
+
+
+def check_connection(client):
+    """Ping the deployment; returns the round trip in seconds, raises PyMongoError when unreachable"""
+    start = time.perf_counter()
+    client.admin.command("ping")
+    return time.perf_counter() - start
+
+
+def get_projection(collection_name, view):
+    """Projection registered for a view, None (all fields) when there is none"""
+    return PROJECTIONS.get(collection_name, {}).get(view)
+
+
+def find_arrow(collection, view):
+    """Every document of a view decoded straight into a pyarrow Table, in _id order
+
+    Uses pymongoarrow with the ARROW_FIELDS schema, so no per-document dicts
+    are built; only the schema's fields are read (no _id). Read from the
+    primary, like snapshots. Returns None when pymongoarrow is not installed
+    or the view has no schema.
+    """
+    fields = ARROW_FIELDS.get(collection.name, {}).get(view)
+    if fields is None:
+        return None
+    try:
+        from pymongoarrow.api import Schema, find_arrow_all
+    except ImportError:
+        return None
+    return find_arrow_all(on_primary(collection), {}, schema=Schema(fields), sort=[("_id", 1)])
+
+
+def document_id(doc_id):
+    """Turn the string ids used by the pages back into the stored _id"""
+    if isinstance(doc_id, str) and ObjectId.is_valid(doc_id):
+        return ObjectId(doc_id)
+    return doc_id
+
+
+def find_by_id(collection, doc_id, projection=None):
+    """Fetch a single document by _id"""
+    return collection.find_one({"_id": document_id(doc_id)}, projection)
+
+
+def on_primary(collection):
+    """The collection read from the primary, whatever the client's read preference
+
+    Data versions and the finds cached under them must see the same
+    writes; secondaries lag by different amounts, so a token probed on one
+    could tag data read from another. Aggregations keep the client's read
+    preference.
+    """
+    return collection.with_options(read_preference=ReadPreference.PRIMARY)
+
+
+def data_version(collection, updated_field=None):
+    """Cheap change token: document count, highest _id and latest update stamp
+
+    Inserts move the count and the highest _id, deletes the count and
+    in-place updates the updated_field stamp (when the collection has one).
+    Probed on the primary.
+    """
+    collection = on_primary(collection)
+    last = collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+    version = (collection.estimated_document_count(), str(last["_id"]) if last else None)
+    if updated_field:
+        latest = collection.find_one({updated_field: {"$exists": True}}, {updated_field: 1}, sort=[(updated_field, -1)])
+        version += (str(latest[updated_field]) if latest else None,)
+    return version
+
+
+class CollectionSnapshot:
+    """In-memory copy of a collection kept current with incremental syncs
+
+    The first refresh reads the whole collection. Later refreshes drain a
+    change stream when the deployment supports one, otherwise they only fetch
+    documents whose _id is above the last seen watermark, or whose
+    updated_field stamp is newer than the last one seen. A document count
+    that differs from the snapshot size afterwards (deletes, or inserts below
+    the watermark) forces a full reload. All reads go to the primary, which
+    data_version() probes too.
+    """
+
+    def __init__(self, collection, projection=None, sort=None, use_change_stream=True, updated_field=None):
+        if projection and updated_field and any(projection.values()):
+            projection = {**projection, updated_field: 1}
+        self.collection = on_primary(collection)
+        self.projection = projection
+        self.sort = sort
+        self.use_change_stream = use_change_stream
+        self.updated_field = updated_field
+        self.documents = {}
+        self.watermark = None
+        self.updated_watermark = None
+        self.loaded = False
+        self._stream = None
+        self._ordered = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Bring the snapshot up to date and return its documents"""
+        with self._lock:
+            if not self.loaded:
+                self._full_load()
+            elif not self._drain_change_stream():
+                self._fetch_delta()
+            return self.snapshot()
+
+    def snapshot(self):
+        """Documents in the configured sort order"""
+        if self._ordered is None:
+            documents = list(self.documents.values())
+            if self.sort:
+                field, direction = self.sort
+                documents.sort(key=lambda doc: (doc.get(field) is not None, doc.get(field) or ""), reverse=direction < 0)
+            self._ordered = documents
+        return self._ordered
+
+    def _full_load(self):
+        self._open_change_stream()
+        self.documents = {}
+        self.watermark = None
+        self.updated_watermark = None
+        self._ordered = None
+        self._merge(self.collection.find({}, self.projection).sort("_id", 1))
+        self.loaded = True
+
+    def _fetch_delta(self):
+        clauses = []
+        if self.watermark is not None:
+            clauses.append({"_id": {"$gt": self.watermark}})
+        if self.updated_watermark is not None:
+            clauses.append({self.updated_field: {"$gt": self.updated_watermark}})
+        query = {"$or": clauses} if len(clauses) > 1 else (clauses[0] if clauses else {})
+        self._merge(self.collection.find(query, self.projection).sort("_id", 1))
+        # Deletes, and inserts whose _id sorts below the watermark (ObjectIds
+        # generated by another writer's clock), leave the count out of step
+        if self.collection.estimated_document_count() != len(self.documents):
+            self._full_load()
+
+    def _merge(self, documents):
+        for doc in documents:
+            self.documents[doc["_id"]] = doc
+            if self.watermark is None or doc["_id"] > self.watermark:
+                self.watermark = doc["_id"]
+            updated = doc.get(self.updated_field) if self.updated_field else None
+            if updated is not None and (self.updated_watermark is None or updated > self.updated_watermark):
+                self.updated_watermark = updated
+            self._ordered = None
+
+    def _open_change_stream(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        # In-memory stand-ins used by the scripts have no watch()
+        if not self.use_change_stream or not hasattr(type(self.collection), "watch"):
+            return
+        try:
+            self._stream = self.collection.watch(_stream_pipeline(self.projection), full_document="updateLookup")
+        except PyMongoError:
+            # Standalone servers have no change streams
+            self.use_change_stream = False
+
+    def _drain_change_stream(self):
+        if self._stream is None:
+            return False
+        try:
+            while True:
+                event = self._stream.try_next()
+                if event is None:
+                    return True
+                self._apply_event(event)
+        except PyMongoError:
+            self._full_load()
+            return True
+
+    def _apply_event(self, event):
+        operation = event.get("operationType")
+        if operation in ("insert", "replace", "update"):
+            doc = event.get("fullDocument")
+            if doc is not None:
+                self._merge([doc])
+        elif operation == "delete":
+            self.documents.pop(event["documentKey"]["_id"], None)
+            self._ordered = None
+        elif operation in ("drop", "rename", "dropDatabase", "invalidate"):
+            self._full_load()
+
+
+def _stream_pipeline(projection):
+    """Change stream pipeline applying a find() projection to fullDocument"""
+    if not projection:
+        return []
+    stage = {f"fullDocument.{field}": value for field, value in projection.items() if field != "_id"}
+    if any(stage.values()):
+        stage.update({"operationType": 1, "documentKey": 1, "fullDocument._id": 1})
+    return [{"$project": stage}]
+
+
+def champion_pools_pipeline(roster):
+    """Aggregation computing champion records per Caldya role and for opponents
+
+    Unwinds final_items, keeps roster players on the Caldya team (grouped by
+    role) and everyone on the other team (role null, wins counted from the
+    opponent's point of view).
+    """
+    role_branches = [
+        {"case": {"$eq": [{"$toUpper": "$pick.k"}, name.upper()]}, "then": role}
+        for name, role in roster.items()
+    ]
+    return [
+        {"$match": {"final_items": {"$type": "object"}}},
+        {"$project": {
+            "_id": 0,
+            "won": {"$cond": [{"$ifNull": ["$win", False]}, 1, 0]},
+            "caldya_id": {"$ifNull": ["$Caldya_id", None]},
+            "pick": {"$objectToArray": "$final_items"}
+        }},
+        {"$unwind": "$pick"},
+        {"$project": {
+            "won": 1,
+            "champion": {"$ifNull": ["$pick.v.champion", "Unknown"]},
+            "ally": {"$eq": [{"$ifNull": ["$pick.v.team_id", None]}, "$caldya_id"]},
+            "role": {"$switch": {"branches": role_branches, "default": None}}
+        }},
+        {"$match": {"$or": [{"ally": False}, {"role": {"$ne": None}}]}},
+        {"$group": {
+            "_id": {
+                "role": {"$cond": ["$ally", "$role", None]},
+                "champion": "$champion"
+            },
+            "games": {"$sum": 1},
+            "wins": {"$sum": {"$cond": ["$ally", "$won", {"$subtract": [1, "$won"]}]}}
+        }}
+    ]
+
+
+def aggregate_champion_pools(collection, roster):
+    """Run champion_pools_pipeline() server-side and return the grouped counters"""
+    return list(collection.aggregate(champion_pools_pipeline(roster)))
+
+
+def backfill_champion_fields(collection, batch_size=500):
+    """Store allied/enemy champion arrays on games written without them"""
+    updates = []
+    for game in collection.find({"allied_champions": {"$exists": False}}, {"Caldya_id": 1, "final_items": 1}):
+        updates.append(UpdateOne(
+            {"_id": game["_id"]}, {"$set": game_champion_fields(game), "$currentDate": {"updated_at": True}}
+        ))
+        if len(updates) >= batch_size:
+            collection.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+
+
+def normalize_game_sides(collection, batch_size=500):
+    """Lowercase Caldya_side on games written as e.g. "Blue" or "RED" (officials_query() matches "blue"/"red")
+
+    Only values that lowercase to a known side are touched; anything else
+    (empty, "Blue Side", ...) is left as it is rather than rewritten on
+    every pass.
+    """
+    updates = []
+    query = {"Caldya_side": {"$regex": "^(blue|red)$", "$options": "i", "$nin": ["blue", "red"]}}
+    for game in collection.find(query, {"Caldya_side": 1}):
+        side = game["Caldya_side"]
+        if side.lower() == side:
+            continue
+        updates.append(UpdateOne(
+            {"_id": game["_id"], "Caldya_side": side},
+            {"$set": {"Caldya_side": side.lower()}, "$currentDate": {"updated_at": True}}
+        ))
+        if len(updates) >= batch_size:
+            collection.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+
+
+def backfill_game_fields(collection):
+    """Bring games written by other tools in line with what the Officials filters query
+
+    Stamps updated_at on every game it changes, so data versions and
+    snapshots pick the changes up; a second pass changes nothing.
+    """
+    backfill_champion_fields(collection)
+    normalize_game_sides(collection)
+
+
+def backfill_game_keys(collection, batch_size=500):
+    """Store game_id on games imported before keys existed"""
+    projection = {"date": 1, "opponent_team.name": 1, "Caldya_side": 1, "game_duration": 1, "final_items": 1}
+    updates = []
+    for game in collection.find({"game_id": {"$exists": False}}, projection):
+        updates.append(UpdateOne({"_id": game["_id"]}, {"$set": {"game_id": game_key(game)}}))
+        if len(updates) >= batch_size:
+            collection.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+
+
+def remove_duplicates(collection, field, batch_size=1000):
+    """Delete all but the lowest-_id document of every group sharing a value of field
+
+    Run before building a unique index on field, which fails while stored
+    documents collide. Returns the number of documents deleted.
+    """
+    duplicates = []
+    for group in collection.aggregate([
+        {"$match": {field: {"$exists": True}}},
+        {"$group": {"_id": f"${field}", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}}
+    ], allowDiskUse=True):
+        duplicates.extend(sorted(group["ids"])[1:])
+    for start in range(0, len(duplicates), batch_size):
+        collection.delete_many({"_id": {"$in": duplicates[start:start + batch_size]}})
+    return len(duplicates)
+
+
+def game_content_hash(game):
+    """SHA-256 of an imported game's content (everything but _id and the stored bookkeeping fields)"""
+    content = {key: value for key, value in game.items() if key not in ("_id", "content_hash", "updated_at")}
+    return hashlib.sha256(json_util.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def upsert_games(collection, games, batch_size=1000):
+    """Insert or update games keyed by analytics.game_key(), in unordered batches
+
+    Documents keep their stored _id; the allied/enemy champion arrays are
+    set on the way in. The stored content_hash of every batch is fetched
+    first, so only new or changed games are written, stamped with the
+    server's clock ($currentDate updated_at) to keep the snapshot watermark
+    monotonic. Stored games sharing a game_id are collapsed to the first
+    one before the unique index is built. Returns (inserted, updated,
+    removed) counts.
+    """
+    backfill_game_keys(collection)
+    removed = remove_duplicates(collection, "game_id")
+    collection.create_index(
+        "game_id", unique=True, partialFilterExpression={"game_id": {"$exists": True}}
+    )
+    inserted = updated = 0
+    batch = {}
+
+    def flush():
+        nonlocal inserted, updated
+        stored = {
+            doc["game_id"]: doc.get("content_hash")
+            for doc in collection.find({"game_id": {"$in": list(batch)}}, {"game_id": 1, "content_hash": 1})
+        }
+        writes = [
+            UpdateOne({"game_id": game_id}, {"$set": fields, "$currentDate": {"updated_at": True}}, upsert=True)
+            for game_id, fields in batch.items()
+            if stored.get(game_id) != fields["content_hash"]
+        ]
+        batch.clear()
+        if not writes:
+            return
+        try:
+            result = collection.bulk_write(writes, ordered=False)
+            inserted += result.upserted_count
+            updated += result.modified_count
+        except BulkWriteError as e:
+            # Another writer inserted the same game between the lookup and the upsert
+            if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                raise
+            inserted += e.details.get("nUpserted", 0)
+            updated += e.details.get("nModified", 0)
+
+    for game in games:
+        fields = {key: value for key, value in game.items() if key not in ("_id", "updated_at")}
+        if isinstance(fields.get("Caldya_side"), str):
+            fields["Caldya_side"] = fields["Caldya_side"].lower()
+        fields["game_id"] = game_key(game)
+        fields.update(game_champion_fields(game))
+        fields["content_hash"] = game_content_hash(fields)
+        # A game repeated within a batch is written once, with its last content
+        batch[fields["game_id"]] = fields
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return inserted, updated, removed
+
+
+def scrim_content_hash(scrim):
+    """SHA-256 of a scrim's content (everything but _id and the hash itself)"""
+    content = {key: value for key, value in scrim.items() if key not in ("_id", "content_hash")}
+    return hashlib.sha256(json_util.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def backfill_scrim_hashes(collection, batch_size=500):
+    """Store content_hash on scrims uploaded before hashes existed"""
+    updates = []
+    for scrim in collection.find({"content_hash": {"$exists": False}}):
+        updates.append(UpdateOne({"_id": scrim["_id"]}, {"$set": {"content_hash": scrim_content_hash(scrim)}}))
+        if len(updates) >= batch_size:
+            collection.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+
+
+def insert_scrims(collection, scrims, batch_size=500):
+    """Insert scrims in unordered batches, skipping any whose content is already stored
+
+    A unique index on content_hash rejects duplicates, whether they come from
+    an earlier upload or appear twice in the same one. Copies already stored
+    (from uploads made before the index existed) are collapsed to the first
+    one before the index is built. Returns (inserted, duplicates, removed)
+    counts.
+    """
+    backfill_scrim_hashes(collection)
+    removed = remove_duplicates(collection, "content_hash")
+    collection.create_index(
+        "content_hash", unique=True, partialFilterExpression={"content_hash": {"$exists": True}}
+    )
+    inserted = duplicates = 0
+    batch = []
+
+    def flush():
+        nonlocal inserted, duplicates
+        try:
+            inserted += len(collection.insert_many(batch, ordered=False).inserted_ids)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != 11000 for error in errors):
+                raise
+            duplicates += len(errors)
+            inserted += e.details.get("nInserted", 0)
+        batch.clear()
+
+    for scrim in scrims:
+        scrim = {key: value for key, value in scrim.items() if key != "_id"}
+        scrim["content_hash"] = scrim_content_hash(scrim)
+        batch.append(scrim)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return inserted, duplicates, removed
+
+
+def ensure_game_indexes(collection):
+    """Create the CLA_Games indexes used by officials_query()"""
+    backfill_game_fields(collection)
+    for keys in GAME_INDEXES:
+        collection.create_index(keys)
+
+
+def officials_query(date_range=None, result="All", side="All", opponent="All",
+                    allied_champion="All", enemy_champion="All"):
+    """Translate the Officials filter panel into a CLA_Games query"""
+    query = {}
+    if date_range and len(date_range) == 2:
+        start_date, end_date = date_range
+        query["date"] = {"$gte": str(start_date), "$lt": str(end_date + timedelta(days=1))}
+    if result != "All":
+        query["win"] = True if result == "WIN" else {"$ne": True}
+    if side != "All":
+        query["Caldya_side"] = side.lower()
+    if opponent != "All":
+        query["opponent_team.name"] = {"$in": [None, opponent]} if opponent == "Unknown" else opponent
+    if allied_champion != "All":
+        query["allied_champions"] = allied_champion
+    if enemy_champion != "All":
+        query["enemy_champions"] = enemy_champion
+    return query
+
+
+def find_game_summaries(collection, query):
+    """Summary fields of the games matching query, most recent first"""
+    return list(collection.find(query, get_projection("CLA_Games", "summary")).sort("date", -1))
+
+
+def officials_filter_options(collection):
+    """Values offered by the Officials filter panel"""
+    first = collection.find_one({"date": {"$ne": None}}, {"date": 1}, sort=[("date", 1)])
+    last = collection.find_one({"date": {"$ne": None}}, {"date": 1}, sort=[("date", -1)])
+    opponents = {name for name in collection.distinct("opponent_team.name") if name is not None}
+    if collection.find_one({"opponent_team.name": None}, {"_id": 1}):
+        opponents.add("Unknown")
+    return {
+        "min_date": first["date"] if first else "",
+        "max_date": last["date"] if last else "",
+        "opponents": sorted(opponents),
+        "allied_champions": sorted(collection.distinct("allied_champions")),
+        "enemy_champions": sorted(collection.distinct("enemy_champions"))
+    }
+
+
+def _first_taken(objective):
+    return {"$cond": [{"$ifNull": [f"$caldya.{objective}.first", False]}, 1, 0]}
+
+
+def team_summary_pipeline():
+    """Aggregation computing per-side records and objective counters for Caldya
+
+    Mirrors analytics.side_records(): one group per side with game and win
+    counts, dragon/baron totals and first-objective games and wins.
+    """
+    first_objectives = {"first_dragon": "dragon", "first_baron": "baron", "first_herald": "riftHerald"}
+    counters = {
+        "games": {"$sum": 1},
+        "wins": {"$sum": "$won"},
+        "dragons": {"$sum": {"$ifNull": ["$caldya.dragon.kills", 0]}},
+        "barons": {"$sum": {"$ifNull": ["$caldya.baron.kills", 0]}}
+    }
+    for name, objective in first_objectives.items():
+        counters[f"{name}_games"] = {"$sum": _first_taken(objective)}
+        counters[f"{name}_wins"] = {"$sum": {"$multiply": [_first_taken(objective), "$won"]}}
+    return [
+        {"$project": {
+            "_id": 0,
+            "won": {"$cond": [{"$ifNull": ["$win", False]}, 1, 0]},
+            "side": {"$toLower": {"$ifNull": ["$Caldya_side", ""]}},
+            "objectives": 1
+        }},
+        {"$project": {
+            "won": 1,
+            "side": {"$toUpper": "$side"},
+            "caldya": {"$ifNull": [{"$switch": {
+                "branches": [
+                    {"case": {"$eq": ["$side", side]}, "then": f"$objectives.{side}_team.objectives"}
+                    for side in ("blue", "red")
+                ],
+                "default": {}
+            }}, {}]}
+        }},
+        {"$group": {"_id": "$side", **counters}}
+    ]
+
+
+def _clean_scrim_name_expr(name):
+    """Server-side analytics.clean_scrim_name()"""
+    expr = name
+    for prefix in reversed(SCRIM_NAME_PREFIXES):
+        expr = {"$cond": [
+            {"$eq": [{"$substrCP": [name, 0, len(prefix)]}, prefix]},
+            {"$substrCP": [name, len(prefix), {"$strLenCP": name}]},
+            expr
+        ]}
+    return expr
+
+
+def _scrim_teams_stages(roster):
+    """Clean participant names and find our team (that of the first roster player)"""
+    names = list(roster)
+    return [
+        {"$project": {
+            "_id": 0,
+            "participants": {"$map": {
+                "input": {"$ifNull": ["$participants", []]},
+                "as": "p",
+                "in": {"$let": {
+                    "vars": {"player": _clean_scrim_name_expr({"$ifNull": ["$$p.RIOT_ID_GAME_NAME", ""]})},
+                    "in": {
+                        "player": "$$player",
+                        "roster": {"$in": ["$$player", names]},
+                        "champion": {"$ifNull": ["$$p.SKIN", ""]},
+                        "win": {"$ifNull": ["$$p.WIN", ""]},
+                        "team": {"$ifNull": ["$$p.TEAM", None]}
+                    }
+                }}
+            }}
+        }},
+        {"$set": {"our_team": {"$ifNull": [{"$arrayElemAt": [
+            {"$map": {
+                "input": {"$filter": {"input": "$participants", "as": "p", "cond": "$$p.roster"}},
+                "as": "p",
+                "in": "$$p.team"
+            }},
+            0
+        ]}, None]}}}
+    ]
+
+
+def scrim_record_pipeline(roster):
+    """Aggregation computing analytics.scrim_record() as a single document"""
+    return _scrim_teams_stages(roster) + [
+        {"$project": {
+            "has_team": {"$cond": ["$our_team", 1, 0]},
+            "won": {"$cond": [{"$in": [True, {"$map": {
+                "input": "$participants",
+                "as": "p",
+                "in": {"$and": ["$$p.roster", {"$eq": ["$$p.team", "$our_team"]}, {"$eq": ["$$p.win", "Win"]}]}
+            }}]}, 1, 0]}
+        }},
+        {"$group": {
+            "_id": "record",
+            "scrims": {"$sum": 1},
+            "games": {"$sum": "$has_team"},
+            "wins": {"$sum": {"$multiply": ["$has_team", "$won"]}}
+        }}
+    ]
+
+
+def scrim_champion_pools_pipeline(roster):
+    """Aggregation computing analytics.scrim_champion_pools() as role/champion groups"""
+    role_branches = [
+        {"case": {"$eq": ["$participants.player", name]}, "then": role}
+        for name, role in roster.items()
+    ]
+    return _scrim_teams_stages(roster) + [
+        {"$unwind": "$participants"},
+        {"$match": {"participants.roster": True, "$expr": {"$eq": ["$participants.team", "$our_team"]}}},
+        {"$group": {
+            "_id": {
+                "role": {"$switch": {"branches": role_branches, "default": None}},
+                "champion": "$participants.champion"
+            },
+            "games": {"$sum": 1},
+            "wins": {"$sum": {"$cond": [{"$eq": ["$participants.win", "Win"]}, 1, 0]}}
+        }}
+    ]
+
+
+def _accumulate_into(collection_name, group_stage):
+    """$merge stage adding a run's group counters onto the stored ones"""
+    counters = [field for field in group_stage["$group"] if field != "_id"]
+    return {"$merge": {
+        "into": collection_name,
+        "on": "_id",
+        "whenMatched": [{"$set": {field: {"$add": [f"${field}", f"$$new.{field}"]} for field in counters}}],
+        "whenNotMatched": "insert"
+    }}
+
+
+def summary_jobs(roster):
+    """Pipelines feeding each summary collection, per source collection"""
+    return {
+        "CLA_Games": {
+            "team": team_summary_pipeline(),
+            "champions": champion_pools_pipeline(roster)
+        },
+        "CLA_Scrims": {
+            "scrims": scrim_record_pipeline(roster),
+            "scrim_champions": scrim_champion_pools_pipeline(roster)
+        }
+    }
+
+
+def materialize_summaries(db, roster, rebuild=False):
+    """Fold documents added since the last run into the summary collections
+
+    Every source collection is processed up to its current highest _id and
+    that _id is recorded in SUMMARY_STATE, so reruns after an import only
+    aggregate the new documents and add their counters with $merge. Use
+    rebuild=True after editing or deleting existing documents. Returns the
+    number of source collections that had new documents.
+    """
+    state = db[SUMMARY_STATE]
+    if rebuild:
+        for name in SUMMARY_COLLECTIONS.values():
+            db.drop_collection(name)
+        state.delete_many({})
+
+    updated = 0
+    for source, pipelines in summary_jobs(roster).items():
+        collection = db[source]
+        last = collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+        if last is None:
+            continue
+        window = {"$lte": last["_id"]}
+        previous = state.find_one({"_id": source})
+        if previous is not None:
+            if previous["watermark"] >= last["_id"]:
+                continue
+            window["$gt"] = previous["watermark"]
+
+        for summary, pipeline in pipelines.items():
+            collection.aggregate(
+                [{"$match": {"_id": window}}] + pipeline + [_accumulate_into(SUMMARY_COLLECTIONS[summary], pipeline[-1])]
+            )
+        state.update_one(
+            {"_id": source}, {"$set": {"watermark": last["_id"]}, "$currentDate": {"updated_at": True}}, upsert=True
+        )
+        updated += 1
+    return updated
+
+
+def read_summary(db, summary):
+    """Documents of a materialized summary collection, read from the primary (like SUMMARY_STATE versions)"""
+    return list(on_primary(db[SUMMARY_COLLECTIONS[summary]]).find())
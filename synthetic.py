@@ -0,0 +1,196 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Synthetic Data
+#
+# Realistic CLA_Games, CLA_Players and CLA_Scrims documents for benchmarks
+# and local testing, with the field shapes app.py reads
+# =============================================================================
+
+import argparse
+import os
+import random
+from datetime import date, datetime, timedelta
+
+from bson import ObjectId, json_util
+
+from analytics import CALDYA_PLAYERS
+
+# Champion display names (CLA_Games) and Data Dragon ids (scrim SKIN)
+CHAMPIONS = {
+    "Aatrox": "Aatrox", "Ahri": "Ahri", "Akali": "Akali", "Ashe": "Ashe", "Azir": "Azir",
+    "Bard": "Bard", "Caitlyn": "Caitlyn", "Camille": "Camille", "Corki": "Corki",
+    "Ezreal": "Ezreal", "Gnar": "Gnar", "Gragas": "Gragas", "Jax": "Jax", "Jayce": "Jayce",
+    "Jinx": "Jinx", "Kai'Sa": "Kaisa", "Kalista": "Kalista", "Karma": "Karma",
+    "Kha'Zix": "Khazix", "K'Sante": "KSante", "Lee Sin": "LeeSin", "Leona": "Leona",
+    "Lucian": "Lucian", "Lulu": "Lulu", "Maokai": "Maokai", "Nautilus": "Nautilus",
+    "Nunu & Willump": "Nunu", "Orianna": "Orianna", "Poppy": "Poppy", "Rakan": "Rakan",
+    "Rell": "Rell", "Renekton": "Renekton", "Rumble": "Rumble", "Sejuani": "Sejuani",
+    "Syndra": "Syndra", "Taliyah": "Taliyah", "Thresh": "Thresh", "Varus": "Varus",
+    "Vi": "Vi", "Viego": "Viego", "Wukong": "MonkeyKing", "Xayah": "Xayah",
+    "Xin Zhao": "XinZhao", "Yone": "Yone", "Zeri": "Zeri"
+}
+
+POSITIONS = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+
+OPPONENTS = [f"Team {name}" for name in (
+    "Aurora", "Basilisk", "Cyclone", "Drakkar", "Ember", "Falcon", "Granite", "Helix",
+    "Ion", "Jade", "Kraken", "Lumen"
+)]
+
+ITEMS = [1001, 1055, 3006, 3031, 3046, 3071, 3078, 3094, 3153, 3157, 3363, 3364, 6672, 6692]
+
+
+def _object_id(day, sequence):
+    """ObjectId timestamped on the document's day, ordered by sequence"""
+    timestamp = ObjectId.from_datetime(datetime.combine(day, datetime.min.time())).binary[:4]
+    return ObjectId(timestamp + sequence.to_bytes(8, "big"))
+
+
+def _objectives(rng, won):
+    def objective(kills_range, first_chance):
+        return {"kills": rng.randint(*kills_range), "first": rng.random() < first_chance}
+    edge = 0.65 if won else 0.35
+    return {"objectives": {
+        "dragon": objective((0, 4), edge),
+        "baron": objective((0, 2), edge),
+        "riftHerald": objective((0, 2), edge),
+        "tower": objective((0, 11), edge)
+    }}
+
+
+def generate_games(count, seed=0, start=date(2023, 1, 1)):
+    """Official games, oldest first, three per day"""
+    rng = random.Random(seed)
+    roster = list(CALDYA_PLAYERS)
+    names = list(CHAMPIONS)
+    for index in range(count):
+        side = rng.choice(["blue", "red"])
+        caldya_id = 100 if side == "blue" else 200
+        won = rng.random() < 0.55
+        opponent = rng.choice(OPPONENTS)
+        opponent_roster = [f"{opponent.split()[-1][:3].upper()} Player{slot}" for slot in range(5)]
+        picks = rng.sample(names, 10)
+        day = start + timedelta(days=index // 3)
+
+        final_items, player_data, positions = {}, {}, {}
+        for slot, player in enumerate(roster + opponent_roster):
+            ally = slot < 5
+            final_items[player] = {
+                "champion": picks[slot],
+                "team_id": caldya_id if ally else 300 - caldya_id,
+                "items": rng.sample(ITEMS, 6),
+                "trinket": rng.choice([3340, 3363, 3364])
+            }
+            kills, deaths, assists = rng.randint(0, 12), rng.randint(0, 9), rng.randint(0, 18)
+            player_data[player] = {
+                "kda": f"{kills}/{deaths}/{assists}",
+                "gold_15min": rng.randint(3500, 7500),
+                "cs_15min": rng.randint(10, 150),
+                "gold_diff_15min": rng.randint(-1500, 1500),
+                "cs_diff_15min": rng.randint(-30, 30)
+            }
+            positions[player] = POSITIONS[slot % 5]
+
+        yield {
+            "_id": _object_id(day, index),
+            "date": day.isoformat(),
+            "opponent_team": {"name": opponent},
+            "win": won,
+            "Caldya_side": side,
+            "Caldya_id": caldya_id,
+            "game_duration": f"{rng.randint(22, 42)}:{rng.randint(0, 59):02d}",
+            "final_items": final_items,
+            "player_data": player_data,
+            "player_positions": positions,
+            "objectives": {
+                "blue_team": _objectives(rng, won == (side == "blue")),
+                "red_team": _objectives(rng, won == (side == "red"))
+            }
+        }
+
+
+def generate_players(seed=0):
+    """CLA_Players averages for the roster"""
+    rng = random.Random(seed)
+    players = []
+    for name in CALDYA_PLAYERS:
+        kills, deaths, assists = rng.uniform(1, 6), rng.uniform(1, 4), rng.uniform(3, 10)
+        players.append({
+            "name": name,
+            "games_played": rng.randint(20, 200),
+            "avg_player_data": {
+                "gold_15min": rng.uniform(4500, 6500),
+                "cs_15min": rng.uniform(20, 130),
+                "gold_diff_15min": rng.uniform(-400, 600),
+                "cs_diff_15min": rng.uniform(-10, 15),
+                "kda_kills": kills,
+                "kda_deaths": deaths,
+                "kda_assists": assists,
+                "kda_ratio": (kills + assists) / deaths,
+                "kda": f"{kills:.1f}/{deaths:.1f}/{assists:.1f}"
+            },
+            "avg_control_wards": rng.uniform(1, 6),
+            "avg_challenges": {
+                "vision_score": rng.uniform(15, 90),
+                "damage_per_minute": rng.uniform(250, 900)
+            }
+        })
+    return players
+
+
+def generate_scrims(count, seed=0, start=date(2023, 1, 1)):
+    """Scrim replay exports, oldest first, six per day, with the participant fields of the replay files"""
+    rng = random.Random(seed)
+    ids = list(CHAMPIONS.values())
+    for index in range(count):
+        our_team = rng.choice([100, 200])
+        won = rng.random() < 0.5
+        picks = rng.sample(ids, 10)
+        day = start + timedelta(days=index // 6)
+        participants = []
+        for slot in range(10):
+            ours = slot < 5
+            name = list(CALDYA_PLAYERS)[slot] if ours else f"Guest{slot - 5}"
+            participants.append({
+                "RIOT_ID_GAME_NAME": f"CLA {name}" if ours else f"ENM {name}",
+                "SKIN": picks[slot],
+                "WIN": "Win" if won == ours else "Fail",
+                "TEAM": our_team if ours else 300 - our_team,
+                "TEAM_POSITION": POSITIONS[slot % 5],
+                "CHAMPIONS_KILLED": str(rng.randint(0, 12)),
+                "NUM_DEATHS": str(rng.randint(0, 9)),
+                "ASSISTS": str(rng.randint(0, 18)),
+                "GOLD_EARNED": str(rng.randint(7000, 18000)),
+                "MINIONS_KILLED": str(rng.randint(20, 320)),
+                "TOTAL_DAMAGE_DEALT_TO_CHAMPIONS": str(rng.randint(3000, 45000)),
+                "VISION_SCORE": str(rng.randint(5, 90))
+            })
+        yield {
+            "_id": _object_id(day, index),
+            "gameLength": rng.randint(1300, 2500) * 1000,
+            "participants": participants
+        }
+
+
+def write_jsonl(path, documents):
+    with open(path, "w", encoding="utf-8") as f:
+        for document in documents:
+            f.write(json_util.dumps(document))
+            f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic CALDYA data as JSON-lines files")
+    parser.add_argument("out", help="Output directory")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--scrims", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    write_jsonl(os.path.join(args.out, "games.jsonl"), generate_games(args.games, args.seed))
+    write_jsonl(os.path.join(args.out, "players.jsonl"), generate_players(args.seed))
+    write_jsonl(os.path.join(args.out, "scrims.jsonl"), generate_scrims(args.scrims, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Table Cache
+#
+# Parquet copies of the normalized game and scrim tables, tagged with the
+# data version they were built from, so a restarted process can skip the
+# full pull from MongoDB
+# =============================================================================
+
+import json
+import os
+import threading
+
+import pandas as pd
+
+DEFAULT_CACHE_DIR = ".table_cache"
+
+
+def _normalize_version(version):
+    """JSON round trip, so stored and live versions compare equal (tuples become lists)"""
+    return json.loads(json.dumps(version))
+
+
+class TableCache:
+    """One folder of Parquet files per named group of DataFrames
+
+    get() answers only when the stored version matches the live one, read
+    with memory mapping. put() writes in a background thread, so the rerun
+    that rebuilt the tables never waits on the disk; the version file is
+    written last and removed first, so a half-written group is never served.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._write_threads = {}
+
+    def get(self, name, version):
+        """Stored tables of a group when they were built from this version, else None"""
+        with self._lock:
+            try:
+                meta = self._read_meta(name)
+                if meta is None or meta["version"] != _normalize_version(version):
+                    return None
+                return tuple(
+                    pd.read_parquet(self._path(name, f"{index}.parquet"), memory_map=True)
+                    for index in range(meta["tables"])
+                )
+            except (OSError, ValueError, KeyError):
+                return None
+
+    def put(self, name, version, tables):
+        """Write a group of tables and the version they were built from"""
+        with self._lock:
+            os.makedirs(self._path(name), exist_ok=True)
+            meta_path = self._path(name, "version.json")
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            for index, table in enumerate(tables):
+                path = self._path(name, f"{index}.parquet")
+                table.to_parquet(f"{path}.tmp", index=False)
+                os.replace(f"{path}.tmp", path)
+            with open(f"{meta_path}.tmp", "w", encoding="utf-8") as f:
+                json.dump({"version": _normalize_version(version), "tables": len(tables)}, f)
+            os.replace(f"{meta_path}.tmp", meta_path)
+
+    def put_in_background(self, name, version, tables):
+        """Start writing a group unless a write of the same group is already running"""
+        thread = self._write_threads.get(name)
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(target=self._put_quietly, args=(name, version, tables), daemon=True)
+        self._write_threads[name] = thread
+        thread.start()
+
+    def _put_quietly(self, name, version, tables):
+        try:
+            self.put(name, version, tables)
+        except (OSError, ValueError):
+            pass
+
+    def _path(self, name, filename=None):
+        if filename is None:
+            return os.path.join(self.cache_dir, name)
+        return os.path.join(self.cache_dir, name, filename)
+
+    def _read_meta(self, name):
+        meta_path = self._path(name, "version.json")
+        if not os.path.isfile(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
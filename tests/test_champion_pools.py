@@ -0,0 +1,66 @@
+# =============================================================================
+# Parity between the in-Python and server-side Champion Analysis records
+#
+# Runs against mongomock, or a real deployment when MONGODB_TEST_URI is set
+# (the test database is dropped first)
+# =============================================================================
+
+import os
+
+import pytest
+
+from analytics import CALDYA_PLAYERS, build_participant_facts, champion_pools, champion_pools_from_groups
+from store import aggregate_champion_pools, create_client, get_projection
+from synthetic import generate_games
+
+TEST_DATABASE = "CALDYA_test"
+
+
+@pytest.fixture
+def games_collection():
+    uri = os.environ.get("MONGODB_TEST_URI")
+    if uri:
+        client = create_client(uri, {"read_preference": "primary"})
+        client.drop_database(TEST_DATABASE)
+        yield client[TEST_DATABASE].CLA_Games
+        client.drop_database(TEST_DATABASE)
+        client.close()
+    else:
+        mongomock = pytest.importorskip("mongomock")
+        yield mongomock.MongoClient()[TEST_DATABASE].CLA_Games
+
+
+def by_name_on_ties(pool):
+    """Records in the server path's order (the Python path keeps first-seen order on ties)"""
+    return sorted(pool, key=lambda record: (-record["games"], -record["win_rate"], record["champion"]))
+
+
+@pytest.mark.parametrize("count", [1, 60, 300])
+def test_server_pools_match_python_pools(games_collection, count):
+    games_collection.insert_many(generate_games(count, seed=count))
+    games = list(games_collection.find({}, get_projection("CLA_Games", "tables")))
+
+    role_pools, opponent_pool = champion_pools(build_participant_facts(games))
+    server_role_pools, server_opponent_pool = champion_pools_from_groups(
+        aggregate_champion_pools(games_collection, CALDYA_PLAYERS)
+    )
+
+    assert set(server_role_pools) == set(role_pools)
+    for role, pool in role_pools.items():
+        assert server_role_pools[role] == by_name_on_ties(pool), role
+    assert server_opponent_pool == by_name_on_ties(opponent_pool)
+
+
+def test_server_pools_skip_games_without_final_items(games_collection):
+    games = list(generate_games(10))
+    games[0]["final_items"] = None
+    del games[1]["final_items"]
+    games_collection.insert_many(games)
+
+    role_pools, opponent_pool = champion_pools(build_participant_facts(games_collection.find()))
+    server_role_pools, server_opponent_pool = champion_pools_from_groups(
+        aggregate_champion_pools(games_collection, CALDYA_PLAYERS)
+    )
+
+    assert {role: by_name_on_ties(pool) for role, pool in role_pools.items()} == server_role_pools
+    assert by_name_on_ties(opponent_pool) == server_opponent_pool
@@ -0,0 +1,184 @@
+# =============================================================================
+# Data Dragon mirror and champion resolver, offline against a temp cache_dir
+# =============================================================================
+
+import json
+import os
+
+import pytest
+import requests
+
+from ddragon import ChampionResolver, DataDragonMirror
+
+CHAMPIONS = {
+    key: {"id": key, "name": name}
+    for key, name in {
+        "Ahri": "Ahri",
+        "Belveth": "Bel'Veth",
+        "Chogath": "Cho'Gath",
+        "DrMundo": "Dr. Mundo",
+        "Kaisa": "Kai'Sa",
+        "LeeSin": "Lee Sin",
+        "Leblanc": "LeBlanc",
+        "MonkeyKing": "Wukong",
+        "Nunu": "Nunu & Willump",
+        "Renata": "Renata Glasc",
+        "Vi": "Vi",
+        "Viktor": "Viktor"
+    }.items()
+}
+
+
+def seed(cache_dir, version, champions=CHAMPIONS):
+    os.makedirs(os.path.join(cache_dir, version))
+    with open(os.path.join(cache_dir, version, "champion.json"), "w", encoding="utf-8") as f:
+        json.dump({"data": champions}, f)
+
+
+class OfflineSession:
+    """A requests session whose every call fails as if the CDN were unreachable"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        raise requests.ConnectionError(f"unreachable: {url}")
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class CdnSession:
+    """A requests session answering versions.json and champion.json"""
+
+    def __init__(self, versions, champions):
+        self.versions = versions
+        self.champions = champions
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        if url.endswith("/api/versions.json"):
+            return FakeResponse(self.versions)
+        return FakeResponse({"data": self.champions})
+
+
+def test_offline_load_serves_newest_local_version(tmp_path):
+    for version in ("14.2.1", "14.10.1", "14.9.1"):
+        seed(str(tmp_path), version)
+    # A version folder without champion.json is not a complete mirror
+    os.makedirs(tmp_path / "15.1.1")
+    session = OfflineSession()
+
+    champions, version = DataDragonMirror(str(tmp_path), session=session, offline=True).load()
+
+    assert version == "14.10.1"
+    assert champions == CHAMPIONS
+    assert session.calls == 0
+
+
+def test_offline_load_without_mirror_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DataDragonMirror(str(tmp_path / "missing"), session=OfflineSession(), offline=True).load()
+
+
+def test_refresh_falls_back_to_local_version_when_cdn_unreachable(tmp_path):
+    seed(str(tmp_path), "14.1.1")
+    seed(str(tmp_path), "14.3.1")
+    session = OfflineSession()
+
+    assert DataDragonMirror(str(tmp_path), session=session).refresh() == "14.3.1"
+    assert session.calls == 1
+
+
+def test_cold_mirror_with_cdn_unreachable_raises(tmp_path):
+    with pytest.raises(requests.RequestException):
+        DataDragonMirror(str(tmp_path), session=OfflineSession()).load()
+
+
+def test_cold_mirror_downloads_then_serves_offline(tmp_path):
+    session = CdnSession(["14.5.1", "14.4.1"], CHAMPIONS)
+
+    champions, version = DataDragonMirror(str(tmp_path), session=session).load()
+    assert (champions, version) == (CHAMPIONS, "14.5.1")
+    assert len(session.urls) == 2
+
+    assert DataDragonMirror(str(tmp_path), session=OfflineSession(), offline=True).load() == (CHAMPIONS, "14.5.1")
+
+
+def test_resolver_is_built_once_per_version(tmp_path):
+    seed(str(tmp_path), "14.1.1")
+    mirror = DataDragonMirror(str(tmp_path), session=OfflineSession(), offline=True)
+    assert mirror.resolver("14.1.1") is mirror.resolver("14.1.1")
+
+
+def legacy_champion_mapping(champion_data):
+    """The lookup table the dashboard built before ChampionResolver"""
+    champ_mapping = {}
+    for key, data in champion_data.items():
+        champ_name = data["name"]
+        champ_mapping[champ_name.lower()] = key
+        champ_mapping[champ_name.lower().replace(" ", "")] = key
+        champ_mapping[champ_name.lower().replace("'", "")] = key
+        champ_mapping[champ_name.lower().replace(" ", "").replace("'", "")] = key
+        if champ_name == "Wukong":
+            champ_mapping["monkeyking"] = key
+        elif champ_name == "Nunu & Willump":
+            champ_mapping["nunu"] = key
+    return champ_mapping
+
+
+def legacy_find_champion_key(champion_name, champion_data, champ_mapping):
+    """The per-call lookup ChampionResolver replaced"""
+    if not champion_name:
+        return None
+    champ_key = next((k for k, v in champion_data.items() if v["name"] == champion_name), None)
+    if champ_key:
+        return champ_key
+    normalized_name = champion_name.lower().replace(" ", "").replace("'", "")
+    if normalized_name in champ_mapping:
+        return champ_mapping[normalized_name]
+    for key, data in champion_data.items():
+        if champion_name.lower() in data["name"].lower() or data["name"].lower() in champion_name.lower():
+            return key
+    if champion_name in champion_data:
+        return champion_name
+    return None
+
+
+NAMES = (
+    [data["name"] for data in CHAMPIONS.values()]
+    + list(CHAMPIONS)
+    + ["MonkeyKing", "monkeyking", "Nunu", "nunu", "Kai'sa", "kaisa", "KAISA", "lee sin", "LeeSin",
+       "dr.mundo", "Dr Mundo", "chogath", "Cho Gath", "belveth", "leblanc", "Renata", "vi", "viktor",
+       "Kai", "Willump", "Nunu & Willump", "", None]
+)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_resolver_matches_legacy_lookup(name):
+    expected = legacy_find_champion_key(name, CHAMPIONS, legacy_champion_mapping(CHAMPIONS))
+    resolved = ChampionResolver(CHAMPIONS).resolve(name)
+    # The resolver only goes further where the old lookup found nothing
+    assert resolved == expected or (expected is None and resolved is not None)
+
+
+def test_resolver_normalizes_punctuation_the_legacy_lookup_missed():
+    assert legacy_find_champion_key("Dr Mundo", CHAMPIONS, legacy_champion_mapping(CHAMPIONS)) is None
+    assert ChampionResolver(CHAMPIONS).resolve("Dr Mundo") == "DrMundo"
+
+
+def test_resolver_memoizes_fuzzy_matches():
+    resolver = ChampionResolver(CHAMPIONS)
+    assert resolver.resolve("Kaiisa") == "Kaisa"
+    assert resolver.resolved["Kaiisa"] == "Kaisa"
+    assert resolver.resolve("Teemo") is None
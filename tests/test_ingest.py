@@ -0,0 +1,115 @@
+# =============================================================================
+# Streaming export reader, scrim validation and scrim content hashes
+# =============================================================================
+
+import io
+import json
+
+import pytest
+from bson import ObjectId, json_util
+
+from ingest import InvalidDocument, iter_json_values, validate_scrim
+from store import insert_scrims, scrim_content_hash
+from synthetic import generate_scrims
+
+DOCUMENTS = [
+    {"n": 1, "big": 1234567890123, "ratio": -0.125, "text": "a, b ] } \" \\n", "nested": {"list": [1, [2, 3], {}]}},
+    {"n": 2, "empty": [], "flag": True, "none": None, "unicode": "é€😀"},
+    {"n": 3, "date": {"$date": "2024-05-01T12:00:00Z"}, "oid": {"$oid": "0123456789abcdef01234567"}}
+]
+
+EXPECTED = json_util.loads(json.dumps(DOCUMENTS))
+
+# Down to one character per read, so every value is cut at every position
+CHUNK_SIZES = [1, 2, 3, 7, 64, 1 << 20]
+
+
+def decode(text, chunk_size):
+    return list(iter_json_values(io.StringIO(text), chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_array(chunk_size):
+    assert decode(json.dumps(DOCUMENTS), chunk_size) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_pretty_printed_array(chunk_size):
+    assert decode("\r\n  " + json.dumps(DOCUMENTS, indent=4) + "\n\n", chunk_size) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_json_lines(chunk_size):
+    text = "\n".join(json.dumps(document) for document in DOCUMENTS)
+    assert decode(text, chunk_size) == EXPECTED
+    assert decode(text + "\n", chunk_size) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_concatenated_values(chunk_size):
+    assert decode("".join(json.dumps(document) for document in DOCUMENTS), chunk_size) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_numbers_split_across_reads(chunk_size):
+    assert decode("[12345, -6.25e3, 0]", chunk_size) == [12345, -6250.0, 0]
+    assert decode("12345\n678\n9", chunk_size) == [12345, 678, 9]
+
+
+@pytest.mark.parametrize("text", ["", "   \n", "[]", "[ \n ]"])
+def test_empty_input(text):
+    assert decode(text, 2) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1 << 20])
+def test_truncated_input_raises(chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        decode(json.dumps(DOCUMENTS)[:-10], chunk_size)
+
+
+def participant(**overrides):
+    return {"RIOT_ID_GAME_NAME": "Player", "SKIN": "Ahri", "WIN": "Win", "TEAM": 100, **overrides}
+
+
+@pytest.mark.parametrize("scrim, reason", [
+    ([], "not a JSON object"),
+    ({}, "no participants"),
+    ({"participants": []}, "no participants"),
+    ({"participants": {"RIOT_ID_GAME_NAME": "Player"}}, "no participants"),
+    ({"participants": ["Player"]}, "participant without RIOT_ID_GAME_NAME"),
+    ({"participants": [participant(), {"SKIN": "Ahri", "WIN": "Win", "TEAM": 200}]},
+     "participant without RIOT_ID_GAME_NAME"),
+    ({"participants": [{key: value for key, value in participant().items() if key != "TEAM"}]},
+     "participant without TEAM")
+])
+def test_validate_scrim_rejects(scrim, reason):
+    with pytest.raises(InvalidDocument, match=reason):
+        validate_scrim(scrim)
+
+
+def test_validate_scrim_accepts_null_values():
+    scrim = {"participants": [participant(SKIN=None, WIN="Fail")]}
+    assert validate_scrim(scrim) is scrim
+
+
+def test_scrim_hash_ignores_id_and_stored_hash():
+    scrim = next(generate_scrims(1))
+    content = {key: value for key, value in scrim.items() if key != "_id"}
+    assert scrim_content_hash(scrim) == scrim_content_hash(content)
+    assert scrim_content_hash({**content, "_id": ObjectId(), "content_hash": "x"}) == scrim_content_hash(content)
+
+
+def test_scrim_hash_stable_after_database_round_trip():
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient().CALDYA_test.CLA_Scrims
+    line = json_util.dumps(next(generate_scrims(1)))
+    fresh = next(iter_json_values(io.StringIO(line)))
+
+    assert insert_scrims(collection, [fresh]) == (1, 0, 0)
+    stored = collection.find_one()
+    assert stored["content_hash"] == scrim_content_hash(stored) == scrim_content_hash(fresh)
+
+    # The same export imported again is recognised as a duplicate
+    again = next(iter_json_values(io.StringIO(line)))
+    assert insert_scrims(collection, [again]) == (0, 1, 0)
+    assert collection.count_documents({}) == 1
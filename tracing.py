@@ -0,0 +1,161 @@
+# =============================================================================
+# CALDYA Analytics Dashboard - Tracing
+#
+# Wall-clock spans recorded during one script run, for the admin performance
+# panel and the optional JSON-lines trace log
+# =============================================================================
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Trace of the script run executing in the current thread
+_current_trace = ContextVar("caldya_trace", default=None)
+
+
+class Trace:
+    """Spans of one rerun, nested by call stack (per thread)
+
+    Spans come from three places: traced() loaders, span() blocks and
+    sections, which split the page into consecutive render phases without
+    re-indenting it (starting a section ends the previous one).
+    """
+
+    def __init__(self, label=""):
+        self.label = label
+        self.started_at = time.time()
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._finished = None
+        self._section = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def begin(self, name, category):
+        stack = self._stack()
+        span = {
+            "name": name,
+            "category": category,
+            "depth": len(stack),
+            "parent": stack[-1]["index"] if stack else None,
+            "start": time.perf_counter() - self._origin,
+            "duration": None
+        }
+        with self._lock:
+            span["index"] = len(self.spans)
+            self.spans.append(span)
+        stack.append(span)
+        return span
+
+    def end(self, span):
+        span["duration"] = time.perf_counter() - self._origin - span["start"]
+        stack = self._stack()
+        if span in stack:
+            del stack[stack.index(span):]
+
+    def section(self, name):
+        """End the current render section and start the next one"""
+        if self._section is not None:
+            self.end(self._section)
+        self._section = self.begin(name, "render")
+
+    def finish(self):
+        """Close the last section and freeze the total"""
+        if self._finished is None:
+            if self._section is not None:
+                self.end(self._section)
+                self._section = None
+            self._finished = time.perf_counter() - self._origin
+        return self._finished
+
+    @property
+    def total(self):
+        return self._finished if self._finished is not None else time.perf_counter() - self._origin
+
+    def self_time_by_category(self):
+        """Seconds per category, excluding time spent in nested spans"""
+        self_times = {span["index"]: span["duration"] or 0 for span in self.spans}
+        for span in self.spans:
+            if span["parent"] is not None:
+                self_times[span["parent"]] -= span["duration"] or 0
+        totals = {}
+        for span in self.spans:
+            totals[span["category"]] = totals.get(span["category"], 0) + self_times[span["index"]]
+        return totals
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "total": self.total,
+            "spans": [dict(span) for span in self.spans]
+        }
+
+    def write_jsonl(self, path):
+        """Append this trace as one JSON line"""
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.to_dict()))
+            f.write("\n")
+
+
+def start_trace(label=""):
+    """Start recording spans for the current script run"""
+    trace = Trace(label)
+    _current_trace.set(trace)
+    return trace
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+def finish_trace():
+    """Finish the current run's trace and detach it
+
+    Fragment reruns execute outside the script run that started the trace,
+    so their spans are not recorded into an already finished trace.
+    """
+    trace = _current_trace.get()
+    _current_trace.set(None)
+    if trace is not None:
+        trace.finish()
+    return trace
+
+
+@contextmanager
+def span(name, category="compute"):
+    """Time a block in the current trace; a no-op outside a traced run"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    record = trace.begin(name, category)
+    try:
+        yield
+    finally:
+        trace.end(record)
+
+
+def traced(name=None, category="data"):
+    """Decorator recording a span per call (cache hits included)"""
+    def decorator(function):
+        span_name = name or function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return function(*args, **kwargs)
+
+        # Keep st.cache_data's clear() reachable through the wrapper
+        if hasattr(function, "clear"):
+            wrapper.clear = function.clear
+        return wrapper
+    return decorator